@@ -0,0 +1,217 @@
+import copy
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+class TokenCache:
+    """
+    Process-local LRU cache of token keys to their user (with the
+    profile and position attached) and expiry date. Entries are dropped
+    after max_age seconds and the least recently used entry is dropped
+    once max_size is exceeded.
+
+    Every user has a version, which is kept in the default cache of
+    Django and stored with the entries of the user. Invalidations
+    remove the affected entries of the current process and replace the
+    version of the user, so that every process sharing that cache
+    backend drops the entries of that user (only) on the next access.
+
+    Example:
+    ```python
+    token_cache = TokenCache(max_size=10000, max_age=300)
+    version = token_cache.get_version(user.pk)  # Before loading the user
+    token_cache.set(token.key, user, expires_at=None, version=version)
+    user, expires_at = token_cache.get(token.key)
+    ```
+    """
+
+    version_key = 'token-cache:user:{}'
+
+    def __init__(self, max_size, max_age):
+        self.max_size = max_size
+        self.max_age = max_age
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get_version(self, user_id):
+        """
+        Returns the current version of the cached tokens of the user.
+        """
+
+        return cache.get_or_set(
+            self.version_key.format(user_id), new_version, timeout=None
+        )
+
+    def get(self, key):
+        """
+        Returns the (user, expires_at) of the token key or None.
+        """
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            user, expires_at, version, cached_at = entry
+            if time.monotonic() - cached_at > self.max_age:
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+        if self.get_version(user.pk) != version:
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+            return None
+
+        return user, expires_at
+
+    def set(self, key, user, expires_at, version):
+        """
+        Caches the user and expiry date of the token key under the
+        version of the user, which has to be read (get_version) before
+        the user got loaded. A user loaded after an invalidation with
+        an older version is then dropped on the next access.
+        """
+
+        with self._lock:
+            self._entries[key] = (user, expires_at, version, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def bump_versions(self, user_ids):
+        """
+        Makes all processes drop the cached tokens of the users.
+        """
+
+        cache.set_many(
+            {
+                self.version_key.format(user_id): new_version()
+                for user_id in user_ids
+            }, timeout=None
+        )
+
+    def invalidate_users(self, user_ids):
+        """
+        Drops all token keys of the users.
+        """
+
+        user_ids = set(user_ids)
+        with self._lock:
+            keys = [
+                key for key, (user, *_) in self._entries.items()
+                if user.pk in user_ids
+            ]
+            for key in keys:
+                del self._entries[key]
+        self.bump_versions(user_ids)
+
+    def clear(self):
+        """
+        Drops all token keys.
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+def new_version():
+    """
+    Returns a new, unique version of the cached tokens of a user.
+    """
+
+    return uuid.uuid4().hex
+
+
+token_cache = TokenCache(
+    max_size=getattr(settings, 'TOKEN_CACHE_SIZE', 10000),
+    max_age=getattr(settings, 'TOKEN_CACHE_TTL', 300)
+)
+
+
+def get_token_expiry():
+    """
+    Returns the lifetime of a token (timedelta) or None, when tokens
+    don't expire.
+    """
+
+    expiry = getattr(settings, 'TOKEN_EXPIRY', None)
+    if expiry is not None and not isinstance(expiry, timezone.timedelta):
+        expiry = timezone.timedelta(seconds=expiry)
+
+    return expiry
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Drop-in replacement of the TokenAuthentication, which caches the
+    user together with its profile and position by token key (see
+    TokenCache), so that a warm request is authenticated without any
+    query.
+
+    The cached entries get invalidated when the token gets deleted, the
+    user (or its profile) gets saved or deleted or the position of the
+    profile gets saved (see api.signals).
+    Tokens expire after settings.TOKEN_EXPIRY (timedelta or seconds),
+    when set.
+    """
+
+    def authenticate_credentials(self, key):
+        """
+        Returns the (user, token key) of the token key.
+        """
+
+        entry = token_cache.get(key)
+        if entry is None:
+            entry = self.load_credentials(key)
+
+        user, expires_at = entry
+        if expires_at is not None and expires_at <= timezone.now():
+            raise exceptions.AuthenticationFailed('Token has expired.')
+
+        # Every request gets its own copy of the cached user, profile
+        # and position
+        return copy.deepcopy(user), key
+
+    def load_credentials(self, key):
+        """
+        Loads the token together with its user, profile and position
+        and caches them. The version of the user is read in between
+        looking up the user id and loading the user, so that changes
+        committed meanwhile invalidate the cached entry.
+        """
+
+        model = self.get_model()
+        user_id = model.objects.filter(key=key).values_list(
+            'user_id', flat=True
+        ).first()
+        if user_id is None:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+        version = token_cache.get_version(user_id)
+
+        try:
+            token = model.objects.select_related(
+                'user__profile__position'
+            ).get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed('Invalid token.')
+
+        if not token.user.is_active:
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+
+        expiry = get_token_expiry()
+        expires_at = token.created + expiry if expiry is not None else None
+
+        token_cache.set(key, token.user, expires_at, version)
+
+        return token.user, expires_at
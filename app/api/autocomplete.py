@@ -0,0 +1,161 @@
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connections
+from django.db.models import (
+    Case, F, FloatField, IntegerField, Q, Value, When
+)
+from django.db.models.functions import Greatest
+from api import models
+
+
+# Trigrams need 3 characters, shorter terms only match prefixes
+MIN_TRIGRAM_LENGTH = 3
+
+# Trigram indexes of the searched columns. The indexed expression is
+# the one Django compares for icontains/istartswith on PostgreSQL
+# (UPPER("column"::text) LIKE UPPER(...)), so the planner can use them.
+TRIGRAM_INDEXES = [
+    ('user_email_trgm_idx', 'api_customuser', 'email'),
+    ('profile_first_name_trgm_idx', 'api_userprofile', 'first_name'),
+    ('profile_last_name_trgm_idx', 'api_userprofile', 'last_name'),
+]
+
+# B-tree indexes of the same expressions, which serve the prefix
+# matches (UPPER(...) LIKE 'TERM%') of terms too short for trigrams
+PREFIX_INDEXES = [
+    ('user_email_prefix_idx', 'api_customuser', 'email'),
+    ('profile_first_name_prefix_idx', 'api_userprofile', 'first_name'),
+    ('profile_last_name_prefix_idx', 'api_userprofile', 'last_name'),
+]
+
+
+def install(apps, schema_editor):
+    """
+    Creates the trigram (pg_trgm) GIN indexes of the user email and
+    profile names on PostgreSQL.
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX {name} ON {table} '
+            f'USING gin ((UPPER({column}::text)) gin_trgm_ops)'
+        )
+
+
+def uninstall(apps, schema_editor):
+    """
+    Removes the trigram indexes.
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def install_prefix_indexes(apps, schema_editor):
+    """
+    Creates the prefix (text_pattern_ops) B-tree indexes of the user
+    email and profile names on PostgreSQL.
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, table, column in PREFIX_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX {name} ON {table} '
+            f'USING btree ((UPPER({column}::text)) text_pattern_ops)'
+        )
+
+
+def uninstall_prefix_indexes(apps, schema_editor):
+    """
+    Removes the prefix indexes.
+    """
+
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for name, table, column in PREFIX_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def get_matching_ids(queryset, term):
+    """
+    Returns the ids of the users whose email, first name or last name
+    contains the term (starts with it for terms shorter than
+    MIN_TRIGRAM_LENGTH), as a UNION of one subquery per table, so that
+    each can use the indexes of its columns.
+    """
+
+    lookup = 'icontains' if len(term) >= MIN_TRIGRAM_LENGTH \
+        else 'istartswith'
+
+    users = queryset.model._default_manager.filter(
+        **{f'email__{lookup}': term}
+    ).values('pk')
+    profiles = models.UserProfile.objects.filter(
+        Q(**{f'first_name__{lookup}': term}) |
+        Q(**{f'last_name__{lookup}': term})
+    ).values('owner_id')
+
+    return users.union(profiles)
+
+
+def get_autocomplete_queryset(queryset, term):
+    """
+    Returns the users (id, email, first_name, last_name and position)
+    whose email, first name or last name contains the term, best
+    matches first.
+    The matching ids are collected with indexed subqueries (see
+    get_matching_ids), only the matches are joined with their profile
+    and position and ranked.
+
+    Prefix matches rank first, followed by the trigram similarity of
+    the best matching column on PostgreSQL. Terms shorter than
+    MIN_TRIGRAM_LENGTH only match prefixes.
+    """
+
+    columns = ['email', 'profile__first_name', 'profile__last_name']
+
+    prefix_matches = Q()
+    for column in columns:
+        prefix_matches |= Q(**{f'{column}__istartswith': term})
+
+    prefix_rank = Case(
+        When(prefix_matches, then=Value(1)),
+        default=Value(0),
+        output_field=IntegerField()
+    )
+    if connections[queryset.db].vendor == 'postgresql':
+        similarity = Greatest(*[
+            TrigramSimilarity(column, term) for column in columns
+        ])
+    else:
+        similarity = Value(0.0, output_field=FloatField())
+
+    return queryset.filter(
+        pk__in=get_matching_ids(queryset, term)
+    ).annotate(
+        prefix_rank=prefix_rank, similarity=similarity
+    ).order_by(
+        '-prefix_rank', '-similarity', 'email'
+    ).values(
+        'id', 'email',
+        first_name=F('profile__first_name'),
+        last_name=F('profile__last_name'),
+        position=F('profile__position__title'),
+    )
+
+
+def autocomplete_users(queryset, term, limit):
+    """
+    Returns up to limit users of get_autocomplete_queryset() with a
+    single query.
+    """
+
+    return list(get_autocomplete_queryset(queryset, term)[:limit])
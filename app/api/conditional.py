@@ -0,0 +1,229 @@
+import hashlib
+from django.db.models import prefetch_related_objects
+from django.utils.cache import get_conditional_response, \
+    patch_vary_headers
+from django.utils.http import http_date
+from rest_framework import response
+from rest_framework.generics import get_object_or_404
+from api import reference_cache
+
+
+def make_etag(versions):
+    """
+    Returns a strong ETag of the versions of the presented instances
+    and of the cached reference data (category, priority, status and
+    position slugs), which is part of their representation.
+    """
+
+    reference_versions = [
+        cache.get_version()
+        for cache in reference_cache.reference_caches.values()
+    ]
+    digest = hashlib.sha1(
+        repr((reference_versions, versions)).encode()
+    ).hexdigest()
+
+    return f'"{digest}"'
+
+
+class ConditionalGetMixin:
+    """
+    Answers conditional requests (If-None-Match, If-Modified-Since)
+    of the retrieve and list actions with 304 Not Modified before the
+    instances are serialized. Prefetches of the queryset are deferred
+    until the request turned out to be modified, so an unmodified
+    request only costs the query of the instances themselves.
+
+    Views implement get_version(instance), which returns the version
+    (any comparable value changing with the representation) and the
+    last modification of an instance.
+
+    Example:
+    ```python
+    def get_version(self, instance):
+        return (instance.pk, instance.version), instance.updated_at
+    ```
+
+    With a row_serializer_class (see api.row_serializers), the list
+    action presents values() rows through the compiled fast path of
+    the serializer instead of model instances.
+    """
+
+    row_serializer_class = None
+
+    def get_version(self, instance):
+        """
+        Returns the (version, last_modified) of the instance.
+        """
+        raise NotImplementedError
+
+    def get_row_serializer(self):
+        """
+        Returns the fast path of the serializer of the list action or
+        None when the view has none.
+        """
+
+        if self.row_serializer_class is None:
+            return None
+
+        return self.row_serializer_class(self.get_serializer())
+
+    def get_validators(self, instances, *extra_versions, get_version=None):
+        """
+        Returns the ETag and last modification of the instances.
+        """
+
+        get_version = get_version or self.get_version
+        versions = []
+        last_modified = None
+        for instance in instances:
+            version, modified = get_version(instance)
+            versions.append(version)
+            if modified is not None and \
+                    (last_modified is None or modified > last_modified):
+                last_modified = modified
+
+        return make_etag([versions, extra_versions]), last_modified
+
+    def get_fieldset(self, request):
+        """
+        Returns the sparse fieldset query parameters and the accepted
+        media type (JSON, MessagePack, ...), which change the
+        representation of the same instances.
+        """
+        return request.query_params.get('fields'), \
+            request.query_params.get('exclude'), \
+            getattr(request, 'accepted_media_type', None)
+
+    def get_not_modified_response(self, request, etag, last_modified):
+        """
+        Returns a 304 (or 412) response when the conditions of the
+        request headers apply, otherwise None.
+        """
+
+        timestamp = None
+        if last_modified is not None:
+            timestamp = int(last_modified.timestamp())
+
+        not_modified = get_conditional_response(
+            request, etag=etag, last_modified=timestamp
+        )
+        if not_modified is not None:
+            self.set_validators(not_modified, etag, last_modified)
+
+        return not_modified
+
+    def set_validators(self, http_response, etag, last_modified):
+        """
+        Sets the ETag and Last-Modified headers of the response.
+        """
+
+        http_response['ETag'] = etag
+        if last_modified is not None:
+            http_response['Last-Modified'] = http_date(
+                last_modified.timestamp()
+            )
+
+        return http_response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        """
+        Marks the responses as negotiated by the Accept header.
+        """
+
+        response = super().finalize_response(
+            request, response, *args, **kwargs
+        )
+        patch_vary_headers(response, ['Accept'])
+
+        return response
+
+    def get_queryset_without_prefetch(self):
+        """
+        Returns the filtered queryset without its prefetches together
+        with the prefetch lookups.
+        """
+
+        queryset = self.filter_queryset(self.get_queryset())
+        lookups = queryset._prefetch_related_lookups
+
+        return queryset.prefetch_related(None), lookups
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Retrieves a single instance, or answers with 304 Not Modified
+        when the instance did not change.
+        """
+
+        queryset, lookups = self.get_queryset_without_prefetch()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        instance = get_object_or_404(
+            queryset, **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        self.check_object_permissions(request, instance)
+
+        etag, last_modified = self.get_validators(
+            [instance], self.get_fieldset(request)
+        )
+        not_modified = self.get_not_modified_response(
+            request, etag, last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        prefetch_related_objects([instance], *lookups)
+        serializer = self.get_serializer(instance)
+
+        return self.set_validators(
+            response.Response(serializer.data), etag, last_modified
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        Retrieves a page of instances filtered and ordered by the
+        filter backends, or answers with 304 Not Modified when the
+        page did not change.
+        """
+
+        queryset, lookups = self.get_queryset_without_prefetch()
+        row_serializer = self.get_row_serializer()
+        get_version = None
+        if row_serializer is not None:
+            queryset = row_serializer.get_queryset(queryset)
+            get_version = row_serializer.get_version
+
+        page = self.paginate_queryset(queryset)
+
+        if page is None:
+            page = list(queryset)
+            etag, last_modified = self.get_validators(
+                page, self.get_fieldset(request), get_version=get_version
+            )
+        else:
+            # The links change when the neighbouring pages change
+            etag, last_modified = self.get_validators(
+                page,
+                self.paginator.get_next_link(),
+                self.paginator.get_previous_link(),
+                self.get_fieldset(request),
+                get_version=get_version
+            )
+
+        not_modified = self.get_not_modified_response(
+            request, etag, last_modified
+        )
+        if not_modified is not None:
+            return not_modified
+
+        if row_serializer is not None:
+            data = row_serializer.to_representation_many(page)
+        else:
+            prefetch_related_objects(page, *lookups)
+            data = self.get_serializer(page, many=True).data
+
+        if self.paginator is None:
+            list_response = response.Response(data)
+        else:
+            list_response = self.get_paginated_response(data)
+
+        return self.set_validators(list_response, etag, last_modified)
@@ -0,0 +1,129 @@
+import logging
+import time
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+from api import models, summary, sync
+from api.response_cache import task_lists
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_overdue_status():
+    """
+    Returns the status of overdue tasks (settings.OVERDUE_TASK_STATUS),
+    which is created when missing.
+    """
+
+    status, _ = models.Status.objects.get_or_create(
+        caption=getattr(settings, 'OVERDUE_TASK_STATUS', 'Overdue'),
+        defaults={
+            'description': 'Indicates that the due date of a task has '
+            'passed before it was completed.'
+        }
+    )
+    return status
+
+
+def sweep_chunk(status, now, chunk_size):
+    """
+    Moves up to chunk_size open tasks whose due date passed before now
+    to the status within one short transaction. Returns the ids of the
+    moved tasks.
+
+    Every task is swept once per due date, the sweep is recorded in
+    Task.overdue_at. A task moved back from the overdue status keeps
+    its status, until its due date is moved past the recorded sweep.
+
+    On PostgreSQL the tasks are locked with SKIP LOCKED, tasks being
+    changed by other transactions are left to the next sweep instead
+    of waiting for them.
+    """
+
+    with transaction.atomic():
+        task_ids = list(
+            models.Task.objects.filter(
+                Q(overdue_at__isnull=True) | Q(overdue_at__lt=F('due_date')),
+                completed_at__isnull=True, due_date__lt=now
+            ).exclude(
+                status=status
+            ).order_by(
+                'due_date'
+            ).select_for_update(
+                skip_locked=True
+            ).values_list('pk', flat=True)[:chunk_size]
+        )
+        if not task_ids:
+            return task_ids
+
+        with summary.tracking(task_ids):
+            models.Task.objects.filter(pk__in=task_ids).touch(
+                status=status, overdue_at=now
+            )
+        task_lists.invalidate_tasks(task_ids)
+
+    return task_ids
+
+
+def sweep_overdue_tasks(chunk_size=None):
+    """
+    Moves the open tasks whose due date has passed to the overdue
+    status with chunked UPDATE statements of at most chunk_size tasks
+    (settings.OVERDUE_SWEEP_CHUNK_SIZE). Every chunk is committed on
+    its own, so the row locks are held briefly. The run is recorded as
+    an OverdueSweep.
+
+    Scheduled by django-crontab (settings.CRONJOBS).
+    """
+
+    chunk_size = chunk_size or getattr(
+        settings, 'OVERDUE_SWEEP_CHUNK_SIZE', 1000
+    )
+    status = get_overdue_status()
+    started_at = timezone.now()
+    start = time.perf_counter()
+
+    swept = chunks = 0
+    while True:
+        task_ids = sweep_chunk(status, started_at, chunk_size)
+        if not task_ids:
+            break
+
+        swept += len(task_ids)
+        chunks += 1
+        if len(task_ids) < chunk_size:
+            break
+
+    sweep = models.OverdueSweep.objects.create(
+        started_at=started_at,
+        duration=timezone.timedelta(seconds=time.perf_counter() - start),
+        status=status,
+        swept=swept,
+        chunks=chunks
+    )
+    logger.info(
+        'Moved %d overdue tasks to %r in %d chunks (%.3fs)',
+        swept, status.caption, chunks, sweep.duration.total_seconds()
+    )
+
+    return sweep
+
+
+def purge_tombstones():
+    """
+    Deletes the tombstones of the delta sync which are older than
+    settings.SYNC_TOMBSTONE_RETENTION, tokens of that age are rejected
+    anyway (see api.sync.DeltaSyncMixin).
+
+    Scheduled by django-crontab (settings.CRONJOBS).
+    """
+
+    retention = sync.get_setting_duration(
+        'SYNC_TOMBSTONE_RETENTION', 30 * 24 * 3600
+    )
+    deleted = sync.purge(timezone.now() - retention)
+    logger.info('Purged %d tombstones', deleted)
+
+    return deleted
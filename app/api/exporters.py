@@ -0,0 +1,106 @@
+import csv
+from rest_framework.utils.encoders import JSONEncoder
+
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson',
+}
+
+
+class Echo:
+    """
+    File-like object which returns the written value instead of
+    storing it, so that the csv writer can be used as a generator.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_representations(queryset, serializer, chunk_size=2000):
+    """
+    Yields the representation of every instance of the queryset. The
+    instances are fetched chunk by chunk (server-side cursor where
+    supported), prefetches are done per chunk.
+    """
+
+    for instance in queryset.iterator(chunk_size=chunk_size):
+        yield serializer.to_representation(instance)
+
+
+def flatten(value):
+    """
+    Returns the value of a csv cell, lists (e.g. team member emails)
+    are joined with semicolons.
+    """
+
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ';'.join(str(item) for item in value)
+
+    return value
+
+
+def iter_csv(rows, fields):
+    """
+    Yields the lines of a csv file with a header of the fields.
+    """
+
+    writer = csv.writer(Echo())
+    yield writer.writerow(fields)
+
+    for row in rows:
+        yield writer.writerow([flatten(row.get(field)) for field in fields])
+
+
+def iter_ndjson(rows):
+    """
+    Yields every row as a line of JSON.
+    """
+
+    encoder = JSONEncoder(ensure_ascii=False)
+    for row in rows:
+        yield encoder.encode(row) + '\n'
+
+
+def buffered(lines, size=64 * 1024):
+    """
+    Joins the lines to chunks of about the given size, which keeps the
+    number of writes to the client low.
+    """
+
+    buffer = []
+    buffer_size = 0
+    for line in lines:
+        buffer.append(line)
+        buffer_size += len(line)
+
+        if buffer_size >= size:
+            yield ''.join(buffer)
+            buffer = []
+            buffer_size = 0
+
+    if buffer:
+        yield ''.join(buffer)
+
+
+def iter_export(queryset, serializer, export_format, chunk_size=2000):
+    """
+    Yields the export of the queryset in the export format (csv or
+    ndjson) in chunks.
+    """
+
+    rows = iter_representations(queryset, serializer, chunk_size)
+
+    if export_format == 'csv':
+        fields = [
+            name for name, field in serializer.fields.items()
+            if not field.write_only
+        ]
+        lines = iter_csv(rows, fields)
+    else:
+        lines = iter_ndjson(rows)
+
+    return buffered(lines)
@@ -0,0 +1,127 @@
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import filters
+from rest_framework.exceptions import ValidationError
+from api import models, search, serializers
+
+
+class TaskFilterBackend(filters.BaseFilterBackend):
+    """
+    Filters the tasks by the query parameters status, priority,
+    category, owner, member, due_before, due_after, completed and
+    overdue (see TaskQueryFilterSerializer).
+
+    All parameters are combined into the WHERE clause of the task
+    query itself, after the visibility rules of the view, so they work
+    with any pagination:
+    - status, priority and category are resolved to their ids through
+      the reference cache and compared on the foreign keys
+    - owner joins the owner profile and user (unique email)
+    - member is a subquery on the team members table
+    - due dates use the due date indexes, overdue the partial index of
+      the open tasks
+
+    Example:
+    ```
+    /api/tasks/?status=In Progress&overdue=true&member=jane@example.com
+    ```
+    """
+
+    filter_fields = [
+        'status', 'priority', 'category', 'owner', 'member', 'due_before',
+        'due_after', 'completed', 'overdue'
+    ]
+
+    def get_filter_data(self, request):
+        """
+        Returns the validated filter parameters of the request. Raises
+        a ValidationError (400) for invalid parameters.
+        """
+
+        data = {
+            field: request.query_params[field]
+            for field in self.filter_fields
+            if field in request.query_params
+        }
+        if not data:
+            return {}
+
+        serializer = serializers.TaskQueryFilterSerializer(data=data)
+        if not serializer.is_valid():
+            raise ValidationError(
+                {'message': 'Invalid filter', 'error': serializer.errors}
+            )
+
+        return serializer.validated_data
+
+    def filter_queryset(self, request, queryset, view):
+        data = self.get_filter_data(request)
+        if not data:
+            return queryset
+
+        conditions = Q()
+        for field in ['status', 'priority', 'category']:
+            if field in data:
+                conditions &= Q(**{f'{field}_id': data[field].pk})
+
+        if 'owner' in data:
+            conditions &= Q(owner__owner__email=data['owner'])
+
+        if 'member' in data:
+            conditions &= Q(
+                pk__in=models.Task.team_members.through.objects.filter(
+                    userprofile__owner__email=data['member']
+                ).values('task_id')
+            )
+
+        if 'due_before' in data:
+            conditions &= Q(due_date__lt=data['due_before'])
+        if 'due_after' in data:
+            conditions &= Q(due_date__gte=data['due_after'])
+
+        if 'completed' in data:
+            conditions &= Q(completed_at__isnull=not data['completed'])
+
+        if 'overdue' in data:
+            overdue = Q(due_date__lt=timezone.now(), completed_at__isnull=True)
+            conditions &= overdue if data['overdue'] else ~overdue
+
+        return queryset.filter(conditions)
+
+
+class TaskSearchFilter(filters.BaseFilterBackend):
+    """
+    Full-text search of the tasks by their title and description with
+    the query parameter q (see api.search). Matching tasks are ordered
+    by their rank, which the keyset pagination picks up through
+    get_ordering.
+
+    Example:
+    ```
+    /api/tasks/?q=quarterly report
+    ```
+    """
+
+    search_param = 'q'
+    ranked_ordering = ('-search_rank', '-id')
+
+    def get_search_terms(self, request):
+        return request.query_params.get(self.search_param, '').strip()
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        return search.search_tasks(queryset, terms)
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the rank ordering of a search, otherwise the ordering
+        of the pagination.
+        """
+
+        if self.get_search_terms(request):
+            return self.ranked_ordering
+
+        return view.paginator.ordering
@@ -0,0 +1,196 @@
+import csv
+import json
+import django
+from concurrent.futures import ProcessPoolExecutor
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from api import models, serializers
+from api.utils import chunked
+
+
+User = get_user_model()
+
+IMPORT_FORMATS = ['csv', 'ndjson']
+
+
+def read_rows(stream, file_format):
+    """
+    Yields the rows of a CSV (with header) or NDJSON text stream as
+    dictionaries, one line at a time. Empty CSV values are left out,
+    so that they count as missing.
+    """
+
+    if file_format == 'csv':
+        for row in csv.DictReader(stream):
+            yield {
+                field: value for field, value in row.items()
+                if field is not None and value not in ['', None]
+            }
+
+    elif file_format == 'ndjson':
+        for line in stream:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None
+
+    else:
+        raise ValueError(f'Unknown import format: {file_format}')
+
+
+def get_format(filename, default='csv'):
+    """
+    Returns the import format based on the file extension.
+    """
+
+    extension = filename.rsplit('.', 1)[-1].lower() if filename else ''
+    if extension in ['ndjson', 'jsonl']:
+        return 'ndjson'
+    if extension == 'csv':
+        return 'csv'
+
+    return default
+
+
+class UserImporter:
+    """
+    Imports users together with their profiles from an iterable of
+    rows (email, password, first_name, last_name, position).
+
+    The rows are processed in chunks, so the import never holds more
+    than one chunk in memory. The passwords of a chunk are hashed in a
+    process pool, the users and profiles are inserted with one bulk
+    insert each. Invalid rows are skipped and reported with their row
+    number.
+
+    Example:
+    ```python
+    with open('users.csv') as stream:
+        importer = UserImporter()
+        importer.run(read_rows(stream, 'csv'))
+
+    importer.created  # Number of created users
+    importer.errors   # [{'row': 3, 'error': {...}},]
+    ```
+    """
+
+    def __init__(self, chunk_size=500, workers=None):
+        """
+        workers: Number of hashing processes, None for one per CPU,
+        0 to hash within the current process.
+        """
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.created = 0
+        self.errors = []
+        self.seen_emails = set()
+
+    def run(self, rows):
+        """
+        Imports the rows within one transaction.
+        """
+
+        numbered_rows = enumerate(rows, start=1)
+
+        if self.workers == 0:
+            self.import_chunks(numbered_rows, map)
+            return self
+
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=django.setup
+        ) as executor:
+            self.import_chunks(numbered_rows, executor.map)
+
+        return self
+
+    def import_chunks(self, numbered_rows, map_function):
+        """
+        Validates, hashes and inserts the rows chunk by chunk.
+        """
+
+        with transaction.atomic():
+            for chunk in chunked(numbered_rows, self.chunk_size):
+                valid_rows = self.validate_chunk(chunk)
+                if not valid_rows:
+                    continue
+
+                passwords = [data.pop('password') for data in valid_rows]
+                hashed_passwords = map_function(make_password, passwords)
+                self.insert(valid_rows, hashed_passwords)
+
+    def validate_chunk(self, chunk):
+        """
+        Returns the validated data of the valid rows of the chunk and
+        records the errors of the invalid ones. Emails have to be
+        unique within the import and the database.
+        """
+
+        chunk_errors = []
+        validated_rows = []
+        for row_number, row in chunk:
+            if not isinstance(row, dict):
+                chunk_errors.append(
+                    {'row': row_number, 'error': 'Invalid row'}
+                )
+                continue
+
+            serializer = serializers.UserImportSerializer(data=row)
+            if not serializer.is_valid():
+                chunk_errors.append(
+                    {'row': row_number, 'error': serializer.errors}
+                )
+                continue
+
+            data = serializer.validated_data
+            data['email'] = User.objects.normalize_email(data['email'])
+            validated_rows.append((row_number, data))
+
+        emails = [data['email'] for row_number, data in validated_rows]
+        existing_emails = set(
+            User.objects.filter(email__in=emails)
+            .values_list('email', flat=True)
+        )
+
+        valid_rows = []
+        for row_number, data in validated_rows:
+            email = data['email']
+            if email in existing_emails or email in self.seen_emails:
+                chunk_errors.append({
+                    'row': row_number,
+                    'error': {'email': ['User with this email already exists']}
+                })
+                continue
+
+            self.seen_emails.add(email)
+            valid_rows.append(data)
+
+        # Errors in the order of the rows
+        self.errors.extend(
+            sorted(chunk_errors, key=lambda error: error['row'])
+        )
+
+        return valid_rows
+
+    def insert(self, valid_rows, hashed_passwords):
+        """
+        Inserts the users and their profiles with one bulk insert each.
+        """
+
+        users = User.objects.bulk_create([
+            User(email=data['email'], password=hashed_password)
+            for data, hashed_password in zip(valid_rows, hashed_passwords)
+        ])
+        models.UserProfile.objects.bulk_create([
+            models.UserProfile(
+                owner=user,
+                first_name=data['first_name'],
+                last_name=data['last_name'],
+                position=data.get('position')
+            )
+            for user, data in zip(users, valid_rows)
+        ])
+
+        self.created += len(users)
@@ -0,0 +1,172 @@
+# Custom management command
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+from api import autocomplete, models
+from api.management.seed import seed
+
+
+# Task indexes added by migrations 0002 and 0004
+TASK_INDEXES = [
+    'task_owner_created_idx',
+    'task_status_due_date_idx',
+    'task_due_date_idx',
+    'task_created_id_idx',
+    'task_open_due_date_idx',
+]
+
+
+class RollbackSeed(Exception):
+    """
+    Raised to roll back the seeded dataset and the dropped indexes.
+    """
+
+
+class Command(BaseCommand):
+    help = '''Shows the query plans of the slug lookups, task access
+    patterns and user autocomplete before and after the indexes of
+    migrations 0002, 0004, 0006 and 0013 on a seeded dataset.
+    Everything is rolled back afterwards.'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tasks', type=int, default=20000,
+            help='Number of seeded tasks'
+        )
+        parser.add_argument(
+            '--users', type=int, default=500,
+            help='Number of seeded users'
+        )
+
+    def handle(self, *args, **options):
+        # SQLite can only alter tables within a transaction while the
+        # foreign key checks are disabled
+        try:
+            with connection.constraint_checks_disabled(), \
+                    transaction.atomic():
+                self.sample = seed(options['users'], options['tasks'])
+                self.analyze()
+
+                self.stdout.write(self.style.SUCCESS('AFTER (with indexes)'))
+                self.explain_all()
+
+                self.drop_indexes()
+                self.analyze()
+
+                self.stdout.write(
+                    self.style.SUCCESS('BEFORE (without indexes)')
+                )
+                self.explain_all()
+
+                raise RollbackSeed
+        except RollbackSeed:
+            pass
+
+    def queries(self):
+        """
+        Returns the benchmarked queries by name.
+        """
+
+        sample = self.sample
+        user = sample['user']
+        # The profile is needed for the visibility query
+        user.profile = sample['profile']
+
+        return {
+            'Category by name': models.Category.objects.filter(
+                name=sample['category']
+            ),
+            'Priority by caption': models.Priority.objects.filter(
+                caption=sample['priority']
+            ),
+            'Status by caption': models.Status.objects.filter(
+                caption=sample['status'].caption
+            ),
+            'Position by title': models.Position.objects.filter(
+                title=sample['position']
+            ),
+            'Tasks of an owner by created_at': models.Task.objects.filter(
+                owner=sample['profile']
+            ).order_by('-created_at')[:50],
+            'Overdue tasks of a status': models.Task.objects.filter(
+                status=sample['status'],
+                due_date__lt=sample['now']
+            ).order_by('due_date')[:50],
+            'Tasks due within a week': models.Task.objects.filter(
+                due_date__range=(
+                    sample['now'],
+                    sample['now'] + timezone.timedelta(days=7)
+                )
+            ),
+            'Task page (created_at, id)': models.Task.objects.filter(
+                created_at__lte=sample['now']
+            ).order_by('-created_at', '-id')[:50],
+            'Tasks visible to a user': models.Task.objects.visible_to(
+                user
+            ).order_by('-created_at', '-id')[:50],
+            'Overdue open tasks': models.Task.objects.filter(
+                due_date__lt=sample['now'], completed_at__isnull=True
+            ).order_by('due_date')[:50],
+            'My tasks by due date': models.Task.objects.mine(
+                user
+            ).order_by('due_date', 'id')[:50],
+            'Tasks of a team member': models.Task.objects.filter(
+                pk__in=models.Task.team_members.through.objects.filter(
+                    userprofile__owner__email=user.email
+                ).values('task_id')
+            ).order_by('-created_at', '-id')[:50],
+            'Autocomplete users (contains)':
+                autocomplete.get_autocomplete_queryset(
+                    models.CustomUser.objects.all(), 'user1'
+                )[:10],
+            'Autocomplete users (short prefix)':
+                autocomplete.get_autocomplete_queryset(
+                    models.CustomUser.objects.all(), 'be'
+                )[:10],
+        }
+
+    def explain_all(self):
+        """
+        Writes the query plan of every benchmarked query.
+        """
+
+        for name, queryset in self.queries().items():
+            self.stdout.write(f'\n-- {name}')
+            self.stdout.write(queryset.explain())
+        self.stdout.write('')
+
+    def drop_indexes(self):
+        """
+        Drops the indexes and unique constraints added by migrations
+        0002, 0004, 0006 and 0013 within the running transaction.
+        """
+
+        with connection.schema_editor(atomic=False) as schema_editor:
+            autocomplete.uninstall(None, schema_editor)
+            autocomplete.uninstall_prefix_indexes(None, schema_editor)
+
+            for index in models.Task._meta.indexes:
+                if index.name in TASK_INDEXES:
+                    schema_editor.remove_index(models.Task, index)
+
+            slug_fields = [
+                (models.Category, 'name'),
+                (models.Priority, 'caption'),
+                (models.Status, 'caption'),
+                (models.Position, 'title'),
+            ]
+            for model, field_name in slug_fields:
+                old_field = model._meta.get_field(field_name)
+                new_field = old_field.clone()
+                new_field.set_attributes_from_name(field_name)
+                new_field.model = model
+                new_field._unique = False
+                schema_editor.alter_field(model, old_field, new_field)
+
+    def analyze(self):
+        """
+        Updates the planner statistics of the seeded tables.
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
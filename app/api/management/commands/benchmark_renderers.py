@@ -0,0 +1,99 @@
+# Custom management command
+import time
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from api import renderers
+
+
+class Command(BaseCommand):
+    help = '''Compares the encoding time of task lists with the JSON
+    renderer of DRF, the orjson renderer and the MessagePack renderer
+    (when installed). The task lists are generated in memory in the
+    shape of the TaskSerializer representation.'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--tasks', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='Numbers of tasks of the encoded lists'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=5,
+            help='Runs per measurement, the fastest run counts'
+        )
+
+    def handle(self, *args, **options):
+        candidates = {'json (stdlib)': JSONRenderer()}
+        if renderers.orjson is not None:
+            candidates['orjson'] = renderers.ORJSONRenderer()
+        else:
+            self.stdout.write('orjson is not installed')
+        if renderers.msgpack is not None:
+            candidates['msgpack'] = renderers.MessagePackRenderer()
+        else:
+            self.stdout.write('msgpack is not installed')
+
+        self.stdout.write(
+            f'{"tasks":>8} {"renderer":<14} {"ms":>9} {"tasks/s":>12} '
+            f'{"KiB":>9}'
+        )
+        for count in options['tasks']:
+            data = self.get_task_list(count)
+
+            for name, renderer in candidates.items():
+                content, seconds = self.measure(
+                    renderer, data, options['repeat']
+                )
+                self.stdout.write(
+                    f'{count:>8} {name:<14} {seconds * 1000:>9.1f} '
+                    f'{count / seconds:>12,.0f} {len(content) / 1024:>9,.0f}'
+                )
+
+    def get_task_list(self, count):
+        """
+        Returns a paginated task list representation with the given
+        number of tasks.
+        """
+
+        now = timezone.now()
+        results = [
+            {
+                'id': number,
+                'category': 'Information Technology',
+                'priority': 'High Priority',
+                'status': 'In Progress' if number % 3 else None,
+                'title': f'Task {number}',
+                'description': 'Prepare the quarterly report for the team',
+                'due_date': (now + timezone.timedelta(days=number % 30))
+                .isoformat().replace('+00:00', 'Z'),
+                'created_at': now.isoformat().replace('+00:00', 'Z'),
+                'completed_at': None,
+                'updated_at': now.isoformat().replace('+00:00', 'Z'),
+                'version': 1 + number % 5,
+                'owner': f'owner{number % 100}@example.com',
+                'team_members': [
+                    f'member{(number + offset) % 500}@example.com'
+                    for offset in range(3)
+                ],
+            }
+            for number in range(count)
+        ]
+
+        return {
+            'next': 'http://localhost/api/tasks/?cursor=cD0yMDI0',
+            'previous': None,
+            'results': results,
+        }
+
+    def measure(self, renderer, data, repeat):
+        """
+        Returns the rendered content and the fastest encoding time.
+        """
+
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            content = renderer.render(data, renderer.media_type)
+            timings.append(time.perf_counter() - start)
+
+        return content, min(timings)
@@ -0,0 +1,143 @@
+# Custom management command
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from api import models, serializers, row_serializers
+from api.management.seed import seed
+
+
+class RollbackSeed(Exception):
+    """
+    Raised to roll back the seeded dataset.
+    """
+
+
+class Command(BaseCommand):
+    help = '''Compares the rows per second of the regular serializers
+    and the values() fast path (api.row_serializers) of the task and
+    user lists on a seeded dataset and checks that both render the same
+    JSON. Everything is rolled back afterwards.'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows', type=int, nargs='+', default=[1000, 10000, 100000],
+            help='Numbers of presented rows'
+        )
+        parser.add_argument(
+            '--repeat', type=int, default=3,
+            help='Runs per measurement, the fastest run counts'
+        )
+
+    def handle(self, *args, **options):
+        rows = sorted(options['rows'])
+        self.repeat = options['repeat']
+
+        try:
+            with transaction.atomic():
+                seed(rows[-1], rows[-1])
+                self.context = {'request': self.get_request()}
+
+                self.stdout.write(
+                    f'{"rows":>8} {"list":<6} {"regular rows/s":>15} '
+                    f'{"fast rows/s":>12} {"speedup":>8}'
+                )
+                for count in rows:
+                    self.compare('tasks', count, self.regular_tasks,
+                                 self.fast_tasks)
+                    self.compare('users', count, self.regular_users,
+                                 self.fast_users)
+
+                raise RollbackSeed
+        except RollbackSeed:
+            pass
+
+    def get_request(self):
+        """
+        Returns a GET request of a staff user, who sees every task.
+        """
+
+        User = get_user_model()
+        staff = User(
+            email='bench.staff@example.com', password='!', is_staff=True
+        )
+        staff.save()
+
+        request = Request(APIRequestFactory().get('/'))
+        request.user = staff
+
+        return request
+
+    def regular_tasks(self, count):
+        tasks = models.Task.objects.with_related().order_by(
+            '-created_at', '-id'
+        )[:count]
+        return serializers.TaskSerializer(
+            tasks, many=True, context=self.context
+        ).data
+
+    def fast_tasks(self, count):
+        row_serializer = row_serializers.TaskRowSerializer(
+            serializers.TaskSerializer(context=self.context)
+        )
+        rows = row_serializer.get_queryset(
+            models.Task.objects.order_by('-created_at', '-id')
+        )[:count]
+        return row_serializer.to_representation_many(rows)
+
+    def regular_users(self, count):
+        users = get_user_model().objects.select_related(
+            'profile__position__category'
+        ).filter(profile__isnull=False).order_by('id')[:count]
+        return serializers.CustomUserSerializer(
+            users, many=True, context=self.context
+        ).data
+
+    def fast_users(self, count):
+        row_serializer = row_serializers.UserRowSerializer(
+            serializers.CustomUserSerializer(context=self.context)
+        )
+        rows = row_serializer.get_queryset(
+            get_user_model().objects.filter(
+                profile__isnull=False
+            ).order_by('id')
+        )[:count]
+        return row_serializer.to_representation_many(rows)
+
+    def measure(self, build, count):
+        """
+        Returns the rendered JSON and the fastest time of querying,
+        serializing and rendering the rows.
+        """
+
+        renderer = JSONRenderer()
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            content = renderer.render(build(count))
+            timings.append(time.perf_counter() - start)
+
+        return content, min(timings)
+
+    def compare(self, name, count, regular, fast):
+        """
+        Writes the rows per second of both paths. Raises a CommandError
+        when the rendered JSON differs.
+        """
+
+        regular_content, regular_time = self.measure(regular, count)
+        fast_content, fast_time = self.measure(fast, count)
+
+        if regular_content != fast_content:
+            raise CommandError(
+                f'The fast path of the {name} list renders different JSON'
+            )
+
+        self.stdout.write(
+            f'{count:>8} {name:<6} {count / regular_time:>15,.0f} '
+            f'{count / fast_time:>12,.0f} '
+            f'{regular_time / fast_time:>7.1f}x'
+        )
@@ -0,0 +1,60 @@
+# Custom management command
+import io
+import sys
+from django.core.management.base import BaseCommand, CommandError
+from api import importers
+
+
+class Command(BaseCommand):
+    help = '''Imports users together with their profiles from a CSV
+    (with header) or NDJSON file. Expected columns: email, password,
+    first_name, last_name, position (Position.title, optional).'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'path',
+            help='Path of the import file, - to read from stdin'
+        )
+        parser.add_argument(
+            '--format', choices=importers.IMPORT_FORMATS,
+            help='Format of the file, determined by its extension by default'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=500,
+            help='Number of rows inserted at once'
+        )
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Number of password hashing processes (0 = no pool)'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or importers.get_format(path)
+        importer = importers.UserImporter(
+            chunk_size=options['chunk_size'],
+            workers=options['workers']
+        )
+
+        # utf-8-sig drops the byte order mark of spreadsheet exports
+        if path == '-':
+            stream = io.TextIOWrapper(
+                sys.stdin.buffer, encoding='utf-8-sig', newline=''
+            )
+            importer.run(importers.read_rows(stream, file_format))
+        else:
+            try:
+                stream = open(path, newline='', encoding='utf-8-sig')
+            except OSError as error:
+                raise CommandError(error)
+
+            with stream:
+                importer.run(importers.read_rows(stream, file_format))
+
+        for error in importer.errors:
+            self.stderr.write(f'Row {error["row"]}: {error["error"]}')
+
+        self.stdout.write(self.style.SUCCESS(
+            f'{importer.created} users imported, '
+            f'{len(importer.errors)} rows failed'
+        ))
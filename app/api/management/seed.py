@@ -0,0 +1,90 @@
+import random
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from api import models
+
+
+def seed(user_count, task_count):
+    """
+    Seeds the reference data, users with profiles and tasks (three
+    team members each) with bulk inserts for the benchmark commands.
+    Returns a sample of the seeded data.
+    """
+
+    categories = models.Category.objects.bulk_create([
+        models.Category(name=f'Bench Category {number}', description='')
+        for number in range(20)
+    ])
+    priorities = models.Priority.objects.bulk_create([
+        models.Priority(caption=f'Bench Priority {number}')
+        for number in range(5)
+    ])
+    statuses = models.Status.objects.bulk_create([
+        models.Status(caption=f'Bench Status {number}', description='')
+        for number in range(6)
+    ])
+    positions = models.Position.objects.bulk_create([
+        models.Position(
+            title=f'Bench Position {number}',
+            description='',
+            category=random.choice(categories)
+        )
+        for number in range(50)
+    ])
+
+    User = get_user_model()
+    users = User.objects.bulk_create([
+        # Unusable password, hashing isn't part of the benchmark
+        User(email=f'bench.user{number}@example.com', password='!')
+        for number in range(user_count)
+    ])
+    profiles = models.UserProfile.objects.bulk_create([
+        models.UserProfile(
+            owner=user,
+            first_name='Bench',
+            last_name=f'User {number}',
+            position=random.choice(positions)
+        )
+        for number, user in enumerate(users)
+    ])
+
+    now = timezone.now()
+    tasks = models.Task.objects.bulk_create([
+        models.Task(
+            title=f'Bench Task {number}',
+            description='Seeded task',
+            due_date=now + timezone.timedelta(
+                days=random.randint(-60, 60)
+            ),
+            category=random.choice(categories),
+            priority=random.choice(priorities),
+            status=random.choice(statuses),
+            owner=random.choice(profiles),
+        )
+        for number in range(task_count)
+    ], batch_size=1000)
+    # auto_now_add sets the same created_at for a bulk insert
+    for task in tasks:
+        task.created_at = now - timezone.timedelta(
+            minutes=random.randint(0, 60 * 24 * 365)
+        )
+    models.Task.objects.bulk_update(
+        tasks, ['created_at'], batch_size=1000
+    )
+
+    Membership = models.Task.team_members.through
+    Membership.objects.bulk_create([
+        Membership(task_id=task.pk, userprofile_id=profile.pk)
+        for task in tasks
+        for profile in random.sample(profiles, 3)
+    ], batch_size=1000)
+
+    return {
+        'category': categories[0].name,
+        'priority': priorities[0].caption,
+        'status': statuses[0],
+        'position': positions[0].title,
+        'profile': profiles[0],
+        'user': users[0],
+        'now': now,
+    }
@@ -0,0 +1,60 @@
+from api import models
+
+
+def get_request_cache(request):
+    """
+    Returns the membership cache of the request. The cache is stored
+    on the underlying HttpRequest, so that the DRF request, the
+    permission classes and the serializers all share it while it only
+    lives as long as the request itself.
+    """
+
+    http_request = getattr(request, '_request', request)
+    cache = getattr(http_request, '_task_membership', None)
+
+    if cache is None:
+        cache = {}
+        http_request._task_membership = cache
+
+    return cache
+
+
+def is_owner(request, task):
+    """
+    Checks if the request.user is the owner of the task by comparing
+    the owner foreign key, which doesn't need to load the owner.
+    """
+
+    return task.owner_id == request.user.profile.pk
+
+
+def is_team_member(request, task):
+    """
+    Checks if the request.user is a team member of the task.
+
+    The answer is memoized per request, keyed by (user, task). Uses the
+    prefetched team members when the task comes with them, otherwise a
+    single EXISTS lookup on the (task, userprofile) unique index of the
+    team members table.
+    """
+
+    user = request.user
+    cache = get_request_cache(request)
+    key = (user.pk, task.pk)
+
+    if key not in cache:
+        profile_id = user.profile.pk
+        prefetched = getattr(task, '_prefetched_objects_cache', {})
+
+        if 'team_members' in prefetched:
+            cache[key] = any(
+                profile.pk == profile_id
+                for profile in prefetched['team_members']
+            )
+        else:
+            cache[key] = models.Task.team_members.through.objects.filter(
+                task_id=task.pk,
+                userprofile_id=profile_id
+            ).exists()
+
+    return cache[key]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 11:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_task_version_and_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                condition=models.Q(('completed_at__isnull', True)),
+                fields=['due_date'],
+                name='task_open_due_date_idx'
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-17 12:45
+
+import django.contrib.postgres.search
+from django.db import migrations
+from api import search
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_task_open_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        # PostgreSQL: trigger and GIN index, SQLite: FTS5 table
+        migrations.RunPython(search.install, search.uninstall),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 15:20
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+from api import autocomplete
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_task_search'),
+    ]
+
+    operations = [
+        # pg_trgm (PostgreSQL only)
+        TrigramExtension(),
+        migrations.RunPython(autocomplete.install, autocomplete.uninstall),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 4.2.30 on 2026-10-16 23:55
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0007_overdue_sweep'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TaskSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('owner', 'Owner'), ('member', 'Team member')], max_length=10)),
+                ('count', models.IntegerField(default=0)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_summaries', to='api.category')),
+                ('priority', models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_summaries', to='api.priority')),
+                ('profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='task_summaries', to='api.userprofile')),
+                ('status', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='task_summaries', to='api.status')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['profile', 'role'], name='task_summary_profile_role_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_task_summary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='taskresource',
+            name='updated_at',
+            field=models.DateTimeField(
+                auto_now=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(
+                fields=['updated_at'], name='task_updated_at_idx'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='userprofile',
+            index=models.Index(
+                fields=['updated_at'], name='profile_updated_at_idx'
+            ),
+        ),
+        migrations.CreateModel(
+            name='Tombstone',
+            fields=[
+                ('id', models.BigAutoField(
+                    auto_created=True, primary_key=True, serialize=False,
+                    verbose_name='ID'
+                )),
+                ('kind', models.CharField(
+                    choices=[('task', 'Task'), ('user', 'User')],
+                    max_length=10
+                )),
+                ('object_id', models.BigIntegerField()),
+                ('deleted_at', models.DateTimeField(
+                    default=django.utils.timezone.now
+                )),
+                ('profile', models.ForeignKey(
+                    blank=True, null=True,
+                    on_delete=django.db.models.deletion.CASCADE,
+                    related_name='tombstones', to='api.userprofile'
+                )),
+            ],
+            options={
+                'indexes': [
+                    models.Index(
+                        fields=['kind', 'deleted_at'],
+                        name='tombstone_kind_deleted_idx'
+                    ),
+                ],
+            },
+        ),
+    ]
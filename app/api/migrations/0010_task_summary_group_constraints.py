@@ -0,0 +1,51 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:23
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def merge_duplicate_groups(apps, schema_editor):
+    """
+    Merges the summary rows of the same group, which concurrent updates
+    could create before the constraints.
+    """
+
+    TaskSummary = apps.get_model('api', 'TaskSummary')
+    fields = ['profile_id', 'role', 'status_id', 'priority_id', 'category_id']
+
+    duplicates = TaskSummary.objects.values(*fields).annotate(
+        rows=Count('pk'), total=Sum('count')
+    ).filter(rows__gt=1)
+    for group in duplicates:
+        total = group.pop('total')
+        group.pop('rows')
+        TaskSummary.objects.filter(**group).delete()
+        if total > 0:
+            TaskSummary.objects.create(**group, count=total)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_delta_sync'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_groups, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='tasksummary',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__isnull', False)),
+                fields=('profile', 'role', 'status', 'priority', 'category'),
+                name='task_summary_group_uniq'
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name='tasksummary',
+            constraint=models.UniqueConstraint(
+                condition=models.Q(('status__isnull', True)),
+                fields=('profile', 'role', 'priority', 'category'),
+                name='task_summary_no_status_group_uniq'
+            ),
+        ),
+    ]
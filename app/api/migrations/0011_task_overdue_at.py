@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 00:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_task_summary_group_constraints'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='overdue_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,57 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def fill_task_summary(apps, schema_editor):
+    """
+    Builds the task summary of the existing tasks with one GROUP BY
+    query per role, like api.summary.rebuild().
+    """
+
+    Task = apps.get_model('api', 'Task')
+    TaskSummary = apps.get_model('api', 'TaskSummary')
+    Membership = Task.team_members.through
+
+    owner_rows = Task.objects.order_by().values(
+        'owner_id', 'status_id', 'priority_id', 'category_id'
+    ).annotate(count=Count('pk'))
+    member_rows = Membership.objects.order_by().values(
+        'userprofile_id', 'task__status_id', 'task__priority_id',
+        'task__category_id'
+    ).annotate(count=Count('pk'))
+
+    summaries = [
+        TaskSummary(
+            profile_id=row['owner_id'],
+            role='owner',
+            status_id=row['status_id'],
+            priority_id=row['priority_id'],
+            category_id=row['category_id'],
+            count=row['count']
+        )
+        for row in owner_rows
+    ] + [
+        TaskSummary(
+            profile_id=row['userprofile_id'],
+            role='member',
+            status_id=row['task__status_id'],
+            priority_id=row['task__priority_id'],
+            category_id=row['task__category_id'],
+            count=row['count']
+        )
+        for row in member_rows
+    ]
+
+    TaskSummary.objects.all().delete()
+    TaskSummary.objects.bulk_create(summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_task_overdue_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(fill_task_summary, migrations.RunPython.noop),
+    ]
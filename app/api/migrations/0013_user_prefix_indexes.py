@@ -0,0 +1,17 @@
+from django.db import migrations
+from api import autocomplete
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0012_fill_task_summary'),
+    ]
+
+    operations = [
+        # Prefix matches of short autocomplete terms (PostgreSQL only)
+        migrations.RunPython(
+            autocomplete.install_prefix_indexes,
+            autocomplete.uninstall_prefix_indexes
+        ),
+    ]
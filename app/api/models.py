@@ -1,5 +1,7 @@
 from typing import Any
-from django.db import models
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, \
     PermissionsMixin
 
@@ -86,7 +88,7 @@ class Priority(models.Model):
     task.save()
     ```
     """
-    caption = models.CharField(max_length=30)
+    caption = models.CharField(max_length=30, unique=True)
 
     def __str__(self) -> str:
         """
@@ -114,7 +116,7 @@ class Status(models.Model):
     task.save()
     ```
     """
-    caption = models.CharField(max_length=30)
+    caption = models.CharField(max_length=30, unique=True)
     description = models.TextField()
 
     def __str__(self) -> str:
@@ -143,7 +145,7 @@ class Category(models.Model):
     category.save()
     ```
     """
-    name = models.CharField(max_length=30)
+    name = models.CharField(max_length=30, unique=True)
     description = models.TextField(max_length=255)
 
     def __str__(self) -> str:
@@ -179,7 +181,7 @@ class Position(models.Model):
     ```
     """
 
-    title = models.CharField(max_length=100)
+    title = models.CharField(max_length=100, unique=True)
     description = models.TextField()
     is_task_manager = models.BooleanField(default=False)
 
@@ -215,12 +217,153 @@ class UserProfile(models.Model):
         null=True,
         blank=True
     )
+    # Bumped on changes of the profile and its user (see api.signals)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Changed users (delta sync)
+            models.Index(
+                fields=['updated_at'],
+                name='profile_updated_at_idx'
+            ),
+        ]
 
     def __str__(self):
 
         return f'Profile Owner: {self.owner.email}'
 
 
+class TaskQuerySet(models.QuerySet):
+    """
+    QuerySet for the Task model.
+    """
+
+    def with_related(self, fields=None, exclude=()):
+        """
+        Joins the foreign keys and prefetches the team members
+        (UserProfiles) together with their users, which are needed to
+        represent a task, so that the number of queries does not grow
+        with the number of tasks.
+
+        fields/exclude restrict the loaded data to a sparse fieldset of
+        the task representation (see TaskSerializer), the columns and
+        relations of the other fields are deferred. The columns needed
+        for pagination, ETags and membership checks are always loaded.
+        """
+
+        def is_selected(name):
+            return (fields is None or name in fields) and \
+                name not in exclude
+
+        related = [
+            name for name in ['category', 'priority', 'status']
+            if is_selected(name)
+        ]
+        if is_selected('owner'):
+            related.append('owner__owner')
+
+        # The ids of the team members are needed for membership checks
+        if is_selected('team_members'):
+            team_members = UserProfile.objects.select_related('owner')
+        else:
+            team_members = UserProfile.objects.only('id')
+        # Stable order of the team member emails
+        team_members = team_members.order_by('pk')
+
+        queryset = self.prefetch_related(
+            models.Prefetch('team_members', queryset=team_members)
+        )
+        if related:
+            queryset = queryset.select_related(*related)
+
+        deferred = [
+            name for name in ['title', 'description', 'due_date',
+                              'completed_at']
+            if not is_selected(name)
+        ]
+        if deferred:
+            queryset = queryset.defer(*deferred)
+
+        return queryset
+
+    def visible_to(self, user):
+        """
+        Restricts the tasks to the ones the user is allowed to see.
+        Staff users see all tasks, other users only the tasks they own
+        or are a team member of (see of_profile).
+        """
+
+        if not user or not user.is_authenticated:
+            return self.none()
+
+        if user.is_staff:
+            return self
+
+        return self.of_profile(user.profile.pk)
+
+    def of_profile(self, profile_id):
+        """
+        Restricts the tasks to the ones the userprofile owns or is a
+        team member of.
+
+        Both sets are collected as an UNION of task ids, which is
+        answered by the owner index of the task table and the
+        userprofile index of the team members table, so the cost
+        grows with the tasks of the user and not with the table.
+        """
+
+        owned_tasks = Task.objects.filter(owner_id=profile_id).values('pk')
+        member_tasks = Task.team_members.through.objects.filter(
+            userprofile_id=profile_id
+        ).values('task_id')
+
+        return self.filter(pk__in=owned_tasks.union(member_tasks))
+
+    def mine(self, user):
+        """
+        Restricts the tasks to the ones the user owns or is a team
+        member of (staff users included) and annotates the role of the
+        user, 'owner' or 'member' (owners which are team members of
+        their own task are presented as owner).
+        """
+
+        profile_id = user.profile.pk
+
+        return self.of_profile(profile_id).annotate(
+            role=models.Case(
+                models.When(owner_id=profile_id, then=models.Value('owner')),
+                default=models.Value('member'),
+                output_field=models.CharField()
+            )
+        )
+
+    def touch(self, **changes):
+        """
+        Updates the tasks with a single query and bumps their version
+        and updated_at, which makes their ETags change.
+        """
+
+        return self.update(
+            version=models.F('version') + 1,
+            updated_at=timezone.now(),
+            **changes
+        )
+
+
+class TaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """
+    Manager for the Task model.
+    """
+
+    def get_queryset(self):
+        """
+        Defers the search vector, which is only needed by the search
+        and maintained by the database (see api.search).
+        """
+        return super().get_queryset().defer('search_vector')
+
+
 class Task(models.Model):
     """
     A task with different status options.
@@ -239,6 +382,14 @@ class Task(models.Model):
       UserProfile model.
     - team_members (Many-To-Many): Many-To-Many relationship with the
       UserProfile model.
+    - updated_at (DateTimeField): Last change of the task.
+    - overdue_at (DateTimeField): When the overdue sweep moved the task
+      to the overdue status (see api.cron).
+    - version (PositiveIntegerField): Bumped on every change of the
+      task, its team members and resources (see api.signals).
+    - search_vector (SearchVectorField): Full-text search vector of the
+      title and description, maintained by a database trigger on
+      PostgreSQL (see api.search).
 
     Example:
     ```python
@@ -280,6 +431,11 @@ class Task(models.Model):
     due_date = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    version = models.PositiveIntegerField(default=1, editable=False)
+    overdue_at = models.DateTimeField(null=True, blank=True, editable=False)
+    # GIN index and trigger are created by migration 0005
+    search_vector = SearchVectorField(null=True, editable=False)
 
     category = models.ForeignKey(
         Category,
@@ -309,6 +465,66 @@ class Task(models.Model):
         related_name='teams',
     )
 
+    objects = TaskManager()
+
+    class Meta:
+        indexes = [
+            # Tasks of an owner by creation date
+            models.Index(
+                fields=['owner', 'created_at'],
+                name='task_owner_created_idx'
+            ),
+            # Tasks of a status by due date
+            models.Index(
+                fields=['status', 'due_date'],
+                name='task_status_due_date_idx'
+            ),
+            # Due date ranges (e.g. overdue tasks)
+            models.Index(fields=['due_date'], name='task_due_date_idx'),
+            # Keyset pagination (created_at, id)
+            models.Index(
+                fields=['created_at', 'id'],
+                name='task_created_id_idx'
+            ),
+            # Open tasks by due date (overdue filter)
+            models.Index(
+                fields=['due_date'],
+                condition=models.Q(completed_at__isnull=True),
+                name='task_open_due_date_idx'
+            ),
+            # Changed tasks (delta sync)
+            models.Index(
+                fields=['updated_at'],
+                name='task_updated_at_idx'
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """
+        Bumps the version of an existing task. The version is
+        incremented by the database, so concurrent saves don't collide,
+        and reloaded afterwards.
+
+        The save runs in a transaction together with its signals, so
+        the task summary (see api.summary) isn't left with the old
+        counts subtracted when the save fails.
+        """
+
+        bump = not self._state.adding
+        if bump:
+            self.version = models.F('version') + 1
+
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {
+                    *update_fields, 'version', 'updated_at'
+                }
+
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+        if bump:
+            self.refresh_from_db(fields=['version'])
+
     def __str__(self) -> str:
         """
         Returns a string representation of the task based on its ID,
@@ -326,6 +542,7 @@ class TaskResource(models.Model):
     - description (TextField): The description of the resource.
     - resource_link (CharField): The link to the resource.
     - task (ForeignKey): Foreign key relationship with the Task model.
+    - updated_at (DateTimeField): Last change of the resource.
 
     Example:
     ```python
@@ -347,6 +564,8 @@ class TaskResource(models.Model):
     source_name = models.CharField(max_length=100)
     description = models.TextField()
     resource_link = models.CharField(max_length=500)
+    # Changes also bump the task (see api.signals)
+    updated_at = models.DateTimeField(auto_now=True)
 
     task = models.ForeignKey(
         Task,
@@ -360,3 +579,154 @@ class TaskResource(models.Model):
         its ID and source name.
         """
         return f'ID: {self.id} Title: {self.source_name}'
+
+
+class OverdueSweep(models.Model):
+    """
+    A run of the overdue task sweeper (see api.cron).
+
+    Fields:
+    - started_at (DateTimeField): The start of the sweep.
+    - duration (DurationField): The duration of the sweep.
+    - status (ForeignKey): The status the overdue tasks were moved to.
+    - swept (PositiveIntegerField): The number of moved tasks.
+    - chunks (PositiveIntegerField): The number of UPDATE statements
+      (transactions) of the sweep.
+    """
+    started_at = models.DateTimeField()
+    duration = models.DurationField()
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.DO_NOTHING,
+        related_name='overdue_sweeps'
+    )
+    swept = models.PositiveIntegerField(default=0)
+    chunks = models.PositiveIntegerField(default=0)
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the sweep based on its start
+        and the number of moved tasks.
+        """
+        return f'Sweep {self.started_at:%Y-%m-%d %H:%M} - {self.swept} tasks'
+
+
+class TaskSummary(models.Model):
+    """
+    The number of tasks of a userprofile per role (owner, team member),
+    status, priority and category, which serves the task dashboard.
+    Maintained by signals and bulk operations, and rebuilt by the
+    rebuild_task_summary command (see api.summary).
+
+    Fields:
+    - profile (ForeignKey): The owner or team member of the tasks.
+    - role (CharField): The role of the userprofile (owner, member).
+    - status (ForeignKey): The status of the tasks.
+    - priority (ForeignKey): The priority of the tasks.
+    - category (ForeignKey): The category of the tasks.
+    - count (IntegerField): The number of tasks.
+    """
+    OWNER = 'owner'
+    MEMBER = 'member'
+    ROLES = [(OWNER, 'Owner'), (MEMBER, 'Team member')]
+
+    profile = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name='task_summaries'
+    )
+    role = models.CharField(max_length=10, choices=ROLES)
+    status = models.ForeignKey(
+        Status,
+        on_delete=models.DO_NOTHING,
+        related_name='task_summaries',
+        null=True,
+        blank=True
+    )
+    priority = models.ForeignKey(
+        Priority,
+        on_delete=models.DO_NOTHING,
+        related_name='task_summaries'
+    )
+    category = models.ForeignKey(
+        Category,
+        on_delete=models.DO_NOTHING,
+        related_name='task_summaries'
+    )
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            # Groups of a userprofile (dashboard, incremental updates)
+            models.Index(
+                fields=['profile', 'role'],
+                name='task_summary_profile_role_idx'
+            ),
+        ]
+        constraints = [
+            # One row per group, tasks without a status form their own
+            # group (NULLs are distinct in unique constraints)
+            models.UniqueConstraint(
+                fields=['profile', 'role', 'status', 'priority', 'category'],
+                condition=models.Q(status__isnull=False),
+                name='task_summary_group_uniq'
+            ),
+            models.UniqueConstraint(
+                fields=['profile', 'role', 'priority', 'category'],
+                condition=models.Q(status__isnull=True),
+                name='task_summary_no_status_group_uniq'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the group based on its
+        userprofile, role and count.
+        """
+        return f'{self.profile} ({self.role}): {self.count} tasks'
+
+
+class Tombstone(models.Model):
+    """
+    Marks a deleted task or user, or a task the userprofile can no
+    longer see (removed team member, previous owner), for the delta
+    sync of the clients (see api.sync). Purged after
+    settings.SYNC_TOMBSTONE_RETENTION (see api.cron).
+
+    Fields:
+    - kind (CharField): The kind of the object (task, user).
+    - object_id (BigIntegerField): The id of the object.
+    - profile (ForeignKey): The userprofile which lost access to the
+      object, None for deleted objects.
+    - deleted_at (DateTimeField): The time of the deletion.
+    """
+    TASK = 'task'
+    USER = 'user'
+    KINDS = [(TASK, 'Task'), (USER, 'User')]
+
+    kind = models.CharField(max_length=10, choices=KINDS)
+    object_id = models.BigIntegerField()
+    profile = models.ForeignKey(
+        UserProfile,
+        on_delete=models.CASCADE,
+        related_name='tombstones',
+        null=True,
+        blank=True
+    )
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # Deletions since a sync token
+            models.Index(
+                fields=['kind', 'deleted_at'],
+                name='tombstone_kind_deleted_idx'
+            ),
+        ]
+
+    def __str__(self) -> str:
+        """
+        Returns a string representation of the tombstone based on the
+        kind and id of the object.
+        """
+        return f'Deleted {self.kind} {self.object_id}'
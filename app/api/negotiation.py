@@ -0,0 +1,24 @@
+from rest_framework.negotiation import DefaultContentNegotiation
+
+
+class AvailableContentNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation which only considers the renderers and parsers
+    whose optional library is installed (available = False otherwise,
+    see api.renderers and api.parsers). Requests for a missing format
+    are answered like any other unsupported media type (406/415).
+    """
+
+    def select_parser(self, request, parsers):
+        parsers = [
+            parser for parser in parsers
+            if getattr(parser, 'available', True)
+        ]
+        return super().select_parser(request, parsers)
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [
+            renderer for renderer in renderers
+            if getattr(renderer, 'available', True)
+        ]
+        return super().select_renderer(request, renderers, format_suffix)
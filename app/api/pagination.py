@@ -0,0 +1,231 @@
+import json
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework import pagination
+from rest_framework.exceptions import NotFound
+
+
+class KeysetPagination(pagination.CursorPagination):
+    """
+    Cursor pagination over a composite key (e.g. created_at, id).
+
+    Unlike the CursorPagination of DRF, the cursor stores the values
+    of every ordering field of the last/first item of a page. The next
+    page is filtered with a row comparison on these values instead of
+    an offset, which keeps the cost of deep pages the same as the cost
+    of the first page and the pages stable under concurrent inserts.
+    The primary key is always appended as a unique tie-breaker.
+
+    Query parameters:
+    - cursor
+    - page_size (capped by max_page_size)
+    """
+
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 500
+
+    def get_ordering(self, request, queryset, view):
+        """
+        Returns the ordering of the view/pagination with the primary
+        key appended as tie-breaker.
+        """
+
+        ordering = super().get_ordering(request, queryset, view)
+        fields = [field.lstrip('-') for field in ordering]
+
+        if 'id' not in fields and 'pk' not in fields:
+            direction = '-' if ordering[-1].startswith('-') else ''
+            ordering += (f'{direction}id',)
+
+        return ordering
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """
+        Returns the page of the cursor position, ordered by the
+        composite key and filtered by the position of the cursor.
+        """
+
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        reverse = bool(self.cursor and self.cursor.reverse)
+        position = self.decode_position(queryset)
+        ordering = self.ordering
+        if reverse:
+            ordering = pagination._reverse_ordering(ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(
+                self.get_keyset_filter(ordering, position)
+            )
+
+        # Fetches one additional item to determine if another page
+        # follows in the direction of the cursor
+        results = list(queryset[:self.page_size + 1])
+        self.page = results[:self.page_size]
+        has_following_page = len(results) > self.page_size
+
+        if reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_following_page
+        else:
+            self.has_next = has_following_page
+            self.has_previous = position is not None
+
+        if (self.has_previous or self.has_next) and \
+                self.template is not None:
+            self.display_page_controls = True
+
+        return self.page
+
+    def get_keyset_filter(self, ordering, position):
+        """
+        Returns the filter selecting the items after the position in
+        the given ordering:
+
+        (a > x) OR (a = x AND b > y) OR ...
+
+        The additional bound on the leading field (a >= x) lets the
+        database use a range scan on the index of the leading field.
+        """
+
+        keyset_filter = Q()
+        equal_fields = Q()
+        for field, value in zip(ordering, position):
+            field_name = field.lstrip('-')
+            lookup = 'lt' if field.startswith('-') else 'gt'
+
+            keyset_filter |= equal_fields & Q(
+                **{f'{field_name}__{lookup}': value}
+            )
+            equal_fields &= Q(**{field_name: value})
+
+        leading_field = ordering[0]
+        lookup = 'lte' if leading_field.startswith('-') else 'gte'
+        leading_bound = Q(
+            **{f'{leading_field.lstrip("-")}__{lookup}': position[0]}
+        )
+
+        return leading_bound & keyset_filter
+
+    def encode_position(self, instance):
+        """
+        Encodes the ordering field values of the instance (or values()
+        row) as the position of a cursor.
+        """
+
+        position = []
+        for field in self.ordering:
+            field_name = field.lstrip('-')
+            if isinstance(instance, dict):
+                value = instance[field_name]
+            else:
+                value = getattr(instance, field_name)
+            position.append(str(value))
+
+        return json.dumps(position)
+
+    def decode_position(self, queryset):
+        """
+        Decodes the position of the request cursor into the python
+        values of the ordering fields (model fields or annotations,
+        e.g. the search rank). Raises NotFound when the position
+        doesn't match the ordering.
+        """
+
+        if self.cursor is None or self.cursor.position is None:
+            return None
+
+        try:
+            values = json.loads(self.cursor.position)
+            if not isinstance(values, list) or \
+                    len(values) != len(self.ordering):
+                raise ValueError
+
+            position = []
+            for field, value in zip(self.ordering, values):
+                field_name = field.lstrip('-')
+                if field_name == 'pk':
+                    model_field = queryset.model._meta.pk
+                elif field_name in queryset.query.annotations:
+                    model_field = queryset.query.annotations[
+                        field_name
+                    ].output_field
+                else:
+                    model_field = queryset.model._meta.get_field(field_name)
+                position.append(model_field.to_python(value))
+
+        except (TypeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position
+
+    def get_next_link(self):
+        """
+        Returns the link to the page after the last item of the page.
+        """
+
+        if not self.has_next or not self.page:
+            return None
+
+        cursor = pagination.Cursor(
+            offset=0,
+            reverse=False,
+            position=self.encode_position(self.page[-1])
+        )
+        return self.encode_cursor(cursor)
+
+    def get_previous_link(self):
+        """
+        Returns the link to the page before the first item of the page.
+        """
+
+        if not self.has_previous or not self.page:
+            return None
+
+        cursor = pagination.Cursor(
+            offset=0,
+            reverse=True,
+            position=self.encode_position(self.page[0])
+        )
+        return self.encode_cursor(cursor)
+
+
+class TaskPagination(KeysetPagination):
+    """
+    Paginates tasks from the newest to the oldest, keyed on
+    (created_at, id).
+    """
+
+    ordering = ('-created_at', '-id')
+    page_size = 50
+    max_page_size = 200
+
+
+class MyTaskPagination(KeysetPagination):
+    """
+    Paginates the tasks of the request user by their due date, keyed on
+    (due_date, id).
+    """
+
+    ordering = ('due_date', 'id')
+    page_size = 50
+    max_page_size = 200
+
+
+class UserPagination(KeysetPagination):
+    """
+    Paginates users keyed on their id.
+    """
+
+    ordering = ('id',)
+    page_size = 100
+    max_page_size = 500
@@ -0,0 +1,60 @@
+from rest_framework import parsers
+from rest_framework.exceptions import ParseError
+from api import renderers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    Parses JSON with orjson. Falls back to the JSONParser of DRF when
+    orjson isn't installed or the body isn't encoded as UTF-8.
+    """
+
+    renderer_class = renderers.ORJSONRenderer
+    available = True
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the JSON body of the request.
+        """
+
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', 'utf-8')
+        if orjson is None or encoding.lower().replace('-', '') != 'utf8':
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f'JSON parse error - {exc}')
+
+
+class MessagePackParser(parsers.BaseParser):
+    """
+    Parses MessagePack bodies (Content-Type: application/msgpack).
+    Only offered by the content negotiation when msgpack is installed
+    (see api.negotiation).
+    """
+
+    media_type = 'application/msgpack'
+    renderer_class = renderers.MessagePackRenderer
+    available = msgpack is not None
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """
+        Parses the MessagePack body of the request.
+        """
+
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, timestamp=3)
+        except (ValueError, msgpack.UnpackException) as exc:
+            raise ParseError(f'MessagePack parse error - {exc}')
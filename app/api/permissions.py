@@ -1,5 +1,5 @@
 from rest_framework import permissions
-from api import models, views
+from api import models, views, membership
 
 
 class IsTeamMember(permissions.BasePermission):
@@ -9,9 +9,8 @@ class IsTeamMember(permissions.BasePermission):
 
     def has_object_permission(self, request, view, obj):
         if request and request.user and request.user.is_authenticated:
-            profile = request.user.profile
 
-            return profile in obj.team_members.all()
+            return membership.is_team_member(request, obj)
 
 
 class IsOwner(permissions.BasePermission):
@@ -31,7 +30,5 @@ class IsOwner(permissions.BasePermission):
 
         if isinstance(view, views.TaskView):
             if request and request.user and request.user.is_authenticated:
-                profile = request.user.profile
-                task_owner = obj.owner
 
-                return profile == task_owner
+                return membership.is_owner(request, obj)
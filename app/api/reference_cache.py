@@ -0,0 +1,148 @@
+import threading
+import time
+from django.conf import settings
+from django.core.cache import cache
+from api import models
+
+
+class ReferenceCache:
+    """
+    Process-local cache of a rarely changing reference model, which
+    maps the slugs and primary keys to the model instances.
+
+    The whole table is loaded with a single query on first use. Writes
+    to the model bump a version (see api.signals), which is kept in
+    the default cache of Django, so that every process sharing that
+    cache backend reloads its copy.
+
+    The version is read from the cache once per request (see
+    api.signals) and at most every version_ttl seconds otherwise
+    (settings.REFERENCE_CACHE_VERSION_TTL), instead of on every lookup.
+
+    Example:
+    ```python
+    priorities = ReferenceCache(models.Priority, 'caption')
+    high_priority = priorities.get('High Priority')
+    ```
+    """
+
+    def __init__(self, model, slug_field, version_ttl=1):
+        self.model = model
+        self.slug_field = slug_field
+        self.version_key = f'reference-cache:{model._meta.label_lower}'
+        self.version_ttl = version_ttl
+
+        self._lock = threading.Lock()
+        self._loaded_version = None
+        self._version = None
+        self._version_checked_at = None
+        self._by_slug = {}
+        self._by_pk = {}
+
+    def __deepcopy__(self, memo):
+        """
+        Returns the cache itself, since serializer fields holding the
+        cache get deep copied for every serializer instance.
+        """
+
+        return self
+
+    def get_version(self):
+        """
+        Returns the current version of the model data, which is read
+        from the cache when it wasn't checked within version_ttl
+        seconds or since expire_version().
+        """
+
+        now = time.monotonic()
+        if self._version_checked_at is None or \
+                now - self._version_checked_at >= self.version_ttl:
+            self._version = cache.get_or_set(
+                self.version_key, 0, timeout=None
+            )
+            self._version_checked_at = now
+
+        return self._version
+
+    def expire_version(self):
+        """
+        Makes the next access read the version from the cache again.
+        """
+
+        self._version_checked_at = None
+
+    def invalidate(self):
+        """
+        Bumps the version, which makes all processes reload the data.
+        """
+
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, 1, timeout=None)
+        self.expire_version()
+
+    def load(self, version):
+        """
+        Loads all instances of the model.
+        """
+
+        with self._lock:
+            instances = list(self.model.objects.all())
+            self._by_slug = {
+                getattr(instance, self.slug_field): instance
+                for instance in instances
+            }
+            self._by_pk = {instance.pk: instance for instance in instances}
+            self._loaded_version = version
+
+    def ensure_loaded(self):
+        """
+        Reloads the instances when they are outdated.
+        """
+
+        version = self.get_version()
+        if self._loaded_version != version:
+            self.load(version)
+
+    def get(self, slug):
+        """
+        Returns the instance with the given slug or None.
+        """
+
+        self.ensure_loaded()
+        return self._by_slug.get(slug)
+
+    def get_by_pk(self, pk):
+        """
+        Returns the instance with the given primary key or None.
+        """
+
+        self.ensure_loaded()
+        return self._by_pk.get(pk)
+
+    def get_many(self, slugs):
+        """
+        Returns a dictionary of the found instances by their slugs.
+        """
+
+        self.ensure_loaded()
+        return {
+            slug: self._by_slug[slug]
+            for slug in slugs if slug in self._by_slug
+        }
+
+
+version_ttl = getattr(settings, 'REFERENCE_CACHE_VERSION_TTL', 1)
+
+categories = ReferenceCache(models.Category, 'name', version_ttl)
+priorities = ReferenceCache(models.Priority, 'caption', version_ttl)
+statuses = ReferenceCache(models.Status, 'caption', version_ttl)
+positions = ReferenceCache(models.Position, 'title', version_ttl)
+
+reference_caches = {
+    models.Category: categories,
+    models.Priority: priorities,
+    models.Status: statuses,
+    models.Position: positions,
+}
@@ -0,0 +1,87 @@
+from rest_framework import renderers
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+def encode_default(obj):
+    """
+    Encodes the types orjson/msgpack don't support (lazy translations,
+    decimals, querysets, ...) like the JSONEncoder of DRF.
+    """
+    return JSONEncoder().default(obj)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Renders JSON with orjson, which is several times faster than the
+    json module and encodes datetimes natively. Falls back to the
+    JSONRenderer of DRF when orjson isn't installed or an indentation
+    is requested (e.g. by the browsable API).
+    """
+
+    available = True
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders the data into JSON bytes.
+        """
+
+        renderer_context = renderer_context or {}
+        if orjson is None or \
+                self.get_indent(accepted_media_type, renderer_context):
+            return super().render(
+                data, accepted_media_type, renderer_context
+            )
+
+        if data is None:
+            return b''
+
+        content = orjson.dumps(
+            data,
+            default=encode_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+        )
+
+        # Escaped like the JSONRenderer, so the output stays a strict
+        # javascript subset
+        if b'\xe2\x80\xa8' in content or b'\xe2\x80\xa9' in content:
+            content = content.replace(
+                b'\xe2\x80\xa8', b'\\u2028'
+            ).replace(b'\xe2\x80\xa9', b'\\u2029')
+
+        return content
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders MessagePack, a compact binary format for clients sending
+    Accept: application/msgpack. Only offered by the content
+    negotiation when msgpack is installed (see api.negotiation).
+    """
+
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    available = msgpack is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Renders the data into MessagePack bytes.
+        """
+
+        if data is None:
+            return b''
+
+        return msgpack.packb(
+            data, default=encode_default, use_bin_type=True, datetime=True
+        )
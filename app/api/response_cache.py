@@ -0,0 +1,227 @@
+import hashlib
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework import response, status
+from api import models, reference_cache
+
+
+class TaskListCache:
+    """
+    Caches the serialized task list responses per viewer and URL
+    (query parameters) in a cache of Django's cache framework.
+
+    Every viewer has a generation, staff users share one generation
+    since they see all tasks. Changes of a task bump the generations of
+    its owner, its team members and the staff (see api.signals), which
+    makes their cached lists outdated.
+
+    Stale-while-revalidate: an outdated list is rebuilt by the first
+    request, other requests arriving during the rebuild are answered
+    with the outdated list (up to stale_timeout seconds past its
+    timeout), so a slow database only stalls a single reader.
+
+    Example:
+    ```python
+    task_lists = TaskListCache('default', timeout=60, stale_timeout=30)
+    task_lists.get_response(request, build_response)
+    task_lists.invalidate_tasks([task.pk])
+    ```
+    """
+
+    key_prefix = 'task-list'
+
+    def __init__(self, cache_alias, timeout, stale_timeout, lock_timeout=30):
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.stale_timeout = stale_timeout
+        self.lock_timeout = lock_timeout
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def get_viewer(self, user):
+        """
+        Returns the viewer of the user, all staff users share a viewer.
+        """
+
+        if user.is_staff:
+            return 'staff'
+
+        return f'profile-{user.profile.pk}'
+
+    def get_generation_key(self, viewer):
+        return f'{self.key_prefix}:generation:{viewer}'
+
+    def get_version(self, viewer):
+        """
+        Returns the current version of the lists of the viewer, which
+        includes the versions of the reference data.
+        """
+
+        # A new generation is started when the key is missing (evicted)
+        generation = self.cache.get_or_set(
+            self.get_generation_key(viewer), uuid.uuid4().hex, timeout=None
+        )
+        reference_versions = tuple(
+            cache.get_version()
+            for cache in reference_cache.reference_caches.values()
+        )
+
+        return generation, reference_versions
+
+    def get_key(self, viewer, request):
+        """
+        Returns the key of the list of the viewer at the requested URL
+        in the accepted media type, whose ETag differs.
+        """
+
+        url = request.build_absolute_uri()
+        media_type = getattr(request, 'accepted_media_type', '')
+        digest = hashlib.sha1(f'{media_type} {url}'.encode()).hexdigest()
+
+        return f'{self.key_prefix}:{viewer}:{digest}'
+
+    def get_response(self, request, build_response):
+        """
+        Returns the cached list response, or builds and caches it with
+        build_response when it is missing or outdated.
+        """
+
+        viewer = self.get_viewer(request.user)
+        version = self.get_version(viewer)
+        key = self.get_key(viewer, request)
+
+        entry = self.cache.get(key)
+        if entry is not None:
+            age = time.time() - entry['created']
+
+            if entry['version'] == version and age < self.timeout:
+                return self.get_cached_response(request, entry)
+
+            # Another request is already rebuilding the list, entries
+            # past the stale timeout are rebuilt anyway
+            lock_key = f'{key}:lock'
+            locked = self.cache.add(lock_key, True, self.lock_timeout)
+            if not locked and age < self.timeout + self.stale_timeout:
+                return self.get_cached_response(request, entry)
+
+            try:
+                return self.build(key, version, build_response, entry)
+            finally:
+                # Only the request holding the lock releases it
+                if locked:
+                    self.cache.delete(lock_key)
+
+        return self.build(key, version, build_response)
+
+    def build(self, key, version, build_response, entry=None):
+        """
+        Builds the list response and caches it.
+        """
+
+        list_response = build_response()
+
+        if list_response.status_code == status.HTTP_200_OK:
+            entry = {
+                'version': version,
+                'created': time.time(),
+                'data': list_response.data,
+                'etag': list_response.get('ETag'),
+                'last_modified': list_response.get('Last-Modified'),
+            }
+            self.cache.set(key, entry, self.timeout + self.stale_timeout)
+
+        # Unchanged list (If-None-Match of the cached ETag)
+        elif list_response.status_code == status.HTTP_304_NOT_MODIFIED \
+                and entry is not None \
+                and list_response.get('ETag') == entry['etag']:
+            entry = {**entry, 'version': version, 'created': time.time()}
+            self.cache.set(key, entry, self.timeout + self.stale_timeout)
+
+        return list_response
+
+    def get_cached_response(self, request, entry):
+        """
+        Returns the response of a cached entry, or 304 Not Modified
+        when the cached ETag matches the request.
+        """
+
+        if entry['etag'] and request.headers.get('If-None-Match'):
+            if_none_match = request.headers['If-None-Match']
+            etags = [etag.strip() for etag in if_none_match.split(',')]
+            if entry['etag'] in etags or '*' in etags:
+                not_modified = response.Response(
+                    status=status.HTTP_304_NOT_MODIFIED
+                )
+                return self.set_headers(not_modified, entry)
+
+        return self.set_headers(response.Response(entry['data']), entry)
+
+    def set_headers(self, cached_response, entry):
+        """
+        Sets the cached ETag and Last-Modified headers.
+        """
+
+        if entry['etag']:
+            cached_response['ETag'] = entry['etag']
+        if entry['last_modified']:
+            cached_response['Last-Modified'] = entry['last_modified']
+
+        return cached_response
+
+    def bump(self, viewers):
+        """
+        Gives the viewers a new generation.
+        """
+
+        generation = uuid.uuid4().hex
+        self.cache.set_many(
+            {
+                self.get_generation_key(viewer): generation
+                for viewer in viewers
+            },
+            timeout=None
+        )
+
+    def invalidate_profiles(self, profile_ids):
+        """
+        Invalidates the lists of the userprofiles and the staff. The
+        generations are bumped again after the commit, so lists cached
+        from the data before the commit don't stay.
+        """
+
+        viewers = {f'profile-{profile_id}' for profile_id in profile_ids}
+        viewers.add('staff')
+
+        self.bump(viewers)
+        transaction.on_commit(lambda: self.bump(viewers))
+
+    def invalidate_tasks(self, task_ids):
+        """
+        Invalidates the lists of the owners and team members of the
+        tasks with a single query.
+        """
+
+        task_ids = list(task_ids)
+        if not task_ids:
+            return
+
+        owners = models.Task.objects.filter(
+            pk__in=task_ids
+        ).values_list('owner_id', flat=True)
+        team_members = models.Task.team_members.through.objects.filter(
+            task_id__in=task_ids
+        ).values_list('userprofile_id', flat=True)
+
+        self.invalidate_profiles(set(owners.union(team_members)))
+
+
+task_lists = TaskListCache(
+    cache_alias=getattr(settings, 'TASK_LIST_CACHE_ALIAS', 'default'),
+    timeout=getattr(settings, 'TASK_LIST_CACHE_TIMEOUT', 60),
+    stale_timeout=getattr(settings, 'TASK_LIST_CACHE_STALE_TIMEOUT', 30)
+)
@@ -0,0 +1,300 @@
+from rest_framework import fields as drf_fields
+from api import models
+
+
+# DRF fields whose to_representation returns the database value as is
+IDENTITY_FIELDS = (
+    drf_fields.BooleanField,
+    drf_fields.CharField,
+    drf_fields.IntegerField,
+)
+
+
+class RowSerializer:
+    """
+    Read-only fast path of a serializer for list actions, which builds
+    the representation from values() rows instead of model instances.
+
+    Subclasses implement get_sources(), which returns a (key, column,
+    converter) per presented field in the order of the representation
+    of the regular serializer. The sources are resolved once per
+    serializer into a function building the dictionary of a row, so
+    no field lookups are involved per row.
+
+    Example:
+    ```python
+    row_serializer = TaskRowSerializer(TaskSerializer(context=context))
+    rows = row_serializer.get_queryset(queryset)
+    data = row_serializer.to_representation_many(rows)
+    ```
+    """
+
+    # Columns needed besides the presented fields (pagination, ETags)
+    extra_columns = ['id']
+
+    def __init__(self, serializer):
+        self.serializer = serializer
+        self.context = serializer.context
+        self.sources = self.get_sources()
+
+        columns = list(self.extra_columns)
+        for key, column, converter in self.sources:
+            if column is not None and column not in columns:
+                columns.append(column)
+        self.columns = columns
+
+    def get_sources(self):
+        """
+        Returns the (key, column, converter) of the presented fields.
+        The converter is None for columns presented as they are, a
+        column of None passes the whole row to the converter.
+        """
+        raise NotImplementedError
+
+    def get_queryset(self, queryset):
+        """
+        Returns the values() rows of the columns of the presented
+        fields and of the annotations (e.g. the search rank), which
+        the pagination may order by.
+        """
+        return queryset.values(*self.columns, *queryset.query.annotations)
+
+    def get_version(self, row):
+        """
+        Returns the (version, last_modified) of a row for its ETag,
+        see ConditionalGetMixin.
+        """
+        raise NotImplementedError
+
+    def compile(self):
+        """
+        Returns the function building the representation of a row from
+        the sources of this serializer (field selection, converters
+        bound to its fields and context).
+        """
+
+        sources = list(self.sources)
+
+        def to_representation(row):
+            representation = {}
+            for key, column, converter in sources:
+                value = row if column is None else row[column]
+                if converter is not None:
+                    value = converter(value)
+                representation[key] = value
+            return representation
+
+        return to_representation
+
+    def to_representation_many(self, rows):
+        """
+        Returns the representations of the rows.
+        """
+
+        to_representation = self.compile()
+        return [to_representation(row) for row in rows]
+
+
+def nullable(converter):
+    """
+    Returns a converter passing None through, like the serializers do
+    for empty values.
+    """
+
+    def convert(value):
+        if value is None:
+            return None
+        return converter(value)
+
+    return convert
+
+
+class TaskRowSerializer(RowSerializer):
+    """
+    Fast path of the TaskSerializer. Presents the owner and team
+    members as emails and the reference data as slugs, the team member
+    emails of a page are loaded with a second query.
+    """
+
+    extra_columns = [
+        'id', 'created_at', 'version', 'updated_at', 'owner_id'
+    ]
+
+    def get_sources(self):
+        """
+        Returns the sources of the readable (and selected) fields of
+        the TaskSerializer.
+        """
+
+        sources = []
+        for key, field in self.serializer.fields.items():
+            if field.write_only:
+                continue
+
+            if key == 'owner':
+                sources.append((key, 'owner__owner__email', None))
+
+            elif key == 'team_members':
+                sources.append((key, 'team_members', None))
+
+            elif hasattr(field, 'reference_cache'):
+                # Joined like the select_related of the regular path
+                slug_field = field.reference_cache.slug_field
+                sources.append((key, f'{key}__{slug_field}', None))
+
+            # Columns or annotations (e.g. the role of TaskQuerySet.mine)
+            else:
+                converter = None
+                if not isinstance(field, IDENTITY_FIELDS):
+                    converter = field.to_representation
+                    if models.Task._meta.get_field(key).null:
+                        converter = nullable(converter)
+                sources.append((key, key, converter))
+
+        return sources
+
+    def get_queryset(self, queryset):
+        """
+        Returns the values() rows of the tasks, the team members are
+        added by to_representation_many.
+        """
+
+        columns = [column for column in self.columns
+                   if column != 'team_members']
+        annotations = [name for name in queryset.query.annotations
+                       if name not in columns]
+        return queryset.values(*columns, *annotations)
+
+    def get_version(self, row):
+        """
+        Returns the same version as TaskView.get_version.
+        """
+        version = (row['id'], row['version'], row['updated_at'])
+
+        return version, row['updated_at']
+
+    def get_team_members(self, task_ids):
+        """
+        Returns the (profile id, email) of the team members by task id,
+        ordered like the team members prefetch (see
+        TaskQuerySet.with_related).
+        """
+
+        team_members = {task_id: [] for task_id in task_ids}
+        rows = models.Task.team_members.through.objects.filter(
+            task_id__in=task_ids
+        ).order_by('userprofile_id').values_list(
+            'task_id', 'userprofile_id', 'userprofile__owner__email'
+        )
+        for task_id, profile_id, email in rows:
+            team_members[task_id].append((profile_id, email))
+
+        return team_members
+
+    def to_representation_many(self, rows):
+        """
+        Returns the representations of the task rows. Tasks the request
+        user neither owns nor is a team member of are presented as an
+        empty dictionary, like TaskSerializer.to_representation does.
+        """
+
+        rows = list(rows)
+        to_representation = self.compile()
+        team_members = self.get_team_members([row['id'] for row in rows])
+
+        request = self.context.get('request')
+        profile_id = None
+        if request and not request.user.is_staff:
+            profile_id = request.user.profile.pk
+
+        representations = []
+        for row in rows:
+            members = team_members[row['id']]
+            row['team_members'] = [email for _, email in members]
+
+            if profile_id is not None and \
+                    row['owner_id'] != profile_id and \
+                    all(member_id != profile_id for member_id, _ in members):
+                representations.append({})
+                continue
+
+            representations.append(to_representation(row))
+
+        return representations
+
+
+def profile_representation(row):
+    """
+    Returns the representation of the profile of a user row, like the
+    nested UserProfileSerializer/PositionSerializer of the
+    CustomUserSerializer.
+    """
+
+    position = None
+    if row['profile__position__id'] is not None:
+        position = {
+            'id': row['profile__position__id'],
+            'category': row['profile__position__category__name'],
+            'title': row['profile__position__title'],
+            'description': row['profile__position__description'],
+            'is_task_manager': row['profile__position__is_task_manager'],
+        }
+
+    return {
+        'id': row['profile__id'],
+        'first_name': row['profile__first_name'],
+        'last_name': row['profile__last_name'],
+        'position': position,
+    }
+
+
+class UserRowSerializer(RowSerializer):
+    """
+    Fast path of the CustomUserSerializer. The profile, position and
+    position category are joined into the rows of the users.
+    """
+
+    extra_columns = ['id', 'email', 'profile__updated_at']
+    profile_columns = [
+        'profile__id', 'profile__first_name', 'profile__last_name',
+        'profile__position__id', 'profile__position__title',
+        'profile__position__description',
+        'profile__position__is_task_manager',
+        'profile__position__category__name',
+    ]
+
+    def get_sources(self):
+        """
+        Returns the sources of the selected fields of the
+        CustomUserSerializer.
+        """
+
+        sources = [
+            (key, key, None)
+            for key in ['id', 'email', 'is_active', 'is_superuser',
+                        'is_staff']
+            if self.serializer.is_field_selected(key)
+        ]
+        if self.serializer.is_field_selected('profile'):
+            sources.append(('profile', None, profile_representation))
+
+        return sources
+
+    def get_queryset(self, queryset):
+        """
+        Returns the values() rows of the users and their profiles.
+        """
+
+        columns = list(self.columns)
+        if self.serializer.is_field_selected('profile'):
+            columns += self.profile_columns
+
+        return queryset.values(*columns, *queryset.query.annotations)
+
+    def get_version(self, row):
+        """
+        Returns the same version as CustomUserView.get_version.
+        """
+        updated_at = row['profile__updated_at']
+
+        return (row['id'], updated_at), updated_at
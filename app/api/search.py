@@ -0,0 +1,182 @@
+import re
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connections
+from django.db.models import F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Cast
+from api import models
+
+
+# Text search configuration of the search vector (PostgreSQL)
+SEARCH_CONFIG = 'english'
+
+# External content FTS5 table of the tasks (SQLite)
+FTS_TABLE = 'api_task_fts'
+
+POSTGRESQL_INSTALL = [
+    f'''
+    CREATE OR REPLACE FUNCTION api_task_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(
+                to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.title, '')), 'A'
+            ) ||
+            setweight(
+                to_tsvector('{SEARCH_CONFIG}', coalesce(NEW.description, '')),
+                'B'
+            );
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    ''',
+    '''
+    CREATE TRIGGER api_task_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, description ON api_task
+    FOR EACH ROW EXECUTE FUNCTION api_task_search_vector_update()
+    ''',
+    # Fires the trigger for the existing tasks
+    'UPDATE api_task SET title = title',
+    '''
+    CREATE INDEX task_search_vector_idx ON api_task
+    USING gin (search_vector)
+    ''',
+]
+
+POSTGRESQL_UNINSTALL = [
+    'DROP INDEX IF EXISTS task_search_vector_idx',
+    'DROP TRIGGER IF EXISTS api_task_search_vector_trigger ON api_task',
+    'DROP FUNCTION IF EXISTS api_task_search_vector_update()',
+]
+
+SQLITE_INSTALL = [
+    f'''
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        title, description, content='api_task', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    ''',
+    f'''
+    CREATE TRIGGER api_task_fts_insert AFTER INSERT ON api_task BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    f'''
+    CREATE TRIGGER api_task_fts_delete AFTER DELETE ON api_task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    ''',
+    f'''
+    CREATE TRIGGER api_task_fts_update
+    AFTER UPDATE OF title, description ON api_task BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    ''',
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+SQLITE_UNINSTALL = [
+    'DROP TRIGGER IF EXISTS api_task_fts_insert',
+    'DROP TRIGGER IF EXISTS api_task_fts_delete',
+    'DROP TRIGGER IF EXISTS api_task_fts_update',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+
+def install(apps, schema_editor):
+    """
+    Creates the search index of the tasks, which is maintained by
+    triggers on every write (including bulk inserts and updates):
+    - PostgreSQL: the weighted search_vector column (title A,
+      description B) with a GIN index
+    - SQLite: an FTS5 table, so the search works in the tests
+
+    Note that SQLite drops the triggers when a migration rebuilds the
+    task table, such migrations have to install the search again.
+    """
+
+    vendor = schema_editor.connection.vendor
+    statements = {
+        'postgresql': POSTGRESQL_INSTALL,
+        'sqlite': SQLITE_INSTALL,
+    }.get(vendor, [])
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def uninstall(apps, schema_editor):
+    """
+    Removes the search index of the tasks.
+    """
+
+    vendor = schema_editor.connection.vendor
+    statements = {
+        'postgresql': POSTGRESQL_UNINSTALL,
+        'sqlite': SQLITE_UNINSTALL,
+    }.get(vendor, [])
+
+    for statement in statements:
+        schema_editor.execute(statement)
+
+
+def get_fts_query(terms):
+    """
+    Returns an FTS5 query matching all words of the search terms. The
+    words are quoted, so the FTS5 query syntax can't be injected.
+    """
+
+    words = re.findall(r'\w+', terms)
+    return ' '.join(f'"{word}"' for word in words)
+
+
+def search_tasks(queryset, terms):
+    """
+    Filters the tasks matching the search terms and annotates their
+    search_rank (higher is better).
+    """
+
+    vendor = connections[queryset.db].vendor
+
+    if vendor == 'postgresql':
+        query = SearchQuery(
+            terms, config=SEARCH_CONFIG, search_type='websearch'
+        )
+        # ts_rank() returns real, which the keyset cursor can't compare
+        # exactly once it is widened to double precision
+        return queryset.filter(search_vector=query).annotate(
+            search_rank=Cast(
+                SearchRank(F('search_vector'), query), FloatField()
+            )
+        )
+
+    if vendor == 'sqlite':
+        fts_query = get_fts_query(terms)
+        if not fts_query:
+            return queryset.annotate(
+                search_rank=Value(0.0, output_field=FloatField())
+            ).none()
+
+        task_table = models.Task._meta.db_table
+        # bm25 is lower for better matches, titles count twice
+        rank = RawSQL(
+            f'SELECT -bm25({FTS_TABLE}, 2.0, 1.0) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{task_table}"."id"',
+            [fts_query],
+            output_field=FloatField()
+        )
+        matches = RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s',
+            [fts_query]
+        )
+        return queryset.filter(pk__in=matches).annotate(search_rank=rank)
+
+    # Unranked substring search on other databases
+    return queryset.filter(
+        Q(title__icontains=terms) | Q(description__icontains=terms)
+    ).annotate(search_rank=Value(0.0, output_field=FloatField()))
@@ -1,16 +1,145 @@
 from rest_framework import serializers
 from rest_framework.validators import ValidationError
-from api import models
+from api import models, membership, reference_cache, summary
+from api.response_cache import task_lists
 from django.contrib.auth import get_user_model
 from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
+from django.db.models.fields.related_descriptors import \
+    ForwardManyToOneDescriptor
 from django.shortcuts import get_object_or_404
+from django.utils.encoding import smart_str
+from django.utils.functional import cached_property
 from rest_framework.exceptions import ErrorDetail
+from rest_framework.permissions import SAFE_METHODS
 from collections import OrderedDict
 
 
 User = get_user_model()
 
 
+class CachedSlugRelatedField(serializers.SlugRelatedField):
+    """
+    A SlugRelatedField which resolves slugs and foreign keys through a
+    process-local reference cache (api.reference_cache) instead of
+    querying the database for every value.
+
+    Example:
+    ```python
+    priority = CachedSlugRelatedField(reference_cache.priorities)
+    ```
+    """
+
+    def __init__(self, cache, **kwargs):
+        self.reference_cache = cache
+        kwargs.setdefault('slug_field', cache.slug_field)
+        if not kwargs.get('read_only'):
+            kwargs.setdefault('queryset', cache.model.objects.all())
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        """
+        Returns the cached instance of the slug.
+        """
+
+        try:
+            instance = self.reference_cache.get(data)
+        except (TypeError, ValueError):
+            self.fail('invalid')
+
+        if instance is None:
+            self.fail(
+                'does_not_exist',
+                slug_name=self.slug_field,
+                value=smart_str(data)
+            )
+
+        return instance
+
+    def get_attribute(self, instance):
+        """
+        Returns the related instance when it is already loaded,
+        otherwise resolves the foreign key through the cache.
+        """
+
+        descriptor = getattr(type(instance), self.source_attrs[-1], None)
+        if len(self.source_attrs) == 1 and \
+                isinstance(descriptor, ForwardManyToOneDescriptor):
+            field = descriptor.field
+
+            if not field.is_cached(instance):
+                pk = getattr(instance, field.attname)
+                if pk is None:
+                    return None
+
+                related_instance = self.reference_cache.get_by_pk(pk)
+                if related_instance is not None:
+                    return related_instance
+
+        return super().get_attribute(instance)
+
+
+def get_field_selection(request):
+    """
+    Returns the (fields, exclude) of the sparse fieldset query
+    parameters (?fields=id,title / ?exclude=description) of a safe
+    request. fields is None when all fields are requested.
+    """
+
+    if request is None or request.method not in SAFE_METHODS:
+        return None, set()
+
+    # Plain Django requests have no query_params
+    query_params = getattr(request, 'query_params', request.GET)
+
+    def parse(param):
+        value = query_params.get(param)
+        if not value:
+            return None
+        return {name.strip() for name in value.split(',') if name.strip()}
+
+    return parse('fields'), parse('exclude') or set()
+
+
+def is_field_selected(name, selection):
+    """
+    Returns if the field is part of the sparse fieldset.
+    """
+
+    fields, exclude = selection
+    return (fields is None or name in fields) and name not in exclude
+
+
+class SparseFieldsetMixin:
+    """
+    Restricts the presented fields of a serializer to the fields
+    requested with ?fields= and/or ?exclude= (comma separated). Only
+    applies to safe requests, so validation is never affected.
+    """
+
+    @cached_property
+    def field_selection(self):
+        return get_field_selection(self.context.get('request'))
+
+    def is_field_selected(self, name):
+        return is_field_selected(name, self.field_selection)
+
+    def get_fields(self):
+        """
+        Returns the selected fields.
+        """
+
+        fields = super().get_fields()
+        selection = self.field_selection
+
+        for name in list(fields):
+            if not is_field_selected(name, selection):
+                del fields[name]
+
+        return fields
+
+
 class CategorySerializer(serializers.ModelSerializer):
     """
     A modelserializer for the Category model.
@@ -25,10 +154,7 @@ class PositionSerializer(serializers.ModelSerializer):
     """
     A modelserializer for the Position model.
     """
-    category = serializers.SlugRelatedField(
-        queryset=models.Category.objects.all(),
-        slug_field='name'
-    )
+    category = CachedSlugRelatedField(reference_cache.categories)
 
     class Meta:
         model = models.Position
@@ -41,13 +167,16 @@ class UserProfileSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = models.UserProfile
-        fields = '__all__'
+        # updated_at is only used for the ETag of the user
+        exclude = ['updated_at']
 
 
-class CustomUserSerializer(serializers.Serializer):
+class CustomUserSerializer(SparseFieldsetMixin, serializers.Serializer):
     """
     A RUD Serializer for the CustomUser model. expects data for a
-    CostumUser and its profile instance.
+    CostumUser and its profile instance. The representation can be
+    restricted with ?fields=/?exclude= (id, email, is_active,
+    is_superuser, is_staff, profile).
 
     fields:
     - email (EmailField)
@@ -110,12 +239,17 @@ class CustomUserSerializer(serializers.Serializer):
 
         # Creates basic user representation data
         desired_fields = [
-            'id', 'email', 'is_active', 'is_superuser', 'is_staff'
+            field for field in [
+                'id', 'email', 'is_active', 'is_superuser', 'is_staff'
+            ] if self.is_field_selected(field)
         ]
         representation = {}
         for field in desired_fields:
             representation[field] = getattr(instance, field)
 
+        if not self.is_field_selected('profile'):
+            return representation
+
         profile = getattr(instance, 'profile')
         position = getattr(profile, 'position')
 
@@ -166,10 +300,7 @@ class UserInitiationSerializer(serializers.Serializer):
     # Profile data
     first_name = serializers.CharField(max_length=100)
     last_name = serializers.CharField(max_length=100)
-    position = serializers.SlugRelatedField(
-        queryset=models.Position.objects.all(),
-        slug_field='title'
-    )
+    position = CachedSlugRelatedField(reference_cache.positions)
 
     def validate(self, attrs):
         """
@@ -268,27 +399,167 @@ class UserInitiationSerializer(serializers.Serializer):
         return representation
 
 
-class TaskSerializer(serializers.ModelSerializer):
+class UserImportSerializer(serializers.Serializer):
     """
-    A modelserializer for the Task model.
+    Validates a single row of a bulk user import (see api.importers).
+    Unlike the UserInitiationSerializer no password_confirmation is
+    expected and the position is optional.
+
+    Fields:
+    - email (EmailField)
+    - password (CharField)
+    - first_name (CharField)
+    - last_name (CharField)
+    - position (SlugRelatedField: slug_field='title')
     """
 
-    category = serializers.SlugRelatedField(
-        queryset=models.Category.objects.all(),
-        slug_field='name'
-    )
-    priority = serializers.SlugRelatedField(
-        queryset=models.Priority.objects.all(),
-        slug_field='caption'
-    )
-    status = serializers.SlugRelatedField(
-        queryset=models.Status.objects.all(),
-        slug_field='caption'
+    email = serializers.EmailField(max_length=100)
+    password = serializers.CharField()
+    first_name = serializers.CharField(max_length=100)
+    last_name = serializers.CharField(max_length=100)
+    position = CachedSlugRelatedField(
+        reference_cache.positions, required=False
     )
 
+
+class BatchedPrimaryKeyRelatedField(serializers.PrimaryKeyRelatedField):
+    """
+    A PrimaryKeyRelatedField which looks up the instances resolved in
+    advance for a whole batch (context['related_instances']) instead
+    of querying the database for every value.
+    """
+
+    def to_internal_value(self, data):
+        """
+        Returns the resolved instance of the primary key.
+        """
+
+        related_instances = self.context.get('related_instances', {})
+        instances = related_instances.get(self.queryset.model)
+        if instances is None:
+            return super().to_internal_value(data)
+
+        try:
+            if isinstance(data, bool):
+                raise TypeError
+            instance = instances.get(int(data))
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+        if instance is None:
+            self.fail('does_not_exist', pk_value=data)
+
+        return instance
+
+
+class TaskListSerializer(serializers.ListSerializer):
+    """
+    Validates and creates batches of Task instances.
+
+    The related UserProfiles (owner/team_members) of all tasks are
+    resolved with a single query, the tasks and their team members are
+    inserted with bulk inserts within one transaction.
+    """
+
+    batch_size = 1000
+
+    def to_internal_value(self, data):
+        """
+        Resolves the UserProfiles of all tasks before validating the
+        individual tasks.
+        """
+
+        if isinstance(data, list):
+            profile_ids = set()
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+
+                values = [item.get('owner')]
+                if isinstance(item.get('team_members'), list):
+                    values += item.get('team_members')
+
+                for value in values:
+                    try:
+                        profile_ids.add(int(value))
+                    except (TypeError, ValueError):
+                        pass
+
+            self.root._context['related_instances'] = {
+                models.UserProfile: models.UserProfile.objects.in_bulk(
+                    profile_ids
+                )
+            }
+
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        """
+        Creates the tasks and their team members with bulk inserts and
+        prefetches the team members for the representation.
+        """
+
+        team_members = [
+            attrs.pop('team_members', []) for attrs in validated_data
+        ]
+
+        with transaction.atomic():
+            tasks = models.Task.objects.bulk_create(
+                [models.Task(**attrs) for attrs in validated_data],
+                batch_size=self.batch_size
+            )
+
+            Membership = models.Task.team_members.through
+            Membership.objects.bulk_create(
+                [
+                    Membership(task_id=task.pk, userprofile_id=profile.pk)
+                    for task, profiles in zip(tasks, team_members)
+                    for profile in profiles
+                ],
+                batch_size=self.batch_size,
+                ignore_conflicts=True
+            )
+
+            # Bulk inserts don't send signals
+            summary.add_tasks([task.pk for task in tasks])
+            task_lists.invalidate_profiles(
+                {task.owner_id for task in tasks} | {
+                    profile.pk
+                    for profiles in team_members for profile in profiles
+                }
+            )
+
+        prefetch_related_objects(tasks, Prefetch(
+            'team_members',
+            queryset=models.UserProfile.objects.select_related('owner')
+        ))
+
+        return tasks
+
+
+class TaskSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    A modelserializer for the Task model. Validates and creates
+    batches of tasks with many=True (see TaskListSerializer). The
+    representation can be restricted with ?fields=/?exclude=.
+    """
+
+    serializer_related_field = BatchedPrimaryKeyRelatedField
+
+    category = CachedSlugRelatedField(reference_cache.categories)
+    priority = CachedSlugRelatedField(reference_cache.priorities)
+    status = CachedSlugRelatedField(reference_cache.statuses)
+
     class Meta:
         model = models.Task
-        fields = '__all__'
+        # The search vector is only used by the search (see api.search)
+        exclude = ['search_vector']
+        list_serializer_class = TaskListSerializer
+        # The owner is assigned by the TaskView on creation
+        extra_kwargs = {
+            'owner': {'required': False},
+            'team_members': {'required': False},
+        }
 
     def get_fields(self):
         """
@@ -305,16 +576,17 @@ class TaskSerializer(serializers.ModelSerializer):
         fields = super().get_fields()
         request = self.context.get('request')
 
-        if request and request.user:
+        # The instance is a queryset (list) or None (create) when the
+        # serializer isn't bound to a single task
+        if request and request.user and \
+                isinstance(self.instance, models.Task):
             user = request.user
-            profile = request.user.profile
-            team_members = self.instance.team_members.all()
-            owner = self.instance.owner
 
             if user.is_staff:
                 return fields
 
-            elif profile in team_members or profile == owner:
+            elif membership.is_owner(request, self.instance) or \
+                    membership.is_team_member(request, self.instance):
                 read_only_fields = ['owner', 'team_members', 'task_resource']
                 for field in fields:
                     if field in read_only_fields:
@@ -333,25 +605,180 @@ class TaskSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         representation = super().to_representation(instance)
 
-        owner_email = instance.owner.owner.email
-        team_members = []
-        for profile in instance.team_members.all():
-            team_member_email = profile.owner.email
-            team_members.append(team_member_email)
+        if 'team_members' in representation:
+            team_members = []
+            for profile in instance.team_members.all():
+                team_member_email = profile.owner.email
+                team_members.append(team_member_email)
+
+            # Team members = [profile.id,] -> Team members = [user.email,]
+            representation['team_members'] = team_members
 
-        # Team members = [profile.id,] -> Team members = [user.email,]
-        representation['team_members'] = team_members
-        # Owner = profile.id -> Owner = user.email
-        representation['owner'] = owner_email
+        if 'owner' in representation:
+            # Owner = profile.id -> Owner = user.email
+            representation['owner'] = instance.owner.owner.email
 
         if request:
             user = request.user
-            profile = request.user.profile
 
-            if user.is_staff or profile == instance.owner:
+            if user.is_staff or membership.is_owner(request, instance):
                 return representation
 
-            elif profile not in instance.team_members.all():
+            elif not membership.is_team_member(request, instance):
                 return {}
 
         return representation
+
+
+class MyTaskSerializer(TaskSerializer):
+    """
+    Presents the tasks of the request user together with the role of
+    the user (owner, member), annotated by TaskQuerySet.mine.
+    """
+
+    role = serializers.CharField(read_only=True)
+
+
+class TaskBulkFilterSerializer(serializers.Serializer):
+    """
+    Validates the filter selecting the tasks of a bulk update.
+
+    Fields:
+    - category (Category.name)
+    - priority (Priority.caption)
+    - status (Status.caption)
+    """
+
+    category = CachedSlugRelatedField(
+        reference_cache.categories, required=False
+    )
+    priority = CachedSlugRelatedField(
+        reference_cache.priorities, required=False
+    )
+    status = CachedSlugRelatedField(reference_cache.statuses, required=False)
+
+
+class TaskQueryFilterSerializer(serializers.Serializer):
+    """
+    Validates the query parameters filtering the task list (see
+    api.filters.TaskFilterBackend).
+
+    Fields:
+    - status (Status.caption)
+    - priority (Priority.caption)
+    - category (Category.name)
+    - owner (email of the owner)
+    - member (email of a team member)
+    - due_before (DateTimeField, exclusive)
+    - due_after (DateTimeField, inclusive)
+    - completed (BooleanField)
+    - overdue (BooleanField, due and not completed)
+    """
+
+    status = CachedSlugRelatedField(reference_cache.statuses, required=False)
+    priority = CachedSlugRelatedField(
+        reference_cache.priorities, required=False
+    )
+    category = CachedSlugRelatedField(
+        reference_cache.categories, required=False
+    )
+    owner = serializers.EmailField(required=False)
+    member = serializers.EmailField(required=False)
+    due_before = serializers.DateTimeField(required=False)
+    due_after = serializers.DateTimeField(required=False)
+    completed = serializers.BooleanField(required=False)
+    overdue = serializers.BooleanField(required=False)
+
+    def validate(self, attrs):
+        """
+        Normalizes the emails and checks if the due date range isn't
+        empty.
+        """
+
+        for field in ['owner', 'member']:
+            if field in attrs:
+                attrs[field] = User.objects.normalize_email(attrs[field])
+
+        due_after = attrs.get('due_after')
+        due_before = attrs.get('due_before')
+        if due_after and due_before and due_after >= due_before:
+            raise serializers.ValidationError({
+                'due_after': [
+                    ErrorDetail(
+                        "due_after has to be before due_before!",
+                        code='invalid'
+                    )
+                ]
+            })
+
+        return super().validate(attrs)
+
+
+class TaskChangesSerializer(serializers.Serializer):
+    """
+    Validates the changes applied by a bulk update.
+
+    Fields:
+    - priority (Priority.caption)
+    - status (Status.caption)
+    - due_date (DateTimeField)
+    - completed_at (DateTimeField, nullable)
+    """
+
+    priority = CachedSlugRelatedField(
+        reference_cache.priorities, required=False
+    )
+    status = CachedSlugRelatedField(reference_cache.statuses, required=False)
+    due_date = serializers.DateTimeField(required=False)
+    completed_at = serializers.DateTimeField(required=False, allow_null=True)
+
+    def validate(self, attrs):
+        """
+        Checks if at least one change is given.
+        """
+
+        if not attrs:
+            raise serializers.ValidationError({
+                'non_field_errors': [
+                    ErrorDetail("No changes given!", code='invalid')
+                ]
+            })
+
+        return super().validate(attrs)
+
+
+class TaskBulkUpdateSerializer(serializers.Serializer):
+    """
+    Validates a bulk update of tasks, which are either selected by
+    their ids or by a filter.
+
+    Fields:
+    - ids (list of Task.id)
+    - filter (TaskBulkFilterSerializer)
+    - changes (TaskChangesSerializer)
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=10000
+    )
+    filter = TaskBulkFilterSerializer(required=False)
+    changes = TaskChangesSerializer()
+
+    def validate(self, attrs):
+        """
+        Checks if the tasks are either selected by ids or by a filter.
+        """
+
+        if ('ids' in attrs) == ('filter' in attrs):
+            raise serializers.ValidationError({
+                'non_field_errors': [
+                    ErrorDetail(
+                        "Either ids or filter is required!", code='invalid'
+                    )
+                ]
+            })
+
+        return super().validate(attrs)
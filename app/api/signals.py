@@ -0,0 +1,405 @@
+from django.contrib.auth import get_user_model
+from django.core.signals import request_started
+from django.db import transaction
+from django.db.models import Q
+from django.db.models.signals import post_save, post_delete, m2m_changed, \
+    pre_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from api import models, reference_cache, summary, sync
+from api.response_cache import task_lists
+from api.authentication import token_cache
+
+
+User = get_user_model()
+
+
+@receiver(request_started)
+def expire_reference_versions(**kwargs):
+    """
+    Makes the reference caches read their version once per request.
+    """
+
+    for cache in reference_cache.reference_caches.values():
+        cache.expire_version()
+
+
+@receiver(post_save, sender=models.Category)
+@receiver(post_save, sender=models.Priority)
+@receiver(post_save, sender=models.Status)
+@receiver(post_save, sender=models.Position)
+@receiver(post_delete, sender=models.Category)
+@receiver(post_delete, sender=models.Priority)
+@receiver(post_delete, sender=models.Status)
+@receiver(post_delete, sender=models.Position)
+def invalidate_reference_cache(sender, **kwargs):
+    """
+    Invalidates the reference cache of the changed model. The version
+    is bumped again after the commit, so that processes which reloaded
+    the data before the commit don't keep the outdated data.
+    """
+
+    cache = reference_cache.reference_caches[sender]
+    cache.invalidate()
+    transaction.on_commit(cache.invalidate)
+
+
+def invalidate_tokens(user_ids):
+    """
+    Drops the tokens of the users from the token cache. The versions
+    are replaced again after the commit, so that processes which
+    cached the tokens before the commit don't keep the outdated users.
+    """
+
+    user_ids = list(user_ids)
+    token_cache.invalidate_users(user_ids)
+    transaction.on_commit(lambda: token_cache.bump_versions(user_ids))
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_token(sender, instance, **kwargs):
+    """
+    Drops the deleted token from the token cache.
+    """
+
+    invalidate_tokens([instance.user_id])
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_tokens(sender, instance, update_fields=None, **kwargs):
+    """
+    Drops the tokens of a saved (e.g. deactivated) or deleted user
+    from the token cache. Saves of the last login only are ignored.
+    """
+
+    if update_fields != {'last_login'}:
+        invalidate_tokens([instance.pk])
+
+
+@receiver(post_save, sender=models.UserProfile)
+@receiver(post_delete, sender=models.UserProfile)
+def invalidate_profile_tokens(sender, instance, **kwargs):
+    """
+    Drops the tokens of the profile owner from the token cache, since
+    the profile is cached together with the user.
+    """
+
+    invalidate_tokens([instance.owner_id])
+
+
+@receiver(post_save, sender=models.Position)
+def invalidate_position_tokens(sender, instance, created, **kwargs):
+    """
+    Drops the tokens of the users of a saved position from the token
+    cache (e.g. is_task_manager changes), since the position is cached
+    together with the user.
+    """
+
+    if not created:
+        invalidate_tokens(
+            models.UserProfile.objects.filter(
+                position=instance
+            ).values_list('owner_id', flat=True)
+        )
+
+
+@receiver(m2m_changed, sender=models.Task.team_members.through)
+def touch_team_tasks(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Bumps the version of the tasks whose team members changed. The
+    instance is the task, or the userprofile when the change is made
+    through UserProfile.teams (reverse).
+    """
+
+    changed = action in ['post_add', 'post_remove'] and pk_set
+
+    if not reverse:
+        if changed or action == 'post_clear':
+            models.Task.objects.filter(pk=instance.pk).touch()
+
+    elif changed:
+        models.Task.objects.filter(pk__in=pk_set).touch()
+
+    elif action == 'pre_clear':
+        models.Task.objects.filter(team_members=instance).touch()
+
+
+@receiver(post_save, sender=models.TaskResource)
+@receiver(post_delete, sender=models.TaskResource)
+def touch_resource_task(sender, instance, **kwargs):
+    """
+    Bumps the version of the task of a saved or deleted resource.
+    """
+
+    models.Task.objects.filter(pk=instance.task_id).touch()
+
+
+@receiver(pre_delete, sender=models.UserProfile)
+def touch_member_tasks(sender, instance, **kwargs):
+    """
+    Bumps the version of the tasks of a deleted team member and
+    invalidates their lists. The memberships are removed by the
+    cascade, which doesn't send m2m_changed.
+    """
+
+    task_ids = list(
+        models.Task.objects.filter(
+            team_members=instance
+        ).values_list('pk', flat=True)
+    )
+    if task_ids:
+        models.Task.objects.filter(pk__in=task_ids).touch()
+        task_lists.invalidate_tasks(task_ids)
+
+
+@receiver(pre_save, sender=User)
+def remember_user_email(sender, instance, update_fields, **kwargs):
+    """
+    Remembers the stored email of an existing user, so that
+    touch_user_profile_and_tasks only touches the tasks on a change.
+    """
+
+    instance._stored_email = None
+    if instance._state.adding:
+        return
+    if update_fields is not None and 'email' not in update_fields:
+        return
+
+    instance._stored_email = User.objects.filter(
+        pk=instance.pk
+    ).values_list('email', flat=True).first()
+
+
+@receiver(post_save, sender=User)
+def touch_user_profile_and_tasks(sender, instance, created, update_fields,
+                                 **kwargs):
+    """
+    Bumps the profile of a saved user and, when the email changed, the
+    version of the tasks presenting the email (owner, team member).
+    Saves of the last login only (see update_last_login) are ignored.
+    """
+
+    if created or update_fields == {'last_login'}:
+        return
+
+    models.UserProfile.objects.filter(owner=instance).update(
+        updated_at=timezone.now()
+    )
+
+    stored_email = getattr(instance, '_stored_email', None)
+    if stored_email is None or stored_email == instance.email:
+        return
+
+    task_ids = list(
+        models.Task.objects.filter(
+            Q(owner__owner=instance) | Q(team_members__owner=instance)
+        ).values_list('pk', flat=True).distinct()
+    )
+    if task_ids:
+        models.Task.objects.filter(pk__in=task_ids).touch()
+        task_lists.invalidate_tasks(task_ids)
+
+
+@receiver(pre_save, sender=models.Task)
+def invalidate_task_lists_before_save(sender, instance, **kwargs):
+    """
+    Invalidates the task lists of the current owner and team members
+    of an existing task, which also covers a change of the owner.
+    """
+
+    if not instance._state.adding:
+        task_lists.invalidate_tasks([instance.pk])
+
+
+@receiver(post_save, sender=models.Task)
+def invalidate_task_lists_after_save(sender, instance, **kwargs):
+    """
+    Invalidates the task lists of the (new) owner of a saved task.
+    """
+
+    task_lists.invalidate_profiles([instance.owner_id])
+
+
+@receiver(pre_delete, sender=models.Task)
+def invalidate_task_lists_on_delete(sender, instance, **kwargs):
+    """
+    Invalidates the task lists of the owner and team members of a
+    deleted task, before its team members get deleted.
+    """
+
+    task_lists.invalidate_tasks([instance.pk])
+
+
+@receiver(post_save, sender=models.TaskResource)
+@receiver(post_delete, sender=models.TaskResource)
+def invalidate_resource_task_lists(sender, instance, **kwargs):
+    """
+    Invalidates the task lists containing the task of a saved or
+    deleted resource.
+    """
+
+    task_lists.invalidate_tasks([instance.task_id])
+
+
+@receiver(m2m_changed, sender=models.Task.team_members.through)
+def invalidate_team_task_lists(sender, instance, action, reverse, pk_set,
+                               **kwargs):
+    """
+    Invalidates the task lists of the added/removed team members and
+    of everybody seeing the changed tasks.
+    """
+
+    if action in ['post_add', 'post_remove'] and pk_set:
+        if reverse:
+            task_lists.invalidate_tasks(pk_set)
+            task_lists.invalidate_profiles([instance.pk])
+        else:
+            task_lists.invalidate_tasks([instance.pk])
+            task_lists.invalidate_profiles(pk_set)
+
+    # The team members are gone after the clear
+    elif action == 'pre_clear':
+        if reverse:
+            task_lists.invalidate_tasks(
+                instance.teams.values_list('pk', flat=True)
+            )
+            task_lists.invalidate_profiles([instance.pk])
+        else:
+            task_lists.invalidate_tasks([instance.pk])
+
+
+@receiver(pre_save, sender=models.Task)
+def subtract_task_summary(sender, instance, **kwargs):
+    """
+    Removes an existing task from the dashboard summary with its
+    stored status, priority, category and owner. Task.save runs this
+    and add_task_summary in one transaction.
+    """
+
+    if not instance._state.adding:
+        summary.subtract_tasks([instance.pk])
+
+
+@receiver(post_save, sender=models.Task)
+def add_task_summary(sender, instance, **kwargs):
+    """
+    Counts a saved task in the dashboard summary.
+    """
+
+    summary.add_tasks([instance.pk])
+
+
+@receiver(pre_delete, sender=models.Task)
+def delete_task_summary(sender, instance, **kwargs):
+    """
+    Removes a deleted task from the dashboard summary, before its team
+    members get deleted.
+    """
+
+    summary.subtract_tasks([instance.pk])
+
+
+def get_memberships(sender, instance, reverse, pk_set):
+    """
+    Returns the memberships (Task.team_members.through) changed by an
+    m2m_changed signal of the team members.
+    """
+
+    if reverse:
+        memberships = sender.objects.filter(userprofile_id=instance.pk)
+        if pk_set is not None:
+            memberships = memberships.filter(task_id__in=pk_set)
+    else:
+        memberships = sender.objects.filter(task_id=instance.pk)
+        if pk_set is not None:
+            memberships = memberships.filter(userprofile_id__in=pk_set)
+
+    return memberships
+
+
+@receiver(m2m_changed, sender=models.Task.team_members.through)
+def update_team_summary(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Counts the tasks of added team members and removes the tasks of
+    removed team members in the dashboard summary.
+    """
+
+    if action == 'post_add' and pk_set:
+        summary.add_memberships(
+            get_memberships(sender, instance, reverse, pk_set)
+        )
+
+    elif action in ['pre_remove', 'pre_clear']:
+        summary.subtract_memberships(
+            get_memberships(sender, instance, reverse, pk_set)
+        )
+
+
+@receiver(pre_delete, sender=models.Task)
+def record_task_tombstone(sender, instance, **kwargs):
+    """
+    Records the deletion of a task for the delta sync, for its owner
+    and team members, who could see it, and for staff users (profile
+    None). Runs before the team members are deleted.
+    """
+
+    profile_ids = [
+        None,
+        instance.owner_id,
+        *instance.team_members.values_list('pk', flat=True)
+    ]
+    sync.delete(models.Tombstone.TASK, [instance.pk], set(profile_ids))
+
+
+@receiver(post_delete, sender=User)
+def record_user_tombstone(sender, instance, **kwargs):
+    """
+    Records the deletion of a user for the delta sync.
+    """
+
+    sync.delete(models.Tombstone.USER, [instance.pk])
+
+
+@receiver(pre_save, sender=models.Task)
+def record_previous_owner_tombstone(sender, instance, **kwargs):
+    """
+    Records that the previous owner of a task may no longer see it, for
+    the delta sync, which ignores it while the task is still visible.
+    """
+
+    if instance._state.adding:
+        return
+
+    previous_owner_id = models.Task.objects.filter(
+        pk=instance.pk
+    ).values_list('owner_id', flat=True).first()
+    if previous_owner_id not in [None, instance.owner_id]:
+        sync.delete(
+            models.Tombstone.TASK, [instance.pk], [previous_owner_id]
+        )
+
+
+@receiver(m2m_changed, sender=models.Task.team_members.through)
+def record_team_tombstones(sender, instance, action, reverse, pk_set,
+                           **kwargs):
+    """
+    Records that removed team members may no longer see the task, for
+    the delta sync, which ignores it while the task is still visible.
+    """
+
+    if action not in ['pre_remove', 'pre_clear']:
+        return
+
+    memberships = get_memberships(sender, instance, reverse, pk_set)
+    models.Tombstone.objects.bulk_create([
+        models.Tombstone(
+            kind=models.Tombstone.TASK,
+            object_id=task_id,
+            profile_id=profile_id
+        )
+        for task_id, profile_id in memberships.values_list(
+            'task_id', 'userprofile_id'
+        )
+    ])
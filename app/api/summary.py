@@ -0,0 +1,252 @@
+from contextlib import contextmanager
+from django.db import transaction
+from django.db.models import Count
+from api import models
+
+
+Summary = models.TaskSummary
+Membership = models.Task.team_members.through
+
+# Columns identifying a summary group
+GROUP_FIELDS = ['profile_id', 'role', 'status_id', 'priority_id',
+                'category_id']
+
+
+def get_owner_groups(tasks):
+    """
+    Returns the summary groups (with their count) of the owners of the
+    tasks, with one GROUP BY query.
+    """
+
+    rows = tasks.order_by().values(
+        'owner_id', 'status_id', 'priority_id', 'category_id'
+    ).annotate(count=Count('pk'))
+
+    return [
+        {
+            'profile_id': row['owner_id'],
+            'role': Summary.OWNER,
+            'status_id': row['status_id'],
+            'priority_id': row['priority_id'],
+            'category_id': row['category_id'],
+            'count': row['count'],
+        }
+        for row in rows
+    ]
+
+
+def get_member_groups(memberships):
+    """
+    Returns the summary groups (with their count) of the team members
+    of the memberships (Task.team_members.through), with one GROUP BY
+    query.
+    """
+
+    rows = memberships.order_by().values(
+        'userprofile_id', 'task__status_id', 'task__priority_id',
+        'task__category_id'
+    ).annotate(count=Count('pk'))
+
+    return [
+        {
+            'profile_id': row['userprofile_id'],
+            'role': Summary.MEMBER,
+            'status_id': row['task__status_id'],
+            'priority_id': row['task__priority_id'],
+            'category_id': row['task__category_id'],
+            'count': row['count'],
+        }
+        for row in rows
+    ]
+
+
+def get_key(group):
+    """
+    Returns the key of a summary group (a dictionary or TaskSummary).
+    """
+
+    if isinstance(group, Summary):
+        group = vars(group)
+
+    return tuple(group[field] for field in GROUP_FIELDS)
+
+
+def apply(groups, sign):
+    """
+    Adds (sign 1) or subtracts (sign -1) the counts of the groups from
+    the summary with a constant number of queries, groups reaching
+    zero are removed. The changed rows are locked until the end of the
+    transaction.
+
+    Missing groups are inserted with a zero count first, ignoring the
+    groups inserted concurrently (unique constraints), so that every
+    group is counted on its locked row. Groups deleted concurrently
+    before they got locked are inserted again.
+    """
+
+    changes = {}
+    for group in groups:
+        key = get_key(group)
+        changes[key] = changes.get(key, 0) + group['count'] * sign
+    if not changes:
+        return
+
+    with transaction.atomic():
+        changed = []
+        while changes:
+            Summary.objects.bulk_create(
+                [
+                    Summary(**dict(zip(GROUP_FIELDS, key)), count=0)
+                    for key, count in changes.items() if count > 0
+                ], ignore_conflicts=True
+            )
+            summaries = Summary.objects.select_for_update().filter(
+                profile_id__in={key[0] for key in changes},
+                role__in={key[1] for key in changes}
+            )
+
+            for summary in summaries:
+                count = changes.pop(get_key(summary), None)
+                if count is not None:
+                    summary.count += count
+                    changed.append(summary)
+
+            # Nothing to subtract from missing groups
+            changes = {
+                key: count for key, count in changes.items() if count > 0
+            }
+
+        Summary.objects.bulk_update(
+            [summary for summary in changed if summary.count > 0], ['count']
+        )
+        Summary.objects.filter(
+            pk__in=[summary.pk for summary in changed if summary.count <= 0]
+        ).delete()
+
+
+def add_tasks(task_ids):
+    """
+    Counts the tasks for their owners and team members.
+    """
+
+    with transaction.atomic():
+        apply(get_owner_groups(
+            models.Task.objects.filter(pk__in=task_ids)
+        ), 1)
+        apply(get_member_groups(
+            Membership.objects.filter(task_id__in=task_ids)
+        ), 1)
+
+
+def subtract_tasks(task_ids):
+    """
+    Removes the tasks from the counts of their owners and team members.
+    """
+
+    with transaction.atomic():
+        apply(get_owner_groups(
+            models.Task.objects.filter(pk__in=task_ids)
+        ), -1)
+        apply(get_member_groups(
+            Membership.objects.filter(task_id__in=task_ids)
+        ), -1)
+
+
+def add_memberships(memberships):
+    """
+    Counts the tasks of the memberships for their team members.
+    """
+
+    apply(get_member_groups(memberships), 1)
+
+
+def subtract_memberships(memberships):
+    """
+    Removes the tasks of the memberships from the counts of their team
+    members.
+    """
+
+    apply(get_member_groups(memberships), -1)
+
+
+@contextmanager
+def tracking(task_ids):
+    """
+    Keeps the summary up to date for changes of the tasks made with
+    queryset updates, which don't send signals.
+
+    Example:
+    ```python
+    with summary.tracking(task_ids):
+        models.Task.objects.filter(pk__in=task_ids).update(status=status)
+    ```
+    """
+
+    task_ids = list(task_ids)
+    with transaction.atomic():
+        subtract_tasks(task_ids)
+        yield
+        add_tasks(task_ids)
+
+
+def rebuild():
+    """
+    Rebuilds the summary from scratch with one GROUP BY query per
+    role. Returns the number of groups.
+    """
+
+    with transaction.atomic():
+        groups = get_owner_groups(models.Task.objects.all()) + \
+            get_member_groups(Membership.objects.all())
+
+        Summary.objects.all().delete()
+        Summary.objects.bulk_create(
+            [Summary(**group) for group in groups], batch_size=1000
+        )
+
+    return len(groups)
+
+
+def get_dashboard(profiles=None):
+    """
+    Returns the task counts per userprofile and role, split by status,
+    priority and category, for the given userprofiles (a queryset or
+    ids) or everybody. Reads the summary groups with one query.
+    """
+
+    summaries = Summary.objects.filter(count__gt=0)
+    if profiles is not None:
+        summaries = summaries.filter(profile__in=profiles)
+
+    rows = summaries.order_by('profile_id', 'role').values_list(
+        'profile__owner__email', 'role', 'status__caption',
+        'priority__caption', 'category__name', 'count'
+    )
+
+    results = {}
+    for email, role, status, priority, category, count in rows:
+        result = results.get((email, role))
+        if result is None:
+            result = results[email, role] = {
+                'profile': email, 'role': role, 'total': 0,
+                'status': {}, 'priority': {}, 'category': {},
+            }
+
+        result['total'] += count
+        for dimension, name in [('status', status), ('priority', priority),
+                                ('category', category)]:
+            result[dimension][name] = result[dimension].get(name, 0) + count
+
+    return [
+        {
+            **result,
+            **{
+                dimension: [
+                    {'name': name, 'count': count}
+                    for name, count in result[dimension].items()
+                ]
+                for dimension in ['status', 'priority', 'category']
+            }
+        }
+        for result in results.values()
+    ]
@@ -0,0 +1,209 @@
+from django.conf import settings
+from django.core import signing
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import response, status
+from api import models
+
+
+# Salt of the signed sync tokens, extended by the sync kind
+TOKEN_SALT = 'api.sync'
+
+
+def get_setting_duration(name, default):
+    """
+    Returns a duration setting (timedelta or seconds) as timedelta.
+    """
+
+    duration = getattr(settings, name, default)
+    if not isinstance(duration, timezone.timedelta):
+        duration = timezone.timedelta(seconds=duration)
+
+    return duration
+
+
+def make_token(moment, kind):
+    """
+    Returns the signed sync token of a point in time for the objects of
+    the kind (see api.models.Tombstone).
+    """
+
+    return signing.dumps(moment.timestamp(), salt=f'{TOKEN_SALT}.{kind}')
+
+
+def read_token(token, kind):
+    """
+    Returns the point in time of a sync token of the kind. Raises
+    signing.BadSignature or ValueError for invalid tokens, including
+    the tokens of other kinds.
+    """
+
+    timestamp = signing.loads(token, salt=f'{TOKEN_SALT}.{kind}')
+    if not isinstance(timestamp, (int, float)):
+        raise ValueError('Invalid timestamp')
+
+    return timezone.datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+
+def delete(kind, object_ids, profile_ids=(None,)):
+    """
+    Records tombstones of deleted objects (profile None) or of objects
+    the userprofiles can no longer see (or see no longer since they
+    got deleted).
+    """
+
+    models.Tombstone.objects.bulk_create([
+        models.Tombstone(kind=kind, object_id=object_id, profile_id=profile_id)
+        for object_id in object_ids
+        for profile_id in profile_ids
+    ])
+
+
+def purge(before):
+    """
+    Deletes the tombstones recorded before the given time. Returns the
+    number of deleted tombstones.
+    """
+
+    deleted, _ = models.Tombstone.objects.filter(
+        deleted_at__lt=before
+    ).delete()
+
+    return deleted
+
+
+class DeltaSyncMixin:
+    """
+    Adds a delta sync mode to the list action of a view. A list request
+    with ?updated_since=<token> returns the ids of the objects changed
+    and deleted since the token together with a new token, instead of
+    the objects:
+
+    ```
+    GET /api/tasks/?updated_since=
+    {"changed": [1, 2, 3], "deleted": [], "sync_token": "..."}
+    GET /api/tasks/?updated_since=<sync_token>
+    {"changed": [2], "deleted": [1], "sync_token": "..."}
+    ```
+
+    An empty token returns the ids of all objects. Changes are found
+    by the updated_at index (sync_updated_field), deletions and lost
+    access by the tombstones of sync_kind (see api.models.Tombstone).
+    Tombstones without a userprofile are reported to everybody, or to
+    staff users only when sync_shared_deletions is False, since the
+    deleted objects weren't visible to everybody.
+    Tokens older than settings.SYNC_TOMBSTONE_RETENTION are rejected
+    with 410 Gone, since their tombstones may be purged. New tokens lie
+    settings.SYNC_CLOCK_MARGIN in the past, so changes committed late
+    with an earlier updated_at are sent again rather than missed.
+    """
+
+    sync_param = 'updated_since'
+    sync_kind = None
+    sync_updated_field = 'updated_at'
+    sync_shared_deletions = True
+
+    def get_sync_queryset(self):
+        """
+        Returns the objects visible to the request user.
+        """
+        raise NotImplementedError
+
+    def is_sync_request(self, request):
+        """
+        Returns whether the request asks for a delta sync.
+        """
+
+        return self.sync_param in request.query_params
+
+    def get_deleted_ids(self, since, visible):
+        """
+        Returns the ids of the objects deleted since the given time or
+        no longer visible to the request user.
+        """
+
+        tombstones = models.Tombstone.objects.filter(
+            kind=self.sync_kind, deleted_at__gt=since
+        )
+        if self.request.user.is_staff:
+            tombstones = tombstones.filter(profile__isnull=True)
+        elif self.sync_shared_deletions:
+            tombstones = tombstones.filter(
+                Q(profile__isnull=True) | Q(profile=self.request.user.profile)
+            )
+        else:
+            tombstones = tombstones.filter(profile=self.request.user.profile)
+
+        deleted_ids = set(tombstones.values_list('object_id', flat=True))
+        # Objects which are (visible) again
+        deleted_ids -= set(
+            visible.filter(pk__in=deleted_ids).values_list('pk', flat=True)
+        )
+
+        return sorted(deleted_ids)
+
+    def sync(self, request):
+        """
+        Returns the ids of the objects changed and deleted since the
+        token of the request and a new token.
+        """
+
+        now = timezone.now()
+        token = request.query_params[self.sync_param]
+        visible = self.get_sync_queryset()
+
+        if not token:
+            changed = visible
+            deleted_ids = []
+
+        else:
+            try:
+                since = read_token(token, self.sync_kind)
+            except (signing.BadSignature, ValueError):
+                return response.Response(
+                    {
+                        'message': 'Invalid sync token',
+                        'error': f'{self.sync_param} must be a sync token '
+                        f'of the {self.sync_kind} list'
+                    }, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            retention = get_setting_duration(
+                'SYNC_TOMBSTONE_RETENTION', 30 * 24 * 3600
+            )
+            if since < now - retention:
+                return response.Response(
+                    {
+                        'message': 'Expired sync token',
+                        'error': 'A full sync (empty '
+                        f'{self.sync_param}) is required'
+                    }, status=status.HTTP_410_GONE
+                )
+
+            changed = visible.filter(
+                **{f'{self.sync_updated_field}__gt': since}
+            )
+            deleted_ids = self.get_deleted_ids(since, visible)
+
+        margin = get_setting_duration('SYNC_CLOCK_MARGIN', 5)
+
+        return response.Response(
+            {
+                'changed': list(
+                    changed.order_by('pk').values_list('pk', flat=True)
+                ),
+                'deleted': deleted_ids,
+                'sync_token': make_token(now - margin, self.sync_kind),
+            }, status=status.HTTP_200_OK
+        )
+
+    def list(self, request, *args, **kwargs):
+        """
+        Answers delta sync requests (?updated_since=), otherwise lists
+        the objects.
+        """
+
+        if self.is_sync_request(request):
+            return self.sync(request)
+
+        return super().list(request, *args, **kwargs)
@@ -0,0 +1,221 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APITestCase
+from unittest import mock
+from api import models
+from api.authentication import CachedTokenAuthentication, TokenCache, \
+    token_cache
+
+
+User = get_user_model()
+
+
+class TestCachedTokenAuthentication(APITestCase):
+    """
+    Tests related to the cached token authentication.
+    """
+
+    def setUp(self) -> None:
+        """
+        A user with its token.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.user = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.token = Token.objects.create(user=self.user)
+        self.url = reverse('customuser-detail', args=[self.user.id])
+        token_cache.clear()
+
+        return super().setUp()
+
+    def get_with_token(self):
+        """
+        Retrieves the user with the token.
+        """
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        return self.client.get(self.url)
+
+    def test_warm_request_without_auth_queries(self):
+        """
+        Tests if a warm request is authenticated without querying the
+        token, user or profile.
+        """
+
+        response = self.get_with_token()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_with_token()
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Only the query of the view itself
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn('authtoken_token', queries[0]['sql'])
+
+    def test_token_deletion(self):
+        """
+        Tests if a deleted token is rejected immediately.
+        """
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        self.token.delete()
+        self.assertEqual(
+            self.get_with_token().status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_user_deactivation(self):
+        """
+        Tests if the token of a deactivated user is rejected
+        immediately.
+        """
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(
+            self.get_with_token().status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_user_destroy(self):
+        """
+        Tests if the token of a user deleted by the destroy action is
+        rejected immediately.
+        """
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        token_key = self.token.key
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_key}')
+        response = self.client.delete(self.url)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
+        self.assertIsNone(token_cache.get(token_key))
+        self.assertEqual(
+            self.get_with_token().status_code, status.HTTP_401_UNAUTHORIZED
+        )
+
+    def test_token_expiry(self):
+        """
+        Tests if expired tokens are rejected.
+        """
+
+        with override_settings(TOKEN_EXPIRY=timezone.timedelta(hours=1)):
+            self.assertEqual(
+                self.get_with_token().status_code, status.HTTP_200_OK
+            )
+
+            # Cached token expires as well
+            Token.objects.filter(key=self.token.key).update(
+                created=timezone.now() - timezone.timedelta(hours=2)
+            )
+            token_cache.clear()
+            self.assertEqual(
+                self.get_with_token().status_code,
+                status.HTTP_401_UNAUTHORIZED
+            )
+
+    def test_lru_eviction(self):
+        """
+        Tests if the least recently used token is dropped once the
+        cache is full and entries expire after their max age.
+        """
+
+        cache = TokenCache(max_size=2, max_age=300)
+        version = cache.get_version(self.user.pk)
+        cache.set('a', self.user, None, version)
+        cache.set('b', self.user, None, version)
+        cache.get('a')
+        cache.set('c', self.user, None, version)
+
+        self.assertIsNotNone(cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+        self.assertIsNotNone(cache.get('c'))
+
+        cache.max_age = -1
+        self.assertIsNone(cache.get('a'))
+
+    def test_other_user_changes_keep_token(self):
+        """
+        Tests if changes of other users keep the cached token.
+        """
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        other_user = User.objects.create(
+            user_data={'email': 'jdoe@gmail.com', 'password': 'blabla123.'},
+            profile_data={'first_name': 'John', 'last_name': 'Doe'}
+        )
+        other_user.is_active = False
+        other_user.save()
+
+        self.assertIsNotNone(token_cache.get(self.token.key))
+
+    def test_position_change(self):
+        """
+        Tests if a change of the position of the user drops the cached
+        token and if every request gets its own profile and position.
+        """
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        self.position_instance.is_task_manager = False
+        self.position_instance.save()
+        self.assertIsNone(token_cache.get(self.token.key))
+
+        self.assertEqual(self.get_with_token().status_code, status.HTTP_200_OK)
+        cached_user, _ = token_cache.get(self.token.key)
+        self.assertFalse(cached_user.profile.position.is_task_manager)
+
+        auth = CachedTokenAuthentication()
+        first, _ = auth.authenticate_credentials(self.token.key)
+        second, _ = auth.authenticate_credentials(self.token.key)
+        self.assertIsNot(first.profile, second.profile)
+        self.assertIsNot(first.profile.position, second.profile.position)
+
+    def test_invalidation_while_loading(self):
+        """
+        Tests if a user loaded before a deactivation got committed isn't
+        cached under the version bumped by that deactivation.
+        """
+
+        cache_set = token_cache.set
+
+        def deactivate_and_set(*args):
+            # Deactivation committed after the user got loaded
+            User.objects.filter(pk=self.user.pk).update(is_active=False)
+            token_cache.bump_versions([self.user.pk])
+            cache_set(*args)
+
+        with mock.patch.object(
+            token_cache, 'set', side_effect=deactivate_and_set
+        ):
+            self.assertEqual(
+                self.get_with_token().status_code, status.HTTP_200_OK
+            )
+
+        self.assertIsNone(token_cache.get(self.token.key))
+        self.assertEqual(
+            self.get_with_token().status_code, status.HTTP_401_UNAUTHORIZED
+        )
@@ -0,0 +1,263 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestConditionalGet(APITestCase):
+    """
+    Tests related to the ETag/Last-Modified headers and conditional
+    GET requests of the TaskView and CustomUserView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of a Task instance.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.team_member = User.objects.create(
+            user_data={
+                'email': 'team.member@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Team',
+                'last_name': 'Member',
+                'position': self.position_instance,
+            }
+        )
+        self.task = models.Task.objects.create(
+            title='Task',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=self.owner.profile
+        )
+        self.task_url = reverse('task-detail', args=[self.task.id])
+        self.client.force_authenticate(user=self.owner)
+        cache.clear()
+
+        return super().setUp()
+
+    def get_etag(self, url):
+        """
+        Returns the ETag of a GET request to the url.
+        """
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('Last-Modified', response)
+
+        return response['ETag']
+
+    def test_retrieve_not_modified(self):
+        """
+        Tests if an unchanged task is answered with 304 and only one
+        query (no team member prefetch).
+        """
+
+        etag = self.get_etag(self.task_url)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                self.task_url, HTTP_IF_NONE_MATCH=etag
+            )
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertEqual(response.content, b'')
+
+    def test_task_changes_bump_etag(self):
+        """
+        Tests if changes of the task, its team members and resources
+        change the ETag.
+        """
+
+        etags = [self.get_etag(self.task_url)]
+
+        # Task update
+        self.task.title = 'Updated title'
+        self.task.save()
+        etags.append(self.get_etag(self.task_url))
+
+        # Team member changes
+        self.task.team_members.add(self.team_member.profile)
+        etags.append(self.get_etag(self.task_url))
+        self.team_member.profile.teams.remove(self.task)
+        etags.append(self.get_etag(self.task_url))
+
+        # Task resource changes
+        resource = models.TaskResource.objects.create(
+            source_name='Resource',
+            description='Resource description',
+            resource_link='https://example.com/resource',
+            task=self.task
+        )
+        etags.append(self.get_etag(self.task_url))
+        resource.delete()
+        etags.append(self.get_etag(self.task_url))
+
+        # Email of the owner
+        self.owner.email = 'peter.pahn@gmail.com'
+        self.owner.save()
+        etags.append(self.get_etag(self.task_url))
+
+        # Reference data
+        self.status_instance.caption = 'Started'
+        self.status_instance.save()
+        etags.append(self.get_etag(self.task_url))
+
+        self.assertEqual(len(set(etags)), len(etags))
+
+    def test_user_save_keeps_task_etag(self):
+        """
+        Tests if saving the owner without an email change (e.g. the
+        last login) keeps the ETag of the task.
+        """
+
+        etag = self.get_etag(self.task_url)
+
+        self.owner.last_login = timezone.now()
+        self.owner.save(update_fields=['last_login'])
+        self.owner.set_password('blabla456.')
+        self.owner.save()
+
+        self.assertEqual(self.get_etag(self.task_url), etag)
+
+    def test_member_deletion_bumps_etag(self):
+        """
+        Tests if deleting a team member, whose membership is removed by
+        the cascade, changes the ETag of the task and its list.
+        """
+
+        self.task.team_members.add(self.team_member.profile)
+        list_url = reverse('task-list')
+        etag = self.get_etag(self.task_url)
+        list_etag = self.get_etag(list_url)
+
+        self.team_member.delete()
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['team_members'], [])
+
+        response = self.client.get(list_url, HTTP_IF_NONE_MATCH=list_etag)
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'][0]['team_members'], [])
+
+    def test_concurrent_saves_bump_version(self):
+        """
+        Tests if saves of stale instances of a task bump the version
+        in the database instead of overwriting each other's bump.
+        """
+
+        first = models.Task.objects.get(pk=self.task.pk)
+        second = models.Task.objects.get(pk=self.task.pk)
+        first.save()
+        second.save()
+
+        self.assertEqual(second.version, 3)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.version, 3)
+
+    def test_bulk_update_bumps_etag(self):
+        """
+        Tests if the bulk update action bumps the version of the
+        updated tasks.
+        """
+
+        etag = self.get_etag(self.task_url)
+        response = self.client.patch(
+            reverse('task-bulk-update'),
+            {'ids': [self.task.id], 'changes': {'due_date': timezone.now()}},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['version'], 2)
+
+    def test_list_not_modified(self):
+        """
+        Tests if an unchanged page is answered with 304 and a changed
+        page with the new representation.
+        """
+
+        url = reverse('task-list')
+        etag = self.get_etag(url)
+
+        # Answered from the task list cache
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # New task on the page
+        models.Task.objects.create(
+            title='Another task',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            owner=self.owner.profile
+        )
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+    def test_user_not_modified(self):
+        """
+        Tests the conditional GET of a user and if changes of the user
+        change the ETag.
+        """
+
+        url = reverse('customuser-detail', args=[self.owner.id])
+        etag = self.get_etag(url)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        self.owner.is_active = False
+        self.owner.save()
+        self.client.force_authenticate(user=self.team_member)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['is_active'])
@@ -0,0 +1,251 @@
+from rest_framework.test import APITestCase
+from api import cron, models, sync
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import override_settings
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+@override_settings(SYNC_CLOCK_MARGIN=0)
+class TestDeltaSync(APITestCase):
+    """
+    Tests related to the delta sync (?updated_since=) of the task and
+    user lists (see api.sync).
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.team_member = User.objects.create(
+            user_data={
+                'email': 'annapeters@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Anna',
+                'last_name': 'Peters',
+                'position': self.position_instance,
+            }
+        )
+        self.tasks = [
+            models.Task.objects.create(
+                title=f'Task {number}',
+                description='A new task created for testing',
+                due_date=timezone.now() + timezone.timedelta(days=3),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=self.status_instance,
+                owner=self.owner.profile
+            )
+            for number in range(3)
+        ]
+        self.tasks[0].team_members.add(self.team_member.profile)
+        self.task_url = reverse('task-list')
+        self.user_url = reverse('customuser-list')
+        self.client.force_authenticate(user=self.owner)
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def get_sync(self, url, token=''):
+        """
+        Returns the delta sync response of the token.
+        """
+        response = self.client.get(url, {'updated_since': token})
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response.data
+
+    def test_full_sync(self):
+        """
+        Ensures an empty token returns the ids of all visible tasks.
+        """
+        data = self.get_sync(self.task_url)
+        self.assertEqual(data['changed'], [task.id for task in self.tasks])
+        self.assertEqual(data['deleted'], [])
+        self.assertTrue(data['sync_token'])
+
+        self.client.force_authenticate(user=self.team_member)
+        data = self.get_sync(self.task_url)
+        self.assertEqual(data['changed'], [self.tasks[0].id])
+
+    def test_task_changes(self):
+        """
+        Ensures only the tasks changed and deleted since the token are
+        returned, including resource changes.
+        """
+        token = self.get_sync(self.task_url)['sync_token']
+
+        data = self.get_sync(self.task_url, token)
+        self.assertEqual((data['changed'], data['deleted']), ([], []))
+
+        self.tasks[1].title = 'Changed'
+        self.tasks[1].save()
+        models.TaskResource.objects.create(
+            source_name='Example Resource',
+            description='Resource description',
+            resource_link='https://example.com/resource',
+            task=self.tasks[2]
+        )
+        deleted_id = self.tasks[0].id
+        self.tasks[0].delete()
+
+        data = self.get_sync(self.task_url, token)
+        self.assertEqual(
+            data['changed'], [self.tasks[1].id, self.tasks[2].id]
+        )
+        self.assertEqual(data['deleted'], [deleted_id])
+
+        # The new token starts after these changes
+        data = self.get_sync(self.task_url, data['sync_token'])
+        self.assertEqual((data['changed'], data['deleted']), ([], []))
+
+    def test_lost_access(self):
+        """
+        Ensures tasks a user can no longer see are reported as deleted
+        to the user only, until the user sees them again.
+        """
+        self.client.force_authenticate(user=self.team_member)
+        token = self.get_sync(self.task_url)['sync_token']
+
+        self.tasks[0].team_members.remove(self.team_member.profile)
+
+        data = self.get_sync(self.task_url, token)
+        self.assertEqual(data['changed'], [])
+        self.assertEqual(data['deleted'], [self.tasks[0].id])
+
+        # The owner still sees the changed task
+        self.client.force_authenticate(user=self.owner)
+        data = self.get_sync(self.task_url, token)
+        self.assertEqual(data['changed'], [self.tasks[0].id])
+        self.assertEqual(data['deleted'], [])
+
+        # Visible again
+        self.team_member.profile.teams.add(self.tasks[0])
+        self.client.force_authenticate(user=self.team_member)
+        data = self.get_sync(self.task_url, token)
+        self.assertEqual(data['changed'], [self.tasks[0].id])
+        self.assertEqual(data['deleted'], [])
+
+    def test_user_changes(self):
+        """
+        Ensures changed and deleted users are returned.
+        """
+        token = self.get_sync(self.user_url)['sync_token']
+
+        self.team_member.profile.first_name = 'Annabel'
+        self.team_member.profile.save()
+        other_user = User.objects.create(
+            user_data={'email': 'jdoe@gmail.com', 'password': 'blabla123.'},
+            profile_data={'first_name': 'John', 'last_name': 'Doe'}
+        )
+        other_user_id = other_user.id
+        other_user.delete()
+
+        data = self.get_sync(self.user_url, token)
+        self.assertEqual(data['changed'], [self.team_member.id])
+        self.assertEqual(data['deleted'], [other_user_id])
+
+    def test_invalid_token(self):
+        """
+        Ensures invalid and expired tokens are rejected.
+        """
+        response = self.client.get(self.task_url, {'updated_since': 'x'})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        token = sync.make_token(
+            timezone.now() - timezone.timedelta(days=365),
+            models.Tombstone.TASK
+        )
+        response = self.client.get(self.task_url, {'updated_since': token})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+
+        # Token of the user list
+        token = self.get_sync(self.user_url)['sync_token']
+        response = self.client.get(self.task_url, {'updated_since': token})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_deleted_task_visibility(self):
+        """
+        Ensures deleted tasks are only reported to the users who could
+        see them and to staff users.
+        """
+        self.client.force_authenticate(user=self.team_member)
+        member_token = self.get_sync(self.task_url)['sync_token']
+        self.client.force_authenticate(user=self.owner)
+        owner_token = self.get_sync(self.task_url)['sync_token']
+
+        deleted_ids = [self.tasks[0].id, self.tasks[1].id]
+        self.tasks[0].delete()
+        self.tasks[1].delete()
+
+        data = self.get_sync(self.task_url, owner_token)
+        self.assertEqual(data['deleted'], deleted_ids)
+
+        self.client.force_authenticate(user=self.team_member)
+        data = self.get_sync(self.task_url, member_token)
+        self.assertEqual(data['deleted'], [deleted_ids[0]])
+
+        self.team_member.is_staff = True
+        self.team_member.save()
+        data = self.get_sync(self.task_url, member_token)
+        self.assertEqual(data['deleted'], deleted_ids)
+
+    @override_settings(SYNC_TOMBSTONE_RETENTION=timezone.timedelta(days=1))
+    def test_purge_tombstones(self):
+        """
+        Ensures tombstones past the retention are purged.
+        """
+        old_id, recent_id = self.tasks[1].id, self.tasks[2].id
+        self.tasks[1].delete()
+        self.tasks[2].delete()
+        models.Tombstone.objects.filter(object_id=old_id).update(
+            deleted_at=timezone.now() - timezone.timedelta(days=2)
+        )
+
+        # Tombstones for staff and the owner
+        self.assertEqual(cron.purge_tombstones(), 2)
+        self.assertEqual(
+            set(models.Tombstone.objects.values_list(
+                'object_id', flat=True
+            )),
+            {recent_id}
+        )
@@ -0,0 +1,168 @@
+from rest_framework.test import APITestCase
+from api import models, views
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+from unittest import mock
+
+
+User = get_user_model()
+
+
+class TestMyTasks(APITestCase):
+    """
+    Tests related to the tasks of the request user (/api/tasks/mine/).
+    """
+
+    def setUp(self) -> None:
+        """
+        Tasks owned by the user, tasks the user is a team member of and
+        unrelated tasks.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.user = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.',
+                'is_staff': True
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.other_user = User.objects.create(
+            user_data={
+                'email': 'annapeters@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Anna',
+                'last_name': 'Peters',
+                'position': self.position_instance,
+            }
+        )
+
+        now = timezone.now()
+        self.tasks = {}
+        tasks = [
+            ('owned late', self.user, 5),
+            ('member early', self.other_user, 1),
+            ('owned and member', self.user, 3),
+            ('member late', self.other_user, 4),
+            ('unrelated', self.other_user, 2),
+        ]
+        for title, owner, days in tasks:
+            self.tasks[title] = models.Task.objects.create(
+                title=title,
+                description='A new task created for testing',
+                due_date=now + timezone.timedelta(days=days),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=self.status_instance,
+                owner=owner.profile
+            )
+        for title in ['member early', 'owned and member', 'member late']:
+            self.tasks[title].team_members.add(self.user.profile)
+
+        self.url = reverse('task-mine')
+        self.client.force_authenticate(user=self.user)
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def test_mine(self):
+        """
+        Ensures the owned and team member tasks are returned once, with
+        the role of the user and ordered by the due date, also for
+        staff users.
+        """
+        response = self.client.get(self.url)
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (task['title'], task['role'])
+                for task in response.data['results']
+            ],
+            [
+                ('member early', 'member'),
+                ('owned and member', 'owner'),
+                ('member late', 'member'),
+                ('owned late', 'owner'),
+            ]
+        )
+
+    def test_pagination(self):
+        """
+        Ensures the tasks are cursor paginated by the due date with a
+        constant number of queries.
+        """
+        titles = []
+        url = f'{self.url}?page_size=3'
+        while url:
+            # Tasks and their team members
+            with self.assertNumQueries(2):
+                response = self.client.get(url)
+            # Correct status code
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            titles += [task['title'] for task in response.data['results']]
+            url = response.data['next']
+
+        self.assertEqual(
+            titles,
+            ['member early', 'owned and member', 'member late', 'owned late']
+        )
+
+    def test_same_representation(self):
+        """
+        Ensures the values() fast path presents the tasks like the
+        MyTaskSerializer, also for a sparse fieldset.
+        """
+        for params in [{}, {'fields': 'id,role'}]:
+            fast = self.client.get(self.url, params)
+            with mock.patch.object(
+                views.TaskView, 'row_serializer_class', None
+            ):
+                regular = self.client.get(self.url, params)
+
+            self.assertEqual(fast.data, regular.data)
+
+        self.assertEqual(
+            set(fast.data['results'][0]), {'id', 'role'}
+        )
+
+    def test_filters(self):
+        """
+        Ensures the filters of the list apply.
+        """
+        response = self.client.get(
+            self.url, {'owner': self.other_user.email}
+        )
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [task['title'] for task in response.data['results']],
+            ['member early', 'member late']
+        )
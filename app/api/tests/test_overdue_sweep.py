@@ -0,0 +1,154 @@
+from django.test import TestCase, override_settings
+from api import cron, models
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestOverdueSweep(TestCase):
+    """
+    Tests related to the overdue task sweeper (api.cron).
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        now = timezone.now()
+        due_dates = {
+            'overdue': now - timezone.timedelta(days=2),
+            'overdue without status': now - timezone.timedelta(days=1),
+            'late': now - timezone.timedelta(hours=1),
+            'completed': now - timezone.timedelta(days=3),
+            'upcoming': now + timezone.timedelta(days=1),
+        }
+        self.tasks = {}
+        for title, due_date in due_dates.items():
+            self.tasks[title] = models.Task.objects.create(
+                title=title,
+                description='A new task created for testing',
+                due_date=due_date,
+                completed_at=now if title == 'completed' else None,
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=None if 'without' in title else self.status_instance,
+                owner=self.owner.profile
+            )
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    @override_settings(OVERDUE_TASK_STATUS='Overdue')
+    def test_sweep(self):
+        """
+        Ensures the open tasks past their due date are moved to the
+        overdue status in chunks and the sweep is recorded.
+        """
+        sweep = cron.sweep_overdue_tasks(chunk_size=2)
+
+        overdue = models.Status.objects.get(caption='Overdue')
+        self.assertEqual(
+            set(
+                models.Task.objects.filter(
+                    status=overdue
+                ).values_list('title', flat=True)
+            ),
+            {'overdue', 'overdue without status', 'late'}
+        )
+        # The other tasks keep their status
+        for title in ['completed', 'upcoming']:
+            task = models.Task.objects.get(pk=self.tasks[title].pk)
+            self.assertEqual(task.status, self.status_instance)
+            self.assertEqual(task.version, 1)
+        # The moved tasks get a new version (ETag)
+        task = models.Task.objects.get(pk=self.tasks['overdue'].pk)
+        self.assertEqual(task.version, 2)
+
+        self.assertEqual(sweep.status, overdue)
+        self.assertEqual(sweep.swept, 3)
+        self.assertEqual(sweep.chunks, 2)
+        self.assertGreaterEqual(sweep.duration.total_seconds(), 0)
+        self.assertEqual(models.OverdueSweep.objects.count(), 1)
+
+        # Nothing left to sweep
+        sweep = cron.sweep_overdue_tasks(chunk_size=2)
+        self.assertEqual((sweep.swept, sweep.chunks), (0, 0))
+
+    @override_settings(OVERDUE_TASK_STATUS='Overdue')
+    def test_swept_once(self):
+        """
+        Ensures tasks are swept despite changes after their due date,
+        tasks moved back from the overdue status aren't swept again
+        and tasks with a new due date are swept again once it passed.
+        """
+        late = self.tasks['late']
+        late.team_members.add(self.owner.profile)
+        models.TaskResource.objects.create(
+            source_name='Example Resource',
+            description='Resource description',
+            resource_link='https://example.com/resource',
+            task=late
+        )
+        cron.sweep_overdue_tasks()
+
+        late.refresh_from_db()
+        self.assertEqual(late.status.caption, 'Overdue')
+        self.assertIsNotNone(late.overdue_at)
+
+        # Moved back
+        late.status = self.status_instance
+        late.save()
+        self.assertEqual(cron.sweep_overdue_tasks().swept, 0)
+
+        # New due date after the sweep, which passed
+        late.due_date = timezone.now()
+        late.save()
+        self.assertEqual(cron.sweep_overdue_tasks().swept, 1)
+        late.refresh_from_db()
+        self.assertEqual(late.status.caption, 'Overdue')
+
+    @override_settings(OVERDUE_TASK_STATUS='In Progress')
+    def test_configured_status(self):
+        """
+        Ensures the tasks are moved to the configured status.
+        """
+        sweep = cron.sweep_overdue_tasks()
+
+        self.assertEqual(sweep.status, self.status_instance)
+        # Only the task without a status changes
+        self.assertEqual(sweep.swept, 1)
+        self.assertEqual(sweep.chunks, 1)
+        self.assertFalse(
+            models.Status.objects.filter(caption='Overdue').exists()
+        )
@@ -0,0 +1,240 @@
+from rest_framework.test import APITestCase
+from api import models, pagination
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestKeysetPagination(APITestCase):
+    """
+    Tests related to the keyset pagination of the task and user lists.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+
+        user_data = {
+            'email': 'peterpahn@gmail.com',
+            'password': 'blabla123.'
+        }
+        profile_data = {
+            'first_name': 'Peter',
+            'last_name': 'Pahn',
+            'position': self.position_instance,
+        }
+        self.owner = User.objects.create(user_data, profile_data)
+
+        for number in range(10):
+            self.create_task(number)
+
+        # Tasks sharing the same created_at rely on the id tie-breaker
+        models.Task.objects.filter(title__in=['Task 3', 'Task 4', 'Task 5'])\
+            .update(created_at=timezone.now())
+
+        return super().setUp()
+
+    def create_task(self, number):
+        """
+        Creates a task owned by the owner.
+        """
+
+        return models.Task.objects.create(
+            title=f'Task {number}',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=self.owner.profile
+        )
+
+    def walk_pages(self, url, params):
+        """
+        Follows the next links and returns the ids of all pages.
+        """
+
+        ids = []
+        response = self.client.get(url, params, format='json')
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [item['id'] for item in response.data['results']]
+
+            next_link = response.data['next']
+            if next_link is None:
+                return ids
+            response = self.client.get(next_link, format='json')
+
+    def test_task_pages(self):
+        """
+        Tests if the pages of the task list are ordered by
+        (created_at, id) without duplicates or gaps.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        ids = self.walk_pages(url, {'page_size': 3})
+
+        expected_ids = list(
+            models.Task.objects.order_by('-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected_ids)
+
+    def test_task_pages_concurrent_inserts(self):
+        """
+        Tests if tasks inserted while paging neither shift nor
+        duplicate the items of the following pages.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+        expected_ids = list(
+            models.Task.objects.order_by('-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+
+        response = self.client.get(url, {'page_size': 4}, format='json')
+        ids = [item['id'] for item in response.data['results']]
+
+        # New tasks appear before the current position
+        self.create_task(10)
+        self.create_task(11)
+
+        next_link = response.data['next']
+        while next_link:
+            response = self.client.get(next_link, format='json')
+            ids += [item['id'] for item in response.data['results']]
+            next_link = response.data['next']
+
+        self.assertEqual(ids, expected_ids)
+
+    def test_previous_link(self):
+        """
+        Tests if the previous link returns the preceding page.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        first_page = self.client.get(url, {'page_size': 3}, format='json')
+        self.assertIsNone(first_page.data['previous'])
+
+        second_page = self.client.get(first_page.data['next'], format='json')
+        response = self.client.get(
+            second_page.data['previous'], format='json'
+        )
+
+        self.assertEqual(response.data['results'], first_page.data['results'])
+
+    def test_deep_page_queries(self):
+        """
+        Tests if a deep page needs as many queries as the first page.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        with CaptureQueriesContext(connection) as first_page_queries:
+            response = self.client.get(url, {'page_size': 2}, format='json')
+
+        while response.data['next']:
+            next_link = response.data['next']
+            response = self.client.get(next_link, format='json')
+
+        with CaptureQueriesContext(connection) as last_page_queries:
+            self.client.get(next_link, format='json')
+
+        self.assertEqual(
+            len(first_page_queries.captured_queries),
+            len(last_page_queries.captured_queries)
+        )
+        # No OFFSET scans
+        for query in last_page_queries.captured_queries:
+            self.assertNotIn('OFFSET', query['sql'])
+
+    def test_page_size_limit(self):
+        """
+        Tests if the requested page size is capped by max_page_size.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+        pagination.TaskPagination.max_page_size = 5
+
+        try:
+            response = self.client.get(url, {'page_size': 100}, format='json')
+        finally:
+            pagination.TaskPagination.max_page_size = 200
+
+        self.assertEqual(len(response.data['results']), 5)
+
+    def test_invalid_cursor(self):
+        """
+        Tests if an invalid cursor results in a not found response.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.get(url, {'cursor': 'invalid'}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_user_pages_with_ordering(self):
+        """
+        Tests if the user list pages follow the requested ordering.
+        """
+
+        for number in range(6):
+            User.objects.create(
+                user_data={
+                    'email': f'user{5 - number}@example.com',
+                    'password': 'testpassword123'
+                },
+                profile_data={
+                    'first_name': 'John',
+                    'last_name': 'Doe',
+                    'position': self.position_instance
+                }
+            )
+        url = reverse('customuser-list')
+        self.client.force_authenticate(user=self.owner)
+
+        # Default ordering by id
+        ids = self.walk_pages(url, {'page_size': 2})
+        expected_ids = list(
+            User.objects.order_by('id').values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected_ids)
+
+        # Requested ordering by email
+        ids = self.walk_pages(url, {'page_size': 2, 'ordering': 'email'})
+        expected_ids = list(
+            User.objects.order_by('email').values_list('id', flat=True)
+        )
+        self.assertEqual(ids, expected_ids)
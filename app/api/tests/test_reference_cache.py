@@ -0,0 +1,163 @@
+from rest_framework.test import APITestCase
+from api import models, serializers, reference_cache
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.utils import timezone
+from unittest import mock
+
+
+User = get_user_model()
+
+
+class TestReferenceCache(APITestCase):
+    """
+    Tests related to the process-local reference cache of the
+    Category, Priority, Status and Position models.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary reference data for the validation of tasks.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.task_data = {
+            'title': 'New Task Title',
+            'description': 'New task description.',
+            'due_date': timezone.now() + timezone.timedelta(days=5),
+            'category': self.category_instance.name,
+            'priority': self.priority_instance.caption,
+            'status': self.status_instance.caption
+        }
+
+        return super().setUp()
+
+    def test_bulk_validation_without_queries(self):
+        """
+        Tests if the slugs of many tasks are resolved without
+        querying the database once the cache is loaded.
+        """
+
+        # Loads the cache
+        for cache in reference_cache.reference_caches.values():
+            cache.ensure_loaded()
+
+        serializer = serializers.TaskSerializer(
+            data=[self.task_data] * 50,
+            many=True
+        )
+        with self.assertNumQueries(0):
+            self.assertTrue(serializer.is_valid())
+
+        # Resolved instances
+        validated_task = serializer.validated_data[0]
+        self.assertEqual(validated_task['category'], self.category_instance)
+        self.assertEqual(validated_task['priority'], self.priority_instance)
+        self.assertEqual(validated_task['status'], self.status_instance)
+
+    def test_invalidation(self):
+        """
+        Tests if saving and deleting reference data invalidates the
+        cache.
+        """
+
+        self.assertEqual(
+            reference_cache.priorities.get('High Priority'),
+            self.priority_instance
+        )
+
+        # Update
+        self.priority_instance.caption = 'Highest Priority'
+        self.priority_instance.save()
+        self.assertIsNone(reference_cache.priorities.get('High Priority'))
+        self.assertEqual(
+            reference_cache.priorities.get('Highest Priority'),
+            self.priority_instance
+        )
+
+        # Delete
+        self.priority_instance.delete()
+        self.assertIsNone(reference_cache.priorities.get('Highest Priority'))
+
+        # Validation error for unknown slugs
+        serializer = serializers.TaskSerializer(data=self.task_data)
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('priority', serializer.errors)
+
+    def test_representation_from_cache(self):
+        """
+        Tests if the foreign keys of a task without joined relations
+        are presented through the cache.
+        """
+
+        user = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        task = models.Task.objects.create(
+            owner=user.profile,
+            **{
+                **self.task_data,
+                'category': self.category_instance,
+                'priority': self.priority_instance,
+                'status': self.status_instance,
+            }
+        )
+        reference_cache.categories.ensure_loaded()
+        task = models.Task.objects.get(id=task.id)
+
+        field = serializers.TaskSerializer().fields['category']
+        with self.assertNumQueries(0):
+            category = field.get_attribute(task)
+
+        self.assertEqual(field.to_representation(category), 'Human Resource')
+
+    def test_version_checks(self):
+        """
+        Tests if the version is read from the cache once per request or
+        version_ttl, and if bumps of other processes are picked up.
+        """
+
+        priorities = reference_cache.priorities
+        priorities.ensure_loaded()
+
+        with mock.patch.object(
+            cache, 'get_or_set', wraps=cache.get_or_set
+        ) as get_or_set:
+            for _ in range(10):
+                priorities.get('High Priority')
+            self.assertEqual(get_or_set.call_count, 0)
+
+            # Bump of another process, seen by the next request
+            models.Priority.objects.filter(
+                pk=self.priority_instance.pk
+            ).update(caption='Highest Priority')
+            cache.incr(priorities.version_key)
+            request_started.send(sender=self.__class__)
+            self.assertEqual(
+                priorities.get('Highest Priority'), self.priority_instance
+            )
+            self.assertEqual(get_or_set.call_count, 1)
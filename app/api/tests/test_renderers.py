@@ -0,0 +1,169 @@
+import json
+from unittest import mock, skipUnless
+from rest_framework.test import APITestCase
+from api import models, renderers, parsers
+from rest_framework import status
+from rest_framework.renderers import JSONRenderer
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestRenderers(APITestCase):
+    """
+    Tests related to the orjson/MessagePack renderers and parsers and
+    their content negotiation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of a Task instance.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.task = models.Task.objects.create(
+            # Escaped by the JSONRenderer
+            title='Task \u2028 with ünicode',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=self.owner.profile
+        )
+        self.url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        return super().setUp()
+
+    def test_orjson_renderer(self):
+        """
+        Tests if the orjson renderer renders the same JSON as the
+        JSONRenderer of DRF.
+        """
+
+        response = self.client.get(self.url, HTTP_ACCEPT='application/json')
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertIn('Accept', response['Vary'])
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+        # Without orjson
+        with mock.patch.object(renderers, 'orjson', None):
+            fallback_response = self.client.get(
+                reverse('task-detail', args=[self.task.id])
+            )
+        self.assertEqual(
+            fallback_response.content,
+            JSONRenderer().render(fallback_response.data)
+        )
+
+        # Datetimes are encoded natively
+        now = timezone.now().replace(microsecond=0)
+        content = renderers.ORJSONRenderer().render({'at': now})
+        self.assertEqual(
+            json.loads(content), {'at': now.strftime('%Y-%m-%dT%H:%M:%SZ')}
+        )
+
+    def test_orjson_parser(self):
+        """
+        Tests if JSON bodies are parsed by orjson and invalid bodies
+        are rejected.
+        """
+
+        response = self.client.patch(
+            reverse('task-detail', args=[self.task.id]),
+            json.dumps({'title': 'Updated task'}),
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Updated task')
+
+        response = self.client.patch(
+            reverse('task-detail', args=[self.task.id]),
+            '{"title": ',
+            content_type='application/json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_unavailable_msgpack(self):
+        """
+        Tests if MessagePack isn't negotiated without msgpack.
+        """
+
+        with mock.patch.object(
+            renderers.MessagePackRenderer, 'available', False
+        ), mock.patch.object(parsers.MessagePackParser, 'available', False):
+            response = self.client.get(
+                self.url, HTTP_ACCEPT='application/msgpack'
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_406_NOT_ACCEPTABLE
+            )
+
+            response = self.client.patch(
+                reverse('task-detail', args=[self.task.id]),
+                b'\x80',
+                content_type='application/msgpack'
+            )
+            self.assertEqual(
+                response.status_code, status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+
+    @skipUnless(renderers.msgpack, 'msgpack is not installed')
+    def test_msgpack(self):
+        """
+        Tests the MessagePack rendering and parsing and if the ETag
+        differs from the JSON representation.
+        """
+
+        msgpack = renderers.msgpack
+        json_response = self.client.get(self.url)
+
+        response = self.client.get(self.url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False),
+            json.loads(json_response.content)
+        )
+        self.assertNotEqual(response['ETag'], json_response['ETag'])
+
+        response = self.client.patch(
+            reverse('task-detail', args=[self.task.id]),
+            msgpack.packb({'title': 'Updated task'}),
+            content_type='application/msgpack'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Updated task')
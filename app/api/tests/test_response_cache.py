@@ -0,0 +1,243 @@
+from rest_framework.test import APITestCase
+from api import models
+from api.response_cache import task_lists
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestTaskListCache(APITestCase):
+    """
+    Tests related to the per viewer task list cache and its
+    invalidation.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances, an owner
+        and two other users.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.users = []
+        for name in ['owner', 'member', 'other']:
+            self.users.append(User.objects.create(
+                user_data={
+                    'email': f'{name}@gmail.com',
+                    'password': 'blabla123.'
+                },
+                profile_data={
+                    'first_name': name,
+                    'last_name': 'User',
+                    'position': self.position_instance,
+                }
+            ))
+        self.owner, self.member, self.other = self.users
+        self.task = self.create_task(self.owner, 'Task')
+        self.other_task = self.create_task(self.other, 'Other task')
+        self.url = reverse('task-list')
+        cache.clear()
+
+        return super().setUp()
+
+    def create_task(self, user, title):
+        """
+        Creates a task owned by the user.
+        """
+        return models.Task.objects.create(
+            title=title,
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=user.profile
+        )
+
+    def get_titles(self, user):
+        """
+        Returns the task titles of the list of the user.
+        """
+        self.client.force_authenticate(user=user)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        return [task['title'] for task in response.data['results']]
+
+    def assertCached(self, user):
+        """
+        Asserts that the list of the user is answered from the cache.
+        """
+        with self.assertNumQueries(0):
+            self.get_titles(user)
+
+    def test_cached_list(self):
+        """
+        Tests if a list is cached per viewer and query parameters.
+        """
+
+        self.assertEqual(self.get_titles(self.owner), ['Task'])
+        self.assertCached(self.owner)
+
+        # Other viewer and other query parameters
+        self.assertEqual(self.get_titles(self.other), ['Other task'])
+        # Tasks and team members
+        with self.assertNumQueries(2):
+            response = self.client.get(self.url, {'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalidation_by_task_changes(self):
+        """
+        Tests if changes of a task only invalidate the lists of the
+        viewers seeing the task.
+        """
+
+        self.get_titles(self.owner)
+        self.get_titles(self.other)
+
+        self.task.title = 'Updated task'
+        self.task.save()
+
+        self.assertEqual(self.get_titles(self.owner), ['Updated task'])
+        self.assertCached(self.other)
+
+        # Task resources
+        models.TaskResource.objects.create(
+            source_name='Resource',
+            description='Resource description',
+            resource_link='https://example.com/resource',
+            task=self.task
+        )
+        # Tasks and team members
+        with self.assertNumQueries(2):
+            self.get_titles(self.owner)
+        self.assertCached(self.other)
+
+        # Deletion
+        self.task.delete()
+        self.assertEqual(self.get_titles(self.owner), [])
+
+    def test_invalidation_by_team_member_changes(self):
+        """
+        Tests if added/removed team members see the change of their
+        list immediately.
+        """
+
+        self.assertEqual(self.get_titles(self.member), [])
+
+        self.task.team_members.add(self.member.profile)
+        self.assertEqual(self.get_titles(self.member), ['Task'])
+
+        self.member.profile.teams.remove(self.task)
+        self.assertEqual(self.get_titles(self.member), [])
+
+        self.task.team_members.add(self.member.profile)
+        self.get_titles(self.member)
+        self.task.team_members.clear()
+        self.assertEqual(self.get_titles(self.member), [])
+
+    def test_invalidation_by_bulk_paths(self):
+        """
+        Tests if the batch creation and the bulk update invalidate the
+        lists, although they don't send signals.
+        """
+
+        self.get_titles(self.owner)
+        self.client.force_authenticate(user=self.owner)
+
+        response = self.client.post(self.url, [{
+            'title': 'Batch task',
+            'description': 'A new task created for testing',
+            'due_date': timezone.now() + timezone.timedelta(days=3),
+            'category': self.category_instance.name,
+            'priority': self.priority_instance.caption,
+            'status': self.status_instance.caption,
+        }], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(self.get_titles(self.owner)), 2)
+
+        response = self.client.patch(
+            reverse('task-bulk-update'),
+            {
+                'ids': [self.task.id],
+                'changes': {'completed_at': timezone.now()}
+            },
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(self.url)
+        completed = {
+            task['title']: task['completed_at']
+            for task in response.data['results']
+        }
+        self.assertIsNotNone(completed['Task'])
+
+    def test_stale_while_revalidate(self):
+        """
+        Tests if an outdated list is served while another request
+        rebuilds it.
+        """
+
+        self.client.force_authenticate(user=self.owner)
+        # Negotiated request, the key depends on the accepted media type
+        request = self.client.get(self.url).renderer_context['request']
+        viewer = task_lists.get_viewer(self.owner)
+        lock_key = task_lists.get_key(viewer, request) + ':lock'
+
+        self.task.title = 'Updated task'
+        self.task.save()
+        self.assertEqual(self.get_titles(self.owner), ['Updated task'])
+
+        self.task.title = 'Newest task'
+        self.task.save()
+        # Another request holds the rebuild lock
+        cache.add(lock_key, True)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get_titles(self.owner), ['Updated task'])
+
+        # Rebuilt once the lock is released
+        cache.delete(lock_key)
+        self.assertEqual(self.get_titles(self.owner), ['Newest task'])
+
+    def test_expired_stale_list(self):
+        """
+        Tests if a list past its stale timeout is rebuilt while another
+        request holds the rebuild lock, without releasing that lock.
+        """
+
+        self.client.force_authenticate(user=self.owner)
+        request = self.client.get(self.url).renderer_context['request']
+        viewer = task_lists.get_viewer(self.owner)
+        key = task_lists.get_key(viewer, request)
+
+        self.task.title = 'Newest task'
+        self.task.save()
+        entry = task_lists.cache.get(key)
+        entry['created'] -= task_lists.timeout + task_lists.stale_timeout
+        task_lists.cache.set(key, entry)
+
+        # Another request holds the rebuild lock
+        cache.add(f'{key}:lock', True)
+        self.assertEqual(self.get_titles(self.owner), ['Newest task'])
+        self.assertTrue(cache.get(f'{key}:lock'))
@@ -0,0 +1,150 @@
+from unittest import mock
+from rest_framework.test import APITestCase
+from api import models, views
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestRowSerializers(APITestCase):
+    """
+    Tests related to the values() fast path of the list actions, which
+    has to render the same JSON as the regular serializers.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.users = []
+        for name in ['owner', 'member', 'other']:
+            self.users.append(User.objects.create(
+                user_data={
+                    'email': f'{name}@gmail.com',
+                    'password': 'blabla123.'
+                },
+                profile_data={
+                    'first_name': name,
+                    'last_name': 'User',
+                    # The last user has no position
+                    'position': self.position_instance
+                    if name != 'other' else None,
+                }
+            ))
+        self.owner, self.member, self.other = self.users
+
+        for number in range(5):
+            task = models.Task.objects.create(
+                title=f'Task {number}',
+                description='A new task created for testing',
+                due_date=timezone.now() + timezone.timedelta(days=3),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                # Tasks with and without status/completion
+                status=self.status_instance if number % 2 else None,
+                completed_at=timezone.now() if number % 2 else None,
+                owner=self.owner.profile
+            )
+            task.team_members.add(self.member.profile)
+            if number % 2:
+                task.team_members.add(self.other.profile)
+
+        return super().setUp()
+
+    def assertSameContent(self, view, user, url, params=None):
+        """
+        Asserts that the fast path and the regular serializer of the
+        view render the same JSON.
+        """
+
+        self.client.force_authenticate(user=user)
+
+        cache.clear()
+        fast_response = self.client.get(url, params)
+        self.assertEqual(fast_response.status_code, status.HTTP_200_OK)
+
+        cache.clear()
+        with mock.patch.object(view, 'row_serializer_class', None):
+            response = self.client.get(url, params)
+
+        self.assertEqual(fast_response.content, response.content)
+        self.assertEqual(fast_response['ETag'], response['ETag'])
+
+        return fast_response
+
+    def test_task_list(self):
+        """
+        Tests the task list of staff, owners and team members.
+        """
+
+        url = reverse('task-list')
+        self.owner.is_staff = True
+        self.owner.save()
+        response = self.assertSameContent(views.TaskView, self.owner, url)
+        self.assertEqual(len(response.data['results']), 5)
+
+        self.assertSameContent(views.TaskView, self.member, url)
+        self.assertSameContent(views.TaskView, self.other, url)
+
+    def test_task_list_pages_and_fields(self):
+        """
+        Tests the pages and sparse fieldsets of the task list.
+        """
+
+        url = reverse('task-list')
+        response = self.assertSameContent(
+            views.TaskView, self.owner, url, {'page_size': 2}
+        )
+        next_url = response.data['next']
+        self.assertIsNotNone(next_url)
+        self.assertSameContent(views.TaskView, self.owner, next_url)
+
+        self.assertSameContent(
+            views.TaskView, self.owner, url,
+            {'fields': 'id,status,team_members,completed_at'}
+        )
+        self.assertSameContent(
+            views.TaskView, self.owner, url, {'exclude': 'owner,category'}
+        )
+
+    def test_user_list(self):
+        """
+        Tests the user list with and without positions and sparse
+        fieldsets.
+        """
+
+        url = reverse('customuser-list')
+        response = self.assertSameContent(
+            views.CustomUserView, self.owner, url
+        )
+        self.assertIsNone(response.data['results'][2]['profile']['position'])
+
+        self.assertSameContent(
+            views.CustomUserView, self.owner, url, {'fields': 'id,email'}
+        )
+        self.assertSameContent(
+            views.CustomUserView, self.owner, url,
+            {'ordering': '-email', 'page_size': 2}
+        )
@@ -0,0 +1,142 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestSparseFields(APITestCase):
+    """
+    Tests related to the sparse fieldsets (?fields=/?exclude=) of the
+    TaskView and CustomUserView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of a Task instance.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.task = models.Task.objects.create(
+            title='Task',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=self.owner.profile
+        )
+        self.task_url = reverse('task-detail', args=[self.task.id])
+        self.client.force_authenticate(user=self.owner)
+        cache.clear()
+
+        return super().setUp()
+
+    def test_task_fields(self):
+        """
+        Tests if only the requested fields are presented and the
+        columns of the other fields are not read.
+        """
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('task-list'), {'fields': 'id,title,owner'}
+            )
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data['results'],
+            [{'id': self.task.id, 'title': 'Task',
+              'owner': 'peterpahn@gmail.com'}]
+        )
+        task_query = queries.captured_queries[0]['sql']
+        self.assertNotIn('"description"', task_query)
+        self.assertNotIn('api_status', task_query)
+
+        response = self.client.get(self.task_url, {'fields': 'title'})
+        self.assertEqual(response.data, {'title': 'Task'})
+
+    def test_task_exclude(self):
+        """
+        Tests if excluded fields are left out of the representation.
+        """
+
+        response = self.client.get(
+            self.task_url, {'exclude': 'description,team_members'}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotIn('description', response.data)
+        self.assertNotIn('team_members', response.data)
+        self.assertEqual(response.data['status'], 'In Progress')
+
+        # The representation of the fieldset has its own ETag
+        etag = response['ETag']
+        response = self.client.get(self.task_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('description', response.data)
+
+    def test_user_fields(self):
+        """
+        Tests the sparse fieldsets of the user representation.
+        """
+
+        url = reverse('customuser-detail', args=[self.owner.id])
+
+        response = self.client.get(url, {'fields': 'id,email'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data, {'id': self.owner.id, 'email': self.owner.email}
+        )
+
+        response = self.client.get(url, {'exclude': 'email'})
+        self.assertNotIn('email', response.data)
+        self.assertEqual(response.data['profile']['first_name'], 'Peter')
+
+    def test_writes_ignore_fieldset(self):
+        """
+        Tests if the fieldset parameters don't affect the validation
+        and representation of writes.
+        """
+
+        response = self.client.patch(
+            self.task_url + '?fields=id',
+            {'title': 'Updated task'},
+            format='json'
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['title'], 'Updated task')
+        self.assertIn('description', response.data)
@@ -0,0 +1,277 @@
+from rest_framework.test import APITestCase
+from api import models, summary
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from io import StringIO
+from unittest import mock
+
+
+User = get_user_model()
+
+
+class TestTaskDashboard(APITestCase):
+    """
+    Tests related to the task summary (api.summary) and the dashboard
+    action of the TaskView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.manager_position = models.Position.objects.create(
+            title='Human Resource Manager',
+            description='A Position managing the employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.low_priority = models.Priority.objects.create(
+            caption='Low Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.done_status = models.Status.objects.create(
+            caption='Done',
+            description='Indicates that a task is done.'
+        )
+        self.owner = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.manager_position,
+            }
+        )
+        self.team_member = User.objects.create(
+            user_data={
+                'email': 'annapeters@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Anna',
+                'last_name': 'Peters',
+                'position': self.position_instance,
+            }
+        )
+        self.tasks = [
+            models.Task.objects.create(
+                title=f'Task {number}',
+                description='A new task created for testing',
+                due_date=timezone.now() + timezone.timedelta(days=3),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=self.status_instance,
+                owner=self.owner.profile
+            )
+            for number in range(3)
+        ]
+        self.tasks[0].team_members.add(self.team_member.profile)
+        self.url = reverse('task-dashboard')
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def get_summary(self):
+        """
+        Returns the summary groups with their counts.
+        """
+        return sorted(
+            models.TaskSummary.objects.values_list(
+                'profile_id', 'role', 'status_id', 'priority_id',
+                'category_id', 'count'
+            ),
+            key=str
+        )
+
+    def assert_summary_rebuilt(self):
+        """
+        Asserts that the incrementally maintained summary matches a
+        rebuilt summary.
+        """
+        incremental = self.get_summary()
+        summary.rebuild()
+        self.assertEqual(incremental, self.get_summary())
+
+    def test_incremental_summary(self):
+        """
+        Ensures saves, deletes, team member changes and bulk updates
+        keep the summary up to date.
+        """
+        self.assert_summary_rebuilt()
+
+        # Save
+        self.tasks[0].status = self.done_status
+        self.tasks[0].save()
+        self.assert_summary_rebuilt()
+
+        # Team members (both directions)
+        self.tasks[1].team_members.add(self.team_member.profile)
+        self.team_member.profile.teams.remove(self.tasks[0])
+        self.assert_summary_rebuilt()
+        self.team_member.profile.teams.add(self.tasks[2])
+        self.tasks[1].team_members.clear()
+        self.assert_summary_rebuilt()
+        self.team_member.profile.teams.clear()
+        self.assert_summary_rebuilt()
+
+        # Bulk update
+        self.tasks[2].team_members.add(self.team_member.profile)
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.patch(
+            reverse('task-bulk-update'),
+            {
+                'ids': [task.id for task in self.tasks],
+                'changes': {'priority': self.low_priority.caption}
+            },
+            format='json'
+        )
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assert_summary_rebuilt()
+
+        # Batch create
+        response = self.client.post(reverse('task-list'), [
+            {
+                'title': f'Batch Task {number}',
+                'description': 'New task description.',
+                'due_date': timezone.now() + timezone.timedelta(days=5),
+                'category': self.category_instance.name,
+                'priority': self.priority_instance.caption,
+                'status': self.status_instance.caption,
+                'team_members': [self.team_member.profile.id],
+            }
+            for number in range(2)
+        ], format='json')
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assert_summary_rebuilt()
+
+        # Delete
+        self.tasks[2].delete()
+        self.assert_summary_rebuilt()
+
+    def test_dashboard(self):
+        """
+        Ensures the dashboard presents the counts per owner and team
+        member.
+        """
+        self.client.force_authenticate(user=self.owner)
+        with self.assertNumQueries(1):
+            summaries = summary.get_dashboard()
+        self.assertEqual(len(summaries), 2)
+
+        response = self.client.get(self.url)
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = {
+            (result['profile'], result['role']): result
+            for result in response.data['results']
+        }
+        owned = results['peterpahn@gmail.com', 'owner']
+        self.assertEqual(owned['total'], 3)
+        self.assertEqual(
+            owned['status'], [{'name': 'In Progress', 'count': 3}]
+        )
+        self.assertEqual(
+            owned['priority'], [{'name': 'High Priority', 'count': 3}]
+        )
+        self.assertEqual(
+            owned['category'], [{'name': 'Human Resource', 'count': 3}]
+        )
+        self.assertEqual(
+            results['annapeters@gmail.com', 'member']['total'], 1
+        )
+
+    def test_dashboard_own_counts(self):
+        """
+        Ensures users who aren't task managers only see their own
+        counts.
+        """
+        self.client.force_authenticate(user=self.team_member)
+        response = self.client.get(self.url)
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [
+                (result['profile'], result['role'])
+                for result in response.data['results']
+            ],
+            [('annapeters@gmail.com', 'member')]
+        )
+
+    def test_rebuild_command(self):
+        """
+        Ensures the rebuild command restores a lost summary.
+        """
+        expected = self.get_summary()
+        models.TaskSummary.objects.all().delete()
+
+        call_command('rebuild_task_summary', stdout=StringIO())
+
+        self.assertEqual(self.get_summary(), expected)
+
+    def test_failed_save(self):
+        """
+        Ensures a failed save of a task leaves the summary unchanged.
+        """
+        expected = self.get_summary()
+
+        self.tasks[0].status = self.done_status
+        with mock.patch.object(summary, 'add_tasks', side_effect=Exception):
+            with self.assertRaises(Exception):
+                self.tasks[0].save()
+
+        self.assertEqual(self.get_summary(), expected)
+
+    def test_unique_groups(self):
+        """
+        Ensures a group has a single row, also without a status, and
+        missing groups are counted on a new row.
+        """
+        self.tasks[1].status = None
+        self.tasks[1].save()
+        self.assert_summary_rebuilt()
+
+        group = models.TaskSummary.objects.get(status__isnull=True)
+        for status_id in [None, self.status_instance.id]:
+            with self.assertRaises(IntegrityError):
+                with transaction.atomic():
+                    models.TaskSummary.objects.create(
+                        profile_id=group.profile_id, role=group.role,
+                        status_id=status_id, priority_id=group.priority_id,
+                        category_id=group.category_id
+                    )
+
+        summary.apply([{
+            'profile_id': group.profile_id, 'role': group.role,
+            'status_id': self.done_status.id,
+            'priority_id': group.priority_id,
+            'category_id': group.category_id, 'count': 2
+        }], 1)
+        self.assertEqual(
+            models.TaskSummary.objects.get(status=self.done_status).count, 2
+        )
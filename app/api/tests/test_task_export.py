@@ -0,0 +1,142 @@
+import csv
+import io
+import json
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestTaskExport(APITestCase):
+    """
+    Tests related to the streaming export of the TaskView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.users = []
+        for name in ['owner', 'member', 'other']:
+            self.users.append(User.objects.create(
+                user_data={
+                    'email': f'{name}@gmail.com',
+                    'password': 'blabla123.'
+                },
+                profile_data={
+                    'first_name': name,
+                    'last_name': 'User',
+                    'position': self.position_instance,
+                }
+            ))
+        self.owner, self.member, self.other = self.users
+
+        for number in range(5):
+            task = models.Task.objects.create(
+                title=f'Task {number}',
+                description='A new task, with a comma',
+                due_date=timezone.now() + timezone.timedelta(days=3),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=self.status_instance,
+                owner=self.owner.profile
+            )
+            task.team_members.add(self.member.profile, self.other.profile)
+
+        # Not visible to the owner
+        models.Task.objects.create(
+            title='Foreign task',
+            description='A new task created for testing',
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            owner=self.other.profile
+        )
+        self.url = reverse('task-export')
+
+        return super().setUp()
+
+    def test_export_csv(self):
+        """
+        Tests the CSV export of the visible tasks.
+        """
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(self.url)
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response['Content-Type'], 'text/csv')
+
+        content = b''.join(response.streaming_content).decode()
+        rows = list(csv.DictReader(io.StringIO(content)))
+
+        self.assertEqual(
+            [row['title'] for row in rows],
+            [f'Task {number}' for number in range(5)]
+        )
+        self.assertEqual(rows[0]['description'], 'A new task, with a comma')
+        self.assertEqual(rows[0]['owner'], 'owner@gmail.com')
+        self.assertEqual(
+            rows[0]['team_members'], 'member@gmail.com;other@gmail.com'
+        )
+        self.assertEqual(rows[0]['category'], 'Human Resource')
+
+    def test_export_ndjson(self):
+        """
+        Tests the NDJSON export of the owned tasks and the tasks of
+        a team member.
+        """
+
+        self.client.force_authenticate(user=self.other)
+        response = self.client.get(self.url, {'export_format': 'ndjson'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        content = b''.join(response.streaming_content).decode()
+        tasks = [json.loads(line) for line in content.splitlines()]
+
+        self.assertEqual(len(tasks), 6)
+        self.assertEqual(
+            tasks[0]['team_members'], ['member@gmail.com', 'other@gmail.com']
+        )
+        self.assertEqual(tasks[-1]['title'], 'Foreign task')
+        self.assertIsNone(tasks[-1]['status'])
+
+    def test_export_invalid_format(self):
+        """
+        Tests if unknown export formats are rejected.
+        """
+
+        self.client.force_authenticate(user=self.owner)
+        response = self.client.get(self.url, {'export_format': 'xml'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        # Authentication required
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
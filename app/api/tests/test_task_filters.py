@@ -0,0 +1,217 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestTaskFilters(APITestCase):
+    """
+    Tests related to the query parameter filters of the task list.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances with
+        different reference data, owners and due dates.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.other_category = models.Category.objects.create(
+            name='Development',
+            description='A domain specialized in software'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.low_priority = models.Priority.objects.create(
+            caption='Low Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.users = []
+        for name in ['owner', 'member', 'other']:
+            self.users.append(User.objects.create(
+                user_data={
+                    'email': f'{name}@gmail.com',
+                    'password': 'blabla123.'
+                },
+                profile_data={
+                    'first_name': name,
+                    'last_name': 'User',
+                    'position': self.position_instance,
+                }
+            ))
+        self.owner, self.member, self.other = self.users
+
+        now = timezone.now()
+        self.overdue_task = self.create_task(
+            'Overdue', self.owner, now - timezone.timedelta(days=2),
+            status=self.status_instance
+        )
+        self.completed_task = self.create_task(
+            'Completed', self.owner, now - timezone.timedelta(days=1),
+            completed_at=now, priority=self.low_priority
+        )
+        self.open_task = self.create_task(
+            'Open', self.owner, now + timezone.timedelta(days=5),
+            category=self.other_category
+        )
+        self.open_task.team_members.add(self.member.profile)
+        # Not visible to the owner
+        self.foreign_task = self.create_task(
+            'Foreign', self.other, now - timezone.timedelta(days=2)
+        )
+        self.foreign_task.team_members.add(self.member.profile)
+
+        self.url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+        cache.clear()
+
+        return super().setUp()
+
+    def create_task(self, title, user, due_date, **kwargs):
+        """
+        Creates a task owned by the user.
+        """
+        data = {
+            'category': self.category_instance,
+            'priority': self.priority_instance,
+            **kwargs
+        }
+        return models.Task.objects.create(
+            title=title,
+            description='A new task created for testing',
+            due_date=due_date,
+            owner=user.profile,
+            **data
+        )
+
+    def get_titles(self, params):
+        """
+        Returns the sorted task titles of the filtered list.
+        """
+        response = self.client.get(self.url, params)
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return sorted(task['title'] for task in response.data['results'])
+
+    def test_reference_filters(self):
+        """
+        Tests the status, priority and category filters.
+        """
+
+        self.assertEqual(
+            self.get_titles({'status': 'In Progress'}), ['Overdue']
+        )
+        self.assertEqual(
+            self.get_titles({'priority': 'Low Priority'}), ['Completed']
+        )
+        self.assertEqual(
+            self.get_titles({'category': 'Development'}), ['Open']
+        )
+        self.assertEqual(
+            self.get_titles(
+                {'category': 'Human Resource', 'priority': 'High Priority'}
+            ),
+            ['Overdue']
+        )
+
+    def test_user_filters(self):
+        """
+        Tests the owner and member filters together with the
+        visibility rules.
+        """
+
+        self.assertEqual(
+            self.get_titles({'owner': 'owner@gmail.com'}),
+            ['Completed', 'Open', 'Overdue']
+        )
+        # Visible tasks only
+        self.assertEqual(self.get_titles({'owner': 'other@gmail.com'}), [])
+        self.assertEqual(self.get_titles({'member': 'member@gmail.com'}),
+                         ['Open'])
+
+        self.client.force_authenticate(user=self.member)
+        self.assertEqual(
+            self.get_titles({'member': 'member@gmail.com'}),
+            ['Foreign', 'Open']
+        )
+
+    def test_due_date_filters(self):
+        """
+        Tests the due date range, completed and overdue filters.
+        """
+
+        now = timezone.now()
+        self.assertEqual(
+            self.get_titles({'due_before': now.isoformat()}),
+            ['Completed', 'Overdue']
+        )
+        self.assertEqual(
+            self.get_titles({
+                'due_after': (now - timezone.timedelta(days=1, hours=1))
+                .isoformat(),
+                'due_before': now.isoformat(),
+            }),
+            ['Completed']
+        )
+        self.assertEqual(self.get_titles({'completed': 'true'}),
+                         ['Completed'])
+        self.assertEqual(self.get_titles({'completed': 'false'}),
+                         ['Open', 'Overdue'])
+        self.assertEqual(self.get_titles({'overdue': 'true'}), ['Overdue'])
+        self.assertEqual(self.get_titles({'overdue': 'false'}),
+                         ['Completed', 'Open'])
+
+    def test_filters_with_pagination(self):
+        """
+        Tests if the filters are kept on the following pages and the
+        list stays a single query (plus team members).
+        """
+
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                self.url, {'owner': 'owner@gmail.com', 'page_size': 2}
+            )
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertIn('owner=owner%40gmail.com', response.data['next'])
+
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+    def test_invalid_filters(self):
+        """
+        Tests if invalid filters are rejected.
+        """
+
+        now = timezone.now().isoformat()
+        for params in [
+            {'status': 'Unknown'},
+            {'owner': 'no-email'},
+            {'overdue': 'maybe'},
+            {'due_before': 'yesterday'},
+            {'due_after': now, 'due_before': now},
+        ]:
+            response = self.client.get(self.url, params)
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+            self.assertEqual(response.data['message'], 'Invalid filter')
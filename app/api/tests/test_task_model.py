@@ -6,6 +6,8 @@ from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 
 User = get_user_model()
@@ -618,3 +620,249 @@ class TestTaskModel(APITestCase):
     #     expected_fields['created_at'] = timezone.now().date()
 
     #     self.assertEqual(actual_fields, expected_fields)
+
+    def test_view_list_visibility(self):
+        """
+        Tests if the list action only returns the tasks visible to the
+        request user.
+        - Admin: all tasks
+        - Task owner: owned tasks
+        - Team member: tasks of the team
+        - Unrelated user: no tasks
+        """
+
+        url = reverse('task-list')
+
+        # UNAUTHENTICATED
+        response = self.client.get(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        expected_tasks = {
+            self.admin: [self.task.id, self.no_team_task.id],
+            self.owner: [self.task.id, self.no_team_task.id],
+            self.team_member: [self.task.id],
+            self.task_unrelated_user: [],
+        }
+        for user, expected_ids in expected_tasks.items():
+            self.client.force_authenticate(user=user)
+            response = self.client.get(url, format='json')
+            # Correct status code
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            # Only visible tasks, no empty representations
+            retrieved_ids = [
+                task.get('id') for task in response.data.get('results')
+            ]
+            self.assertCountEqual(retrieved_ids, expected_ids)
+
+        # Unrelated user can't retrieve the task
+        url = reverse('task-detail', args=[self.task.id])
+        response = self.client.get(url, format='json')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_view_add_team_member_bulk(self):
+        """
+        Tests if many team members are added with a constant number of
+        queries, existing team members are skipped and unknown ids are
+        reported.
+        """
+
+        url = reverse('task-add_team_member', args=[self.task.id])
+        self.client.force_authenticate(user=self.owner)
+
+        def add_users(amount, offset):
+            """
+            Creates users and adds them to the task. Returns the
+            number of executed queries.
+            """
+            users = []
+            for number in range(offset, offset + amount):
+                user_data = {
+                    'email': f'member{number}@gmail.com',
+                    'password': 'blabla123.'
+                }
+                profile_data = {
+                    'first_name': 'Team',
+                    'last_name': f'Member {number}',
+                }
+                users.append(User.objects.create(user_data, profile_data))
+
+            # Existing team member is skipped
+            data = {
+                'team_members': [self.team_member.id] + [
+                    user.id for user in users
+                ]
+            }
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.patch(url, data, format='json')
+
+            # Correct status code
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return response, len(context.captured_queries)
+
+        response, few_members_queries = add_users(2, 0)
+        response, many_members_queries = add_users(30, 2)
+
+        # Same number of queries
+        self.assertEqual(few_members_queries, many_members_queries)
+        # All team members present
+        self.assertEqual(len(response.data.get('team_members')), 33)
+        self.assertEqual(self.task.team_members.count(), 33)
+
+        # Unknown ids are reported and nothing is added
+        data = {'team_members': [self.task_unrelated_user.id, 9998, 9999]}
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data.get('unknown_ids'), [9998, 9999])
+        self.assertEqual(self.task.team_members.count(), 33)
+
+        # Invalid data
+        data = {'team_members': 'not a list'}
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_view_create_batch(self):
+        """
+        Tests if a list of tasks is created as a batch with its team
+        members, owned by the request user and with a constant number
+        of queries.
+        """
+
+        url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+
+        def task_data(number):
+            """
+            Returns the request data of a single task.
+            """
+            return {
+                'title': f'Batch Task {number}',
+                'description': 'New task description.',
+                'due_date': timezone.now() + timezone.timedelta(days=5),
+                'category': self.category_instance.name,
+                'priority': self.priority_instance.caption,
+                'status': self.status_instance.caption,
+                'team_members': [
+                    self.team_member.profile.id,
+                    self.task_unrelated_user.profile.id
+                ],
+            }
+
+        def create_batch(amount):
+            """
+            Posts a batch of tasks and returns the response and the
+            number of executed queries.
+            """
+            data = [task_data(number) for number in range(amount)]
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.post(url, data, format='json')
+
+            # Correct status code
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return response, len(context.captured_queries)
+
+        # Loads the reference cache
+        create_batch(1)
+
+        response, few_tasks_queries = create_batch(2)
+        response, many_tasks_queries = create_batch(40)
+
+        # Same number of queries
+        self.assertEqual(few_tasks_queries, many_tasks_queries)
+        # All tasks created with owner and team members
+        self.assertEqual(len(response.data), 40)
+        for task in response.data:
+            self.assertEqual(task.get('owner'), self.owner.email)
+            self.assertCountEqual(
+                task.get('team_members'),
+                [self.team_member.email, self.task_unrelated_user.email]
+            )
+        batch_tasks = models.Task.objects.filter(title__startswith='Batch')
+        self.assertEqual(batch_tasks.count(), 43)
+
+        # Single task
+        response = self.client.post(url, task_data(99), format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data.get('owner'), self.owner.email)
+        self.assertEqual(batch_tasks.count(), 44)
+
+        # Errors per task, nothing created
+        data = [task_data(100), task_data(101), task_data(102)]
+        data[1]['priority'] = 'Unknown Priority'
+        data[2]['team_members'] = [9999]
+        response = self.client.post(url, data, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data.get('errors')
+        self.assertEqual([error.get('index') for error in errors], [1, 2])
+        self.assertIn('priority', errors[0].get('error'))
+        self.assertIn('team_members', errors[1].get('error'))
+        self.assertEqual(batch_tasks.count(), 44)
+
+    def test_view_bulk_update(self):
+        """
+        Tests if the bulk update action changes only the tasks the
+        request user is allowed to update and reports the affected and
+        rejected task ids.
+        """
+
+        url = reverse('task-bulk-update')
+        done_status = models.Status.objects.create(
+            caption='Done',
+            description='Indicates that a task is completed.'
+        )
+        data = {
+            'ids': [self.task.id, self.no_team_task.id, 9999],
+            'changes': {'status': done_status.caption}
+        }
+
+        # UNAUTHENTICATED
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        # TEAM MEMBER
+        self.client.force_authenticate(user=self.team_member)
+        response = self.client.patch(url, data, format='json')
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Only the task of the team got updated
+        self.assertEqual(response.data.get('affected'), [self.task.id])
+        self.assertEqual(
+            response.data.get('rejected'), [self.no_team_task.id, 9999]
+        )
+        self.task.refresh_from_db()
+        self.no_team_task.refresh_from_db()
+        self.assertEqual(self.task.status, done_status)
+        self.assertEqual(self.no_team_task.status, self.status_instance)
+
+        # TASK OWNER with filter
+        self.client.force_authenticate(user=self.owner)
+        completed_at = timezone.now()
+        data = {
+            'filter': {'status': self.status_instance.caption},
+            'changes': {
+                'status': done_status.caption,
+                'completed_at': completed_at
+            }
+        }
+        response = self.client.patch(url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data.get('affected'), [self.no_team_task.id])
+        self.assertEqual(response.data.get('rejected'), [])
+        self.no_team_task.refresh_from_db()
+        self.assertEqual(self.no_team_task.status, done_status)
+        self.assertEqual(self.no_team_task.completed_at, completed_at)
+
+        # Bad request
+        invalid_data = [
+            {'ids': [self.task.id], 'changes': {}},
+            {'changes': {'status': done_status.caption}},
+            {'ids': [self.task.id], 'changes': {'status': 'Unknown'}},
+        ]
+        for data in invalid_data:
+            response = self.client.patch(url, data, format='json')
+            self.assertEqual(
+                response.status_code, status.HTTP_400_BAD_REQUEST
+            )
+            # Message not None
+            message = response.data.get('message')
+            self.assertIsNotNone(message)
@@ -0,0 +1,222 @@
+from rest_framework.test import APITestCase, APIRequestFactory
+from api import models, serializers, permissions, membership, views
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestTaskQueries(APITestCase):
+    """
+    Query count regression tests for the TaskView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        # Foreign key Category Instance for the position/task instance
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='''A domain specialized in the area of employee
+                         recruitment and relationship'''
+        )
+
+        # Foreign key Position Instance for the userprofile instance
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='''A Position specialized in the area of employee
+                         recruitment and relationship''',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+
+        # Foreign key Priority instance for the task instance
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+
+        # Foreign key Status instance for the task instance
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+
+        # User as owner for the tasks
+        user_data = {
+            'email': 'peterpahn@gmail.com',
+            'password': 'blabla123.'
+        }
+        profile_data = {
+            'first_name': 'Peter',
+            'last_name': 'Pahn',
+            'position': self.position_instance,
+        }
+        self.owner = User.objects.create(user_data, profile_data)
+
+        # Users as team_members for the tasks
+        self.team_members = []
+        for number in range(3):
+            user_data = {
+                'email': f'team.member{number}@gmail.com',
+                'password': 'blabla123.'
+            }
+            profile_data = {
+                'first_name': 'Team',
+                'last_name': f'Member {number}',
+                'position': self.position_instance,
+            }
+            self.team_members.append(
+                User.objects.create(user_data, profile_data)
+            )
+
+        # Admin user
+        user_data = {
+            'email': 'christian@gmail.com',
+            'password': 'blabla123.'
+        }
+        profile_data = {
+            'first_name': 'Christian',
+            'last_name': 'Wagner',
+            'position': self.position_instance,
+        }
+        self.admin = User.objects.create_superuser(user_data, profile_data)
+
+        return super().setUp()
+
+    def create_tasks(self, amount):
+        """
+        Creates the given amount of tasks with the owner and all team
+        members assigned.
+        """
+
+        for number in range(amount):
+            task = models.Task.objects.create(
+                title=f'Task {number}',
+                description='A new task created for testing',
+                due_date=timezone.now() + timezone.timedelta(days=3),
+                category=self.category_instance,
+                priority=self.priority_instance,
+                status=self.status_instance,
+                owner=self.owner.profile
+            )
+            task.team_members.add(
+                *[user.profile for user in self.team_members]
+            )
+
+    def count_queries(self, url):
+        """
+        Returns the response and the number of executed queries of a
+        GET request to the given url.
+        """
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response, len(context.captured_queries)
+
+    def test_view_list_constant_queries(self):
+        """
+        Tests if the number of queries of the list action stays the
+        same when the number of tasks grows.
+        """
+
+        url = reverse('task-list')
+
+        for user in [self.admin, self.owner, self.team_members[0]]:
+            self.client.force_authenticate(user=user)
+            models.Task.objects.all().delete()
+
+            self.create_tasks(2)
+            response, few_tasks_queries = self.count_queries(url)
+
+            self.create_tasks(20)
+            response, many_tasks_queries = self.count_queries(url)
+
+            # Same number of queries
+            self.assertEqual(few_tasks_queries, many_tasks_queries)
+
+    def test_view_list_representation(self):
+        """
+        Tests if the eager loaded tasks are still presented with the
+        owner/team_members emails and the slugs of their foreign keys.
+        """
+
+        self.create_tasks(1)
+        task = models.Task.objects.get()
+        url = reverse('task-detail', args=[task.id])
+        self.client.force_authenticate(user=self.owner)
+
+        response, queries = self.count_queries(url)
+
+        # Owner as email
+        self.assertEqual(response.data.get('owner'), self.owner.email)
+        # Team members as emails
+        expected_team = [user.email for user in self.team_members]
+        self.assertCountEqual(response.data.get('team_members'), expected_team)
+        # Foreign keys as slugs
+        self.assertEqual(
+            response.data.get('category'), self.category_instance.name
+        )
+        self.assertEqual(
+            response.data.get('priority'), self.priority_instance.caption
+        )
+        self.assertEqual(
+            response.data.get('status'), self.status_instance.caption
+        )
+
+    def test_membership_memoized(self):
+        """
+        Tests if the permission check, the field gating and the
+        representation share a single membership lookup per request.
+        """
+
+        self.create_tasks(1)
+        # Without prefetched team members
+        task = models.Task.objects.get()
+        team_member = self.team_members[0]
+        # Profile of the request user is loaded by the authentication
+        team_member.profile
+
+        url = reverse('task-detail', args=[task.id])
+        request = APIRequestFactory().get(url)
+        request.user = team_member
+        view = views.TaskView()
+
+        # One EXISTS lookup
+        with self.assertNumQueries(1):
+            is_owner = permissions.IsOwner().has_object_permission(
+                request, view, task
+            )
+            is_team_member = permissions.IsTeamMember().has_object_permission(
+                request, view, task
+            )
+            serializer = serializers.TaskSerializer(
+                instance=task,
+                context={'request': request}
+            )
+            fields = serializer.fields
+
+        self.assertFalse(is_owner)
+        self.assertTrue(is_team_member)
+        self.assertTrue(fields['team_members'].read_only)
+
+        # Memoized answer
+        with self.assertNumQueries(0):
+            self.assertTrue(membership.is_team_member(request, task))
+
+        # Representation reuses the answer
+        self.assertEqual(serializer.data.get('owner'), self.owner.email)
+        cache = membership.get_request_cache(request)
+        self.assertEqual(cache, {(team_member.pk, task.pk): True})
+
+        # Unrelated user
+        request = APIRequestFactory().get(url)
+        request.user = self.admin
+        self.assertFalse(membership.is_team_member(request, task))
@@ -0,0 +1,165 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.utils import timezone
+
+
+User = get_user_model()
+
+
+class TestTaskSearch(APITestCase):
+    """
+    Tests related to the full-text search of the task list (FTS5 on
+    SQLite, tsvector on PostgreSQL).
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary models for the creation of Task instances.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.priority_instance = models.Priority.objects.create(
+            caption='High Priority'
+        )
+        self.status_instance = models.Status.objects.create(
+            caption='In Progress',
+            description='Indicates that a task is stillin progress.'
+        )
+        self.users = []
+        for name in ['owner', 'other']:
+            self.users.append(User.objects.create(
+                user_data={
+                    'email': f'{name}@gmail.com',
+                    'password': 'blabla123.'
+                },
+                profile_data={
+                    'first_name': name,
+                    'last_name': 'User',
+                    'position': self.position_instance,
+                }
+            ))
+        self.owner, self.other = self.users
+
+        self.title_task = self.create_task(
+            'Quarterly report', 'Collect the numbers', self.owner
+        )
+        self.description_task = self.create_task(
+            'Meeting', 'Present the quarterly reports', self.owner
+        )
+        self.create_task('Hiring', 'Interview the candidates', self.owner)
+        # Not visible to the owner
+        self.create_task('Quarterly report', 'Foreign task', self.other)
+
+        self.url = reverse('task-list')
+        self.client.force_authenticate(user=self.owner)
+        cache.clear()
+
+        return super().setUp()
+
+    def create_task(self, title, description, user):
+        """
+        Creates a task owned by the user.
+        """
+        return models.Task.objects.create(
+            title=title,
+            description=description,
+            due_date=timezone.now() + timezone.timedelta(days=3),
+            category=self.category_instance,
+            priority=self.priority_instance,
+            status=self.status_instance,
+            owner=user.profile
+        )
+
+    def search(self, terms, **params):
+        """
+        Returns the titles of the tasks found by the search terms.
+        """
+        response = self.client.get(self.url, {'q': terms, **params})
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [task['title'] for task in response.data['results']]
+
+    def test_ranked_search(self):
+        """
+        Tests if matches in the title rank above matches in the
+        description and if words are stemmed.
+        """
+
+        self.assertEqual(
+            self.search('quarterly report'), ['Quarterly report', 'Meeting']
+        )
+        self.assertEqual(self.search('reporting'),
+                         ['Quarterly report', 'Meeting'])
+        self.assertEqual(self.search('candidates'), ['Hiring'])
+        self.assertEqual(self.search('quarterly candidates'), [])
+
+        # Empty search
+        self.assertEqual(len(self.search('')), 3)
+
+    def test_search_maintained_on_write(self):
+        """
+        Tests if updates, deletions and batch creations are searchable
+        immediately.
+        """
+
+        self.title_task.title = 'Annual budget'
+        self.title_task.save()
+        self.assertEqual(self.search('budget'), ['Annual budget'])
+        self.assertEqual(self.search('quarterly'), ['Meeting'])
+
+        self.description_task.delete()
+        self.assertEqual(self.search('quarterly'), [])
+
+        response = self.client.post(self.url, [{
+            'title': 'Batch task',
+            'description': 'Quarterly planning',
+            'due_date': timezone.now() + timezone.timedelta(days=3),
+            'category': self.category_instance.name,
+            'priority': self.priority_instance.caption,
+            'status': self.status_instance.caption,
+        }], format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(self.search('planning'), ['Batch task'])
+
+    def test_search_pages(self):
+        """
+        Tests if the ranked results are paginated and combine with
+        the filters.
+        """
+
+        response = self.client.get(
+            self.url, {'q': 'quarterly', 'page_size': 1}
+        )
+        self.assertEqual(
+            response.data['results'][0]['title'], 'Quarterly report'
+        )
+        response = self.client.get(response.data['next'])
+        self.assertEqual(response.data['results'][0]['title'], 'Meeting')
+        self.assertIsNone(response.data['next'])
+
+        self.assertEqual(
+            self.search('quarterly', status='In Progress'),
+            ['Quarterly report', 'Meeting']
+        )
+
+    def test_search_syntax(self):
+        """
+        Tests if search syntax characters don't cause errors.
+        """
+
+        self.assertEqual(self.search('"quarterly" OR* (NEAR'),
+                         [])
+        self.assertEqual(self.search('***'), [])
@@ -0,0 +1,146 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.db import connection
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test.utils import CaptureQueriesContext
+
+
+User = get_user_model()
+
+
+class TestUserAutocomplete(APITestCase):
+    """
+    Tests related to the user autocompletion (/api/users/autocomplete/)
+    and the user list search.
+    """
+
+    def setUp(self) -> None:
+        """
+        Users with different emails and names.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        users = [
+            ('peterpahn@gmail.com', 'Peter', 'Pahn'),
+            ('annapeters@gmail.com', 'Anna', 'Peters'),
+            ('jdoe@gmail.com', 'John', 'Doe'),
+            ('mpeter@gmail.com', 'Mark', 'Smith'),
+        ]
+        self.users = {}
+        for email, first_name, last_name in users:
+            self.users[email] = User.objects.create(
+                user_data={'email': email, 'password': 'blabla123.'},
+                profile_data={
+                    'first_name': first_name,
+                    'last_name': last_name,
+                    'position': self.position_instance,
+                }
+            )
+        self.url = reverse('customuser-autocomplete')
+        self.client.force_authenticate(user=self.users['jdoe@gmail.com'])
+
+    def tearDown(self) -> None:
+        cache.clear()
+
+    def test_autocomplete(self):
+        """
+        Ensures the matching users are returned with their names and
+        position, prefix matches first.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, {'q': 'peter'})
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # A single query (besides the authentication)
+        self.assertEqual(
+            len([
+                query for query in queries.captured_queries
+                if 'api_customuser' in query['sql']
+                and 'api_position' in query['sql']
+            ]), 1
+        )
+        emails = [user['email'] for user in response.data['results']]
+        # Prefix matches (email or name) before substring matches
+        self.assertEqual(
+            emails,
+            ['annapeters@gmail.com', 'peterpahn@gmail.com',
+             'mpeter@gmail.com']
+        )
+        self.assertEqual(
+            response.data['results'][1],
+            {
+                'id': self.users['peterpahn@gmail.com'].id,
+                'email': 'peterpahn@gmail.com',
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': 'Human Resource Specialist',
+            }
+        )
+
+    def test_short_term(self):
+        """
+        Ensures terms shorter than three characters only match prefixes.
+        """
+        response = self.client.get(self.url, {'q': 'pe'})
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user['email'] for user in response.data['results']],
+            ['annapeters@gmail.com', 'peterpahn@gmail.com']
+        )
+
+    def test_limit(self):
+        """
+        Ensures the number of results is capped.
+        """
+        response = self.client.get(self.url, {'q': 'gmail', 'limit': 2})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 2)
+
+        response = self.client.get(self.url, {'q': 'gmail', 'limit': 'x'})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.url, {'q': ''})
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    def test_unauthenticated(self):
+        """
+        Ensures only authenticated users can autocomplete users.
+        """
+        self.client.force_authenticate(user=None)
+        response = self.client.get(self.url, {'q': 'peter'})
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_list_search_names(self):
+        """
+        Ensures the user list searches the first and last names.
+        """
+        response = self.client.get(reverse('customuser-list'), {
+            'search': 'smith'
+        })
+
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [user['email'] for user in response.data['results']],
+            ['mpeter@gmail.com']
+        )
@@ -0,0 +1,185 @@
+import io
+import json
+import tempfile
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+from api import models, importers
+
+
+User = get_user_model()
+
+
+class TestUserImport(APITestCase):
+    """
+    Tests related to the bulk import of users from CSV and NDJSON
+    files.
+    """
+
+    def setUp(self) -> None:
+        """
+        Necessary reference data and an admin who imports the users.
+        """
+        self.category_instance = models.Category.objects.create(
+            name='Human Resource',
+            description='A domain specialized in employee recruitment'
+        )
+        self.position_instance = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='A Position specialized in employee recruitment',
+            is_task_manager=True,
+            category=self.category_instance
+        )
+        self.superuser = User.objects.create_superuser(
+            user_data={
+                'email': 'superuser@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Super',
+                'last_name': 'User',
+                'position': self.position_instance,
+            }
+        )
+        self.user = User.objects.create(
+            user_data={
+                'email': 'peterpahn@gmail.com',
+                'password': 'blabla123.'
+            },
+            profile_data={
+                'first_name': 'Peter',
+                'last_name': 'Pahn',
+                'position': self.position_instance,
+            }
+        )
+        self.csv_content = (
+            'email,password,first_name,last_name,position\n'
+            'anna.alt@gmail.com,blabla123.,Anna,Alt,'
+            'Human Resource Specialist\n'
+            'bernd.bauer@gmail.com,blabla123.,Bernd,Bauer,\n'
+            'not-an-email,blabla123.,Carl,Clever,\n'
+            'peterpahn@gmail.com,blabla123.,Peter,Pahn,\n'
+            'anna.alt@gmail.com,blabla123.,Anna,Alt,\n'
+            'dora.dahl@gmail.com,blabla123.,Dora,Dahl,Unknown Position\n'
+        )
+
+        return super().setUp()
+
+    def test_import_csv(self):
+        """
+        Tests if the valid rows are imported with their profiles and
+        the invalid ones reported by their row number.
+        """
+
+        importer = importers.UserImporter(chunk_size=2, workers=0)
+        importer.run(
+            importers.read_rows(io.StringIO(self.csv_content), 'csv')
+        )
+
+        self.assertEqual(importer.created, 2)
+        self.assertEqual(
+            [error['row'] for error in importer.errors], [3, 4, 5, 6]
+        )
+        self.assertIn('email', importer.errors[0]['error'])
+        self.assertIn('position', importer.errors[3]['error'])
+
+        # Created users with their profile
+        anna = User.objects.get(email='anna.alt@gmail.com')
+        self.assertTrue(anna.check_password('blabla123.'))
+        self.assertEqual(anna.profile.first_name, 'Anna')
+        self.assertEqual(anna.profile.position, self.position_instance)
+        bernd = User.objects.get(email='bernd.bauer@gmail.com')
+        self.assertIsNone(bernd.profile.position)
+
+    def test_import_ndjson_with_process_pool(self):
+        """
+        Tests if the passwords are hashed by the process pool and
+        invalid lines are reported.
+        """
+
+        lines = [
+            json.dumps({
+                'email': 'anna.alt@gmail.com',
+                'password': 'blabla123.',
+                'first_name': 'Anna',
+                'last_name': 'Alt',
+            }),
+            '{invalid json',
+            json.dumps({
+                'email': 'bernd.bauer@gmail.com',
+                'password': 'secret456.',
+                'first_name': 'Bernd',
+                'last_name': 'Bauer',
+            }),
+        ]
+        stream = io.StringIO('\n'.join(lines) + '\n')
+
+        importer = importers.UserImporter(workers=2)
+        importer.run(importers.read_rows(stream, 'ndjson'))
+
+        self.assertEqual(importer.created, 2)
+        self.assertEqual(importer.errors, [{'row': 2, 'error': 'Invalid row'}])
+        bernd = User.objects.get(email='bernd.bauer@gmail.com')
+        self.assertTrue(bernd.check_password('secret456.'))
+
+    def test_import_command(self):
+        """
+        Tests the import_users management command.
+        """
+
+        stdout = io.StringIO()
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.csv', encoding='utf-8-sig'
+        ) as import_file:
+            import_file.write(self.csv_content)
+            import_file.flush()
+
+            call_command(
+                'import_users', import_file.name, workers=0,
+                stdout=stdout, stderr=io.StringIO()
+            )
+
+        self.assertIn('2 users imported, 4 rows failed', stdout.getvalue())
+        self.assertTrue(
+            User.objects.filter(email='bernd.bauer@gmail.com').exists()
+        )
+
+    def test_view_import(self):
+        """
+        Tests the import action of the user view.
+        """
+
+        url = reverse('customuser-import-users')
+        # With the byte order mark of spreadsheet exports
+        upload = SimpleUploadedFile(
+            'users.csv', self.csv_content.encode('utf-8-sig'),
+            content_type='text/csv'
+        )
+
+        # Not allowed for regular users
+        self.client.force_authenticate(user=self.user)
+        response = self.client.post(
+            url, {'file': upload}, format='multipart'
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        # Missing file
+        self.client.force_authenticate(user=self.superuser)
+        response = self.client.post(url, {}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        upload.seek(0)
+        response = self.client.post(
+            url, {'file': upload}, format='multipart'
+        )
+        # Correct status code
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Correct response data
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(len(response.data['errors']), 4)
+        self.assertTrue(
+            User.objects.filter(email='anna.alt@gmail.com').exists()
+        )
@@ -0,0 +1,109 @@
+from rest_framework.test import APITestCase
+from api import models
+from rest_framework import status
+from django.urls import reverse
+from django.contrib.auth import get_user_model
+
+
+User = get_user_model()
+
+
+class TestCustomUserQueries(APITestCase):
+    """
+    Query count regression tests for the CustomUserView.
+    """
+
+    def setUp(self) -> None:
+        """
+        Creates a set of instances required for this testing class.
+        """
+
+        # Category instances
+        self.category = models.Category.objects.create(
+            name='Human Resource',
+            description='This is a category named human resource.'
+        )
+        # Position instances
+        self.position = models.Position.objects.create(
+            title='Human Resource Specialist',
+            description='This is a position titled Human Resource Specialist.',
+            is_task_manager=True,
+            category=self.category
+        )
+        # User instances
+        self.user = self.create_user('some.email@example.com')
+
+        return super().setUp()
+
+    def create_user(self, email):
+        """
+        Creates a user with a profile and position.
+        """
+
+        return User.objects.create(
+            user_data={
+                'email': email,
+                'password': 'testpassword123'
+            },
+            profile_data={
+                'first_name': 'John',
+                'last_name': 'Doe',
+                'position': self.position
+            }
+        )
+
+    def test_view_list_constant_queries(self):
+        """
+        Tests if the list action needs a single query no matter how
+        many users exist.
+        """
+
+        url = reverse('customuser-list')
+        self.client.force_authenticate(user=self.user)
+
+        for number in range(10):
+            self.create_user(f'user{number}@example.com')
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Nested profile/position data present
+        position = response.data['results'][0]['profile']['position']
+        self.assertEqual(position['title'], self.position.title)
+        self.assertEqual(position['category'], self.category.name)
+
+    def test_view_retrieve_constant_queries(self):
+        """
+        Tests if the retrieve action needs a single query.
+        """
+
+        url = reverse('customuser-detail', args=[self.user.id])
+        self.client.force_authenticate(user=self.user)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['email'], self.user.email)
+
+    def test_view_list_filter_backends(self):
+        """
+        Tests if the search and ordering filters are applied to the
+        list action.
+        """
+
+        self.create_user('another.email@example.com')
+        self.create_user('zz.email@example.com')
+        url = reverse('customuser-list')
+        self.client.force_authenticate(user=self.user)
+
+        # Search
+        response = self.client.get(url, {'search': 'another'}, format='json')
+        emails = [user['email'] for user in response.data['results']]
+        self.assertEqual(emails, ['another.email@example.com'])
+
+        # Ordering
+        response = self.client.get(url, {'ordering': '-email'}, format='json')
+        emails = [user['email'] for user in response.data['results']]
+        self.assertEqual(emails, sorted(emails, reverse=True))
@@ -0,0 +1,20 @@
+from itertools import islice
+
+
+def chunked(iterable, size):
+    """
+    Splits an iterable into lists of at most the given size without
+    materializing the whole iterable.
+
+    Example:
+    ```python
+    list(chunked(range(5), 2))  # [[0, 1], [2, 3], [4]]
+    ```
+    """
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
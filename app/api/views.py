@@ -1,14 +1,25 @@
-from django.shortcuts import render, get_object_or_404
+import codecs
+import csv
+from django.http import StreamingHttpResponse
+from django.shortcuts import render
 from rest_framework import viewsets, response, status, permissions as perm, \
-    filters, decorators
-from rest_framework.authentication import TokenAuthentication
-from api import models, serializers, permissions as cust_perm
+    filters, decorators, parsers
+from api import models, serializers, pagination, importers, exporters, \
+    row_serializers, autocomplete, summary, permissions as cust_perm
+from api.conditional import ConditionalGetMixin
+from api.sync import DeltaSyncMixin
+from api.filters import TaskFilterBackend, TaskSearchFilter
+from api.response_cache import task_lists
+from api.authentication import CachedTokenAuthentication
+from api.utils import chunked
 from django.contrib.auth import get_user_model
+from django.db.models import Prefetch
 
 User = get_user_model()
 
 
-class CustomUserView(viewsets.GenericViewSet):
+class CustomUserView(DeltaSyncMixin, ConditionalGetMixin,
+                     viewsets.GenericViewSet):
     """
     Manages the CRUD operations for the CustomUser model. The create
     action uses a different serializer to create a CustomUser instance
@@ -25,23 +36,43 @@ class CustomUserView(viewsets.GenericViewSet):
     - first_name
     - last_name
     - position_instance (Position.title)
+
+    Extra actions:
+    - Import users (CSV/NDJSON file)
+    - Autocomplete users by email, first name or last name
+
+    The list and retrieve actions answer conditional requests
+    (If-None-Match, If-Modified-Since), see ConditionalGetMixin. The
+    list action presents values() rows (see api.row_serializers) and
+    answers delta sync requests (?updated_since=), see DeltaSyncMixin.
     """
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     queryset = User.objects.all()
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ['id', 'email']
+    search_fields = ['email', 'profile__first_name', 'profile__last_name']
     ordering_fields = ['id', 'email']
+    ordering = ['id']
+    pagination_class = pagination.UserPagination
+    row_serializer_class = row_serializers.UserRowSerializer
+    sync_kind = models.Tombstone.USER
+    sync_updated_field = 'profile__updated_at'
+    import_chunk_size = 500
+    # Passwords are hashed within the request process, the process
+    # pool is left to the import_users command
+    import_workers = 0
+    autocomplete_limit = 10
+    autocomplete_max_limit = 25
 
     def get_permissions(self):
         """
         Returns permission classes based on the acessed view action.
         """
         permission_classes = []
-        if self.action == 'create':
+        if self.action in ['create', 'import_users']:
             permission_classes = [perm.IsAdminUser]
 
-        elif self.action in ['retrieve', 'list']:
+        elif self.action in ['retrieve', 'list', 'autocomplete']:
             permission_classes = [perm.IsAuthenticated]
 
         if self.action in ['update', 'partial_update', 'destroy']:
@@ -49,6 +80,13 @@ class CustomUserView(viewsets.GenericViewSet):
 
         return [permission() for permission in permission_classes]
 
+    def get_sync_queryset(self):
+        """
+        Returns the users for the delta sync, a change of a user bumps
+        its profile (see api.signals).
+        """
+        return User.objects.all()
+
     def get_serializer_class(self):
         """
         Returns the serializer class based on the view action.
@@ -60,6 +98,34 @@ class CustomUserView(viewsets.GenericViewSet):
 
         return serializers.CustomUserSerializer
 
+    def get_queryset(self):
+        """
+        Returns the users joined with their profile, position and
+        position category, which are needed to represent a user. The
+        columns which are not part of a requested sparse fieldset
+        (?fields=/?exclude=) are deferred.
+        """
+        queryset = User.objects.select_related('profile__position__category')
+
+        selection = serializers.get_field_selection(self.request)
+        if selection == (None, set()):
+            return queryset
+
+        deferred = ['password', 'last_login'] + [
+            name for name in ['email', 'is_active', 'is_superuser',
+                              'is_staff']
+            if not serializers.is_field_selected(name, selection)
+        ]
+        # The profile is needed for the ETag (updated_at)
+        if not serializers.is_field_selected('profile', selection):
+            queryset = User.objects.select_related('profile')
+            deferred += [
+                'profile__first_name', 'profile__last_name',
+                'profile__position'
+            ]
+
+        return queryset.defer(*deferred)
+
     def create(self, request):
         """
         Creates a CustomUser instance together with its UserProfile
@@ -95,6 +161,101 @@ class CustomUserView(viewsets.GenericViewSet):
 
         )
 
+    @decorators.action(
+        methods=['post'], detail=False, url_path='import',
+        parser_classes=[parsers.MultiPartParser]
+    )
+    def import_users(self, request):
+        """
+        Imports CustomUser instances together with their UserProfile
+        from an uploaded CSV (with header) or NDJSON file. The file is
+        read line by line and inserted in chunks within one
+        transaction, invalid rows are skipped and reported by their row
+        number. Only admins are allowed.
+
+        Expected data (multipart):
+        - file (columns: email, password, first_name, last_name,
+          position)
+        - format (optional: csv, ndjson), determined by the file
+          extension by default
+        """
+
+        upload = request.FILES.get('file')
+        if upload is None:
+            return response.Response(
+                {'message': 'No file uploaded'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        file_format = request.data.get('format') or importers.get_format(
+            upload.name
+        )
+        if file_format not in importers.IMPORT_FORMATS:
+            return response.Response(
+                {
+                    'message': 'format must be one of '
+                    f'{", ".join(importers.IMPORT_FORMATS)}'
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        importer = importers.UserImporter(
+            chunk_size=self.import_chunk_size,
+            workers=self.import_workers
+        )
+        # utf-8-sig drops the byte order mark of spreadsheet exports
+        lines = codecs.iterdecode(upload, 'utf-8-sig')
+        try:
+            importer.run(importers.read_rows(lines, file_format))
+        except (UnicodeDecodeError, csv.Error):
+            return response.Response(
+                {'message': 'The file could not be read'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return response.Response(
+            {
+                'message': f'{importer.created} users successfully imported',
+                'created': importer.created,
+                'errors': importer.errors
+            }, status=status.HTTP_200_OK
+        )
+
+    @decorators.action(methods=['get'], detail=False)
+    def autocomplete(self, request):
+        """
+        Returns the users whose email, first name or last name matches
+        the search term, prefix matches first (see api.autocomplete).
+
+        Query parameters:
+        - q (search term)
+        - limit (optional: number of results, up to
+          autocomplete_max_limit)
+        """
+
+        term = request.query_params.get('q', '').strip()
+        try:
+            limit = int(request.query_params.get(
+                'limit', self.autocomplete_limit
+            ))
+        except ValueError:
+            return response.Response(
+                {
+                    'message': 'Invalid limit',
+                    'error': 'limit must be an integer'
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+        limit = max(1, min(limit, self.autocomplete_max_limit))
+
+        results = []
+        if term:
+            results = autocomplete.autocomplete_users(
+                User.objects.all(), term, limit
+            )
+
+        return response.Response(
+            {'results': results}, status=status.HTTP_200_OK
+        )
+
     def update(self, request, pk):
         """
         Updates single CustomUser instances.
@@ -166,30 +327,18 @@ class CustomUserView(viewsets.GenericViewSet):
             status.HTTP_204_NO_CONTENT
         )
 
-    def list(self, request):
-        """
-        Retrieves list of multiple CustomUser instances.
-        """
-        queryset = self.queryset
-        serializer = self.get_serializer(
-            instance=queryset,
-            many=True
-        )
-
-        return response.Response(serializer.data)
-
-    def retrieve(self, request, pk):
+    def get_version(self, instance):
         """
-        Retrieves  single CustomUser instances.
+        Returns the version of a CustomUser instance for its ETag. The
+        profile gets bumped whenever the user or profile changes.
         """
+        profile = getattr(instance, 'profile', None)
+        updated_at = profile.updated_at if profile else None
 
-        instance = self.get_object()
-        serializer = self.get_serializer(instance=instance)
-
-        return response.Response(serializer.data)
+        return (instance.pk, updated_at), updated_at
 
 
-class TaskView(viewsets.ModelViewSet):
+class TaskView(DeltaSyncMixin, ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Creates an instance of the CustomUser model with its respective
     UserProfile.
@@ -202,48 +351,339 @@ class TaskView(viewsets.ModelViewSet):
     - priority (Priority.caption)
     - status (Status.caption)
 
+    Query parameters of the list (and export):
+    - status, priority, category, owner, member, due_before,
+      due_after, completed, overdue (see TaskFilterBackend)
+    - q, full-text search of the title and description ordered by
+      rank (see TaskSearchFilter)
+
     Extra actions:
+    - My tasks (owned and team member tasks by due date)
     - Add team member
+    - Remove team member
+    - Bulk update
+    - Export (CSV/NDJSON)
+    - Dashboard (task counts per owner and team member)
+
+    The list and retrieve actions answer conditional requests
+    (If-None-Match, If-Modified-Since), see ConditionalGetMixin. The
+    list action presents values() rows (see api.row_serializers) and
+    answers delta sync requests (?updated_since=), see DeltaSyncMixin.
     """
 
     queryset = models.Task.objects.all()
     serializer_class = serializers.TaskSerializer
-    authentication_classes = [TokenAuthentication]
+    filter_backends = [TaskFilterBackend, TaskSearchFilter]
+    authentication_classes = [CachedTokenAuthentication]
+    pagination_class = pagination.TaskPagination
+    row_serializer_class = row_serializers.TaskRowSerializer
+    sync_kind = models.Tombstone.TASK
+    # Deleted tasks are reported to their owner and team members only
+    sync_shared_deletions = False
+    max_batch_size = 10000
+    bulk_chunk_size = 1000
+    export_chunk_size = 2000
 
     def get_permissions(self):
         """
         Returns permission classes based on the acessed view action.
+        Every action requires an authenticated user, since the visible
+        tasks are determined by the request user.
         """
 
-        permission_classes = []
+        permission_classes = [perm.IsAuthenticated]
         if self.action in ['add_team_member', 'remove_team_member']:
-            permission_classes = [perm.IsAdminUser | cust_perm.IsOwner]
-
-        elif self.action == 'create':
-            permission_classes = [perm.IsAdminUser | perm.IsAuthenticated]
+            permission_classes.append(perm.IsAdminUser | cust_perm.IsOwner)
 
         elif self.action in ['partial_update', 'update']:
-            permission_classes = [
+            permission_classes.append(
                 perm.IsAdminUser | cust_perm.IsOwner | cust_perm.IsTeamMember
-            ]
+            )
 
         return [permission() for permission in permission_classes]
 
+    def get_queryset(self):
+        """
+        Returns the tasks visible to the request user together with
+        their owner, category, priority, status and team members, so
+        that the representation of a task does not cause any further
+        queries. Staff users see all tasks, other users the tasks they
+        own or are a team member of (the mine action: everybody). The
+        columns which are not part of a requested sparse fieldset
+        (?fields=/?exclude=) are deferred.
+        """
+        fields, exclude = serializers.get_field_selection(self.request)
+
+        if self.action == 'mine':
+            tasks = models.Task.objects.mine(self.request.user)
+        else:
+            tasks = models.Task.objects.visible_to(self.request.user)
+
+        return tasks.with_related(fields=fields, exclude=exclude)
+
+    def get_serializer_class(self):
+        """
+        Returns the serializer class based on the view action, the
+        tasks of the mine action are presented with the role of the
+        request user.
+        """
+        if self.action == 'mine':
+            return serializers.MyTaskSerializer
+
+        return serializers.TaskSerializer
+
+    def get_version(self, instance):
+        """
+        Returns the version of a Task instance for its ETag.
+        """
+        version = (instance.pk, instance.version, instance.updated_at)
+
+        return version, instance.updated_at
+
+    def get_sync_queryset(self):
+        """
+        Returns the tasks visible to the request user for the delta
+        sync, changes of resources and team members bump the task (see
+        api.signals).
+        """
+        return models.Task.objects.visible_to(self.request.user)
+
+    def list(self, request, *args, **kwargs):
+        """
+        Retrieves a page of the tasks visible to the request user from
+        the task list cache, which is invalidated by any change of
+        these tasks (see api.response_cache). Delta sync requests
+        (?updated_since=) aren't cached.
+        """
+
+        if self.is_sync_request(request):
+            return self.sync(request)
+
+        return task_lists.get_response(
+            request, lambda: super(TaskView, self).list(
+                request, *args, **kwargs
+            )
+        )
+
+    def create(self, request, *args, **kwargs):
+        """
+        Creates a Task instance, or a batch of Task instances when a
+        list of tasks is sent. A batch is validated as a whole and
+        created within one transaction, validation errors are reported
+        per task (index within the list).
+        """
+
+        if not isinstance(request.data, list):
+            return super().create(request, *args, **kwargs)
+
+        if len(request.data) > self.max_batch_size:
+            return response.Response(
+                {
+                    'message': 'A batch can contain at most '
+                    f'{self.max_batch_size} tasks'
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = self.get_serializer(data=request.data, many=True)
+
+        if serializer.is_valid():
+            self.perform_create(serializer)
+
+            return response.Response(
+                serializer.data, status=status.HTTP_201_CREATED
+            )
+
+        return response.Response(
+            {
+                'message': 'Validation error',
+                'errors': [
+                    {'index': index, 'error': error}
+                    for index, error in enumerate(serializer.errors)
+                    if error
+                ]
+            }, status=status.HTTP_400_BAD_REQUEST
+        )
+
     def perform_create(self, serializer):
         """
         Saves the request user as the Task owner.
         """
-        serializer.validated_data['owner'] = self.request.user.profile
-        return super().perform_create(serializer)
+        serializer.save(owner=self.request.user.profile)
+
+    @decorators.action(
+        methods=['get'], detail=False,
+        pagination_class=pagination.MyTaskPagination
+    )
+    def mine(self, request):
+        """
+        Retrieves the tasks the request user owns or is a team member
+        of (also for staff users), de-duplicated and presented with the
+        role of the user (owner, member), ordered by the due date.
+        Takes the query parameters of the list and answers conditional
+        requests, but isn't served from the task list cache.
+        """
+
+        return super().list(request)
+
+    @decorators.action(methods=['patch'], detail=False)
+    def bulk_update(self, request):
+        """
+        Applies the same changes to many Task instances, selected by
+        their ids or by a filter. Only tasks the request user is
+        allowed to update (admin, Task.owner, team member) are changed,
+        with one UPDATE per chunk of tasks.
+
+        Expected data:
+        - {ids: [Task.id,], changes: {status: 'Done'}}
+        - {filter: {status: 'In Progress'}, changes: {status: 'Done'}}
+
+        Changeable fields:
+        - status (Status.caption)
+        - priority (Priority.caption)
+        - due_date
+        - completed_at
+        """
+
+        serializer = serializers.TaskBulkUpdateSerializer(data=request.data)
+
+        if not serializer.is_valid():
+            return response.Response(
+                {
+                    'message': 'Validation error', 'error': serializer.errors
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        ids = serializer.validated_data.get('ids')
+        task_filter = serializer.validated_data.get('filter')
+        changes = serializer.validated_data.get('changes')
+
+        # Tasks the request user is allowed to update
+        tasks = models.Task.objects.visible_to(request.user)
+        if ids is None:
+            ids = list(
+                tasks.filter(**task_filter).order_by('pk')
+                .values_list('pk', flat=True)
+            )
+        else:
+            ids = list(dict.fromkeys(ids))
+
+        affected_ids = []
+        rejected_ids = []
+        for chunk in chunked(ids, self.bulk_chunk_size):
+            allowed_ids = set(
+                tasks.filter(pk__in=chunk).values_list('pk', flat=True)
+            )
+            # Updates don't send signals
+            with summary.tracking(allowed_ids):
+                models.Task.objects.filter(
+                    pk__in=allowed_ids
+                ).touch(**changes)
+            task_lists.invalidate_tasks(allowed_ids)
+
+            for task_id in chunk:
+                if task_id in allowed_ids:
+                    affected_ids.append(task_id)
+                else:
+                    rejected_ids.append(task_id)
+
+        return response.Response(
+            {
+                'message': 'Tasks successfully updated',
+                'affected': affected_ids,
+                'rejected': rejected_ids
+            }, status=status.HTTP_200_OK
+        )
+
+    @decorators.action(methods=['get'], detail=False)
+    def export(self, request):
+        """
+        Streams all tasks visible to the request user as CSV or NDJSON
+        file with the representation of the TaskSerializer (team
+        members are joined with semicolons in CSV). The tasks are read
+        chunk by chunk, so the memory use doesn't grow with the number
+        of tasks.
+
+        Query parameters:
+        - export_format (csv, ndjson), csv by default
+        - the filters of the list (see TaskFilterBackend)
+        """
+
+        export_format = request.query_params.get('export_format', 'csv')
+        if export_format not in exporters.EXPORT_FORMATS:
+            return response.Response(
+                {
+                    'message': 'export_format must be one of '
+                    f'{", ".join(exporters.EXPORT_FORMATS)}'
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Category, priority and status are resolved by the reference
+        # cache, visibility is given by the queryset
+        queryset = self.filter_queryset(
+            models.Task.objects.visible_to(request.user)
+        ).select_related('owner__owner').prefetch_related(
+            Prefetch(
+                'team_members',
+                queryset=models.UserProfile.objects.select_related(
+                    'owner'
+                ).order_by('pk')
+            )
+        ).order_by('pk')
+        serializer = serializers.TaskSerializer()
+
+        export_response = StreamingHttpResponse(
+            exporters.iter_export(
+                queryset, serializer, export_format, self.export_chunk_size
+            ),
+            content_type=exporters.EXPORT_FORMATS[export_format]
+        )
+        export_response['Content-Disposition'] = \
+            f'attachment; filename="tasks.{export_format}"'
+
+        return export_response
+
+    @decorators.action(methods=['get'], detail=False)
+    def dashboard(self, request):
+        """
+        Returns the task counts by status, priority and category per
+        owner and per team member, read from the task summary (see
+        api.summary), so the cost grows with the number of groups and
+        not with the number of tasks. Staff users and task managers see
+        everybody, other users their own counts.
+        """
+
+        profile = request.user.profile
+        position = profile.position
+        if request.user.is_staff or (position and position.is_task_manager):
+            results = summary.get_dashboard()
+        else:
+            results = summary.get_dashboard(profiles=[profile.pk])
+
+        return response.Response(
+            {'results': results}, status=status.HTTP_200_OK
+        )
+
+    def get_team_member_emails(self, task_instance):
+        """
+        Returns the emails of the team members of the Task instance
+        with a single query.
+        """
+        return list(
+            models.UserProfile.objects.filter(teams=task_instance)
+            .order_by('id')
+            .values_list('owner__email', flat=True)
+        )
 
     @decorators.action(methods=['patch'], detail=True)
     def add_team_member(self, request, pk):
         """
-        Adds a CustomUser to the team_members field of the Task
-        instance.
+        Adds CustomUsers to the team_members field of the Task
+        instance. All user ids are resolved with one query and added
+        with one bulk insert, which ignores existing team members.
+        Nothing is added when any of the ids is unknown.
 
         Allows only:
-        - Admin 
+        - Admin
         - Task.owner.
 
         Expected data:
@@ -252,35 +692,40 @@ class TaskView(viewsets.ModelViewSet):
         team_members = request.data.get('team_members')
         task_instance = self.get_object()
 
-        def add_team_members(team_members, task_instance):
-            """
-            Checks if the id within the requet data are valid, then
-            retrieves the user(userprofile) instances and adds them
-            to the task instance. Sends a bad request response when
-            user(userprofile) doesnt exist
-            """
-            for id in team_members:
-                try:
-                    team_member = get_object_or_404(User, id=id).profile
-                except User.DoesNotExist:
-                    return response.Response(
-                        {
-                            'message': f'''Team member with the id {id}
-                            does not exist'''
-                        }, status=status.HTTP_400_BAD_REQUEST
-                    )
+        user_ids = None
+        if isinstance(team_members, list):
+            try:
+                user_ids = {int(user_id) for user_id in team_members}
+            except (TypeError, ValueError):
+                pass
 
-                task_instance.team_members.add(team_member)
+        if user_ids is None:
+            return response.Response(
+                {
+                    'message': 'team_members must be a list of user ids'
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
 
-        add_team_members(team_members, task_instance)
+        profile_ids = dict(
+            models.UserProfile.objects.filter(owner_id__in=user_ids)
+            .values_list('owner_id', 'id')
+        )
+        unknown_ids = sorted(user_ids - profile_ids.keys())
 
-        serialized_data = self.get_serializer(task_instance).data
-        member_list = serialized_data.get('team_members')
+        if unknown_ids:
+            return response.Response(
+                {
+                    'message': 'Team members do not exist',
+                    'unknown_ids': unknown_ids
+                }, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        task_instance.team_members.add(*profile_ids.values())
 
         return response.Response(
             {
                 'message': 'Team members got successfully added',
-                'team_members': member_list
+                'team_members': self.get_team_member_emails(task_instance)
             }, status=status.HTTP_200_OK
         )
 
@@ -294,36 +739,38 @@ class TaskView(viewsets.ModelViewSet):
         - {team_member: id}
         """
 
+        user_id = request.data.get('team_member')
+        task_instance = self.get_object()
+
         try:
-            user_id = request.data.get('team_member')
-            team_member = get_object_or_404(User, id=user_id).profile
-        except:
+            profile_id = models.UserProfile.objects.filter(
+                owner_id=user_id
+            ).values_list('id', flat=True).first()
+        except (TypeError, ValueError):
+            profile_id = None
+
+        if profile_id is None:
             return response.Response(
                 {
                     'message': 'Team member does not exist'
                 }, status=status.HTTP_400_BAD_REQUEST
             )
 
-        task_instance = self.get_object()
-        serialized_data = self.get_serializer(task_instance).data
-        member_list = serialized_data.get('team_members')
-
-        if team_member in task_instance.team_members.all():
-            task_instance.team_members.remove(team_member)
-
-            serialized_data = self.get_serializer(task_instance).data
-            member_list = serialized_data.get('team_members')
+        if task_instance.team_members.filter(id=profile_id).exists():
+            task_instance.team_members.remove(profile_id)
 
             return response.Response(
                 {
                     'message': 'Team member got successfully removed',
-                    'team_members': member_list
+                    'team_members': self.get_team_member_emails(
+                        task_instance
+                    )
                 }, status=status.HTTP_200_OK
             )
 
         return response.Response(
             {
                 'message': 'User is not part of the Tasks team',
-                'team_members': member_list
+                'team_members': self.get_team_member_emails(task_instance)
             }, status=status.HTTP_400_BAD_REQUEST
         )
@@ -42,6 +42,7 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'rest_framework.authtoken',
+    'django_crontab',
     'api',
 ]
 
@@ -90,6 +91,43 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Local memory by default (tests, development), a file based or
+# database cache for single-node deployments, e.g.
+# DJANGO_CACHE_BACKEND=django.core.cache.backends.filebased.FileBasedCache
+# DJANGO_CACHE_LOCATION=/var/tmp/task-management-cache
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'DJANGO_CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.environ.get(
+            'DJANGO_CACHE_LOCATION', 'task-management'
+        ),
+        'OPTIONS': {
+            'MAX_ENTRIES': 10000,
+        },
+    }
+}
+
+# Task list response cache (api.response_cache)
+
+# Seconds a cached task list is fresh
+TASK_LIST_CACHE_TIMEOUT = 60
+
+# Seconds an outdated task list is served while it gets rebuilt
+TASK_LIST_CACHE_STALE_TIMEOUT = 30
+
+# Reference data cache (api.reference_cache)
+
+# Seconds the version of the reference data is reused outside of
+# requests, within a request it is read once
+REFERENCE_CACHE_VERSION_TTL = 1
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -130,3 +168,60 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Django REST framework
+
+# orjson and msgpack are optional (requirements-optional.txt), their
+# renderers/parsers fall back to the stdlib JSON renderer or aren't
+# offered when missing
+REST_FRAMEWORK = {
+    'DEFAULT_RENDERER_CLASSES': [
+        'api.renderers.ORJSONRenderer',
+        'api.renderers.MessagePackRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'api.parsers.ORJSONParser',
+        'api.parsers.MessagePackParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS':
+        'api.negotiation.AvailableContentNegotiation',
+}
+
+# Token authentication (api.authentication.CachedTokenAuthentication)
+
+# Number of cached tokens per process
+TOKEN_CACHE_SIZE = 10000
+
+# Seconds a token stays cached
+TOKEN_CACHE_TTL = 300
+
+# Lifetime of a token (timedelta or seconds), None for no expiry
+TOKEN_EXPIRY = None
+
+# Scheduled jobs (django-crontab), installed with: manage.py crontab add
+
+CRONJOBS = [
+    # Overdue task sweeper (api.cron)
+    ('*/15 * * * *', 'api.cron.sweep_overdue_tasks'),
+    # Tombstones of the delta sync (api.cron)
+    ('30 3 * * *', 'api.cron.purge_tombstones'),
+]
+
+# Caption of the status of overdue tasks, created when missing
+OVERDUE_TASK_STATUS = 'Overdue'
+
+# Maximum number of tasks moved per UPDATE (transaction)
+OVERDUE_SWEEP_CHUNK_SIZE = 1000
+
+# Delta sync (api.sync)
+
+# Age (timedelta or seconds) after which tombstones are purged and sync
+# tokens expire
+SYNC_TOMBSTONE_RETENTION = 30 * 24 * 3600
+
+# Seconds a new sync token lies in the past, so changes committed late
+# are sent again instead of missed
+SYNC_CLOCK_MARGIN = 5